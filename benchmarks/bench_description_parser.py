@@ -0,0 +1,46 @@
+"""
+Micro-benchmark for DescriptionParser on a synthetic corpus.
+
+The corpus draws `--count` descriptions from `--distinct` unique ones, mimicking how listings repeat the
+same spec lines across products and runs. Reports throughput without the memo, with a cold memo and with
+a warm memo.
+
+    python -m benchmarks.bench_description_parser --count 1000000 --distinct 10000
+"""
+import argparse
+import random
+import time
+
+from benchmarks.synthetic import descriptions
+from scraper.description_parser import DescriptionParser, _parse_cached
+
+
+def _run(label: str, parse, corpus: list):
+    start = time.perf_counter()
+    for description, name in corpus:
+        parse(description, name)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {elapsed:8.2f} s {len(corpus) / elapsed:12.0f} descriptions/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    unique = descriptions(args.distinct, seed=args.seed)
+    rng = random.Random(args.seed)
+    corpus = [rng.choice(unique) for _ in range(args.count)]
+    print(f"{args.count} descriptions, {args.distinct} distinct")
+
+    _run("no memo", _parse_cached.__wrapped__, corpus)
+    DescriptionParser.cache_clear()
+    _run("cold memo", DescriptionParser.parse, corpus)
+    _run("warm memo", DescriptionParser.parse, corpus)
+    print(DescriptionParser.cache_info())
+
+
+if __name__ == "__main__":
+    main()
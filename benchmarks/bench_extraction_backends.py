@@ -0,0 +1,82 @@
+"""
+Compare the page_source + BeautifulSoup card extraction path with the in-browser script backend.
+
+Without --browser only the Python side is measured: parsing page_source with BeautifulSoup versus decoding
+the JSON rows the script backend returns. With --browser both backends run end-to-end against a local page.
+
+    python -m benchmarks.bench_extraction_backends --cards 5000
+    python -m benchmarks.bench_extraction_backends --cards 5000 --browser
+"""
+import argparse
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import card_rows, listing_html
+from scraper.product_list_extractor import ProductListExtractor
+from scraper.utils import load_config
+
+logging.disable(logging.WARNING)
+
+
+def _best(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _report(label: str, seconds: float, cards: int):
+    print(f"{label:<32} {seconds * 1000:10.1f} ms {cards / seconds:12.0f} cards/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default="config.yaml")
+    parser.add_argument("--cards", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--browser", action="store_true", help="Also run both backends in a real Chrome session")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    config["args"] = {"headless": True}
+    html = listing_html(args.cards)
+    payload = json.dumps(card_rows(args.cards), separators=(",", ":"))
+    extractor = ProductListExtractor(None, config, "laptops")
+
+    print(f"{args.cards} cards, page_source {len(html) / 1e6:.1f} MB, script payload {len(payload) / 1e6:.1f} MB")
+    _report("page_source + BeautifulSoup", _best(lambda: extractor._parse_products(html), args.repeat), args.cards)
+    _report("script rows", _best(lambda: extractor._parse_rows(json.loads(payload)), args.repeat), args.cards)
+
+    if not args.browser:
+        return
+
+    from scraper.utils import create_driver
+
+    driver = create_driver(config)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            page = Path(tmp) / "listing.html"
+            page.write_text(html, encoding="utf-8")
+            driver.get(page.as_uri())
+            extractor = ProductListExtractor(driver, config, "laptops")
+            _report(
+                "browser: page_source + bs4",
+                _best(lambda: extractor._parse_products(driver.page_source), args.repeat),
+                args.cards
+            )
+            _report(
+                "browser: execute_script",
+                _best(lambda: extractor._parse_rows(extractor._script_extractor().extract()), args.repeat),
+                args.cards
+            )
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
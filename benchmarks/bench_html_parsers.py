@@ -0,0 +1,48 @@
+"""
+Parse throughput of every installed `products.html_parser` backend on a synthetic listing page.
+
+Times tree building + card selection and CardParser field extraction separately, reusing one backend
+(and therefore one set of compiled selectors) per parser.
+
+    python -m benchmarks.bench_html_parsers --cards 50000
+"""
+import argparse
+import logging
+import time
+
+from benchmarks.synthetic import listing_html
+from scraper.html_backends import available_parsers
+from scraper.product_list_extractor import ProductListExtractor
+from scraper.utils import load_config
+
+logging.disable(logging.WARNING)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default="config.yaml")
+    parser.add_argument("--cards", type=int, default=50_000)
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    html = listing_html(args.cards)
+    print(f"{args.cards} cards, {len(html) / 1e6:.1f} MB")
+    print(f"{'parser':<12} {'parse+select':>14} {'fields':>10} {'cards/s':>10}")
+
+    for name in available_parsers():
+        config["products"]["html_parser"] = name
+        extractor = ProductListExtractor(None, config, "laptops")
+        card_parser = extractor._card_parser()
+
+        start = time.perf_counter()
+        cards = extractor._select_cards(html)
+        selected = time.perf_counter()
+        products = [p for card in cards if (p := card_parser.parse(card))]
+        parsed = time.perf_counter()
+
+        assert len(products) == args.cards, f"{name} parsed {len(products)} of {args.cards} cards"
+        print(f"{name:<12} {selected - start:13.2f}s {parsed - selected:9.2f}s {args.cards / (parsed - start):10.0f}")
+
+
+if __name__ == "__main__":
+    main()
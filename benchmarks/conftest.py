@@ -0,0 +1,184 @@
+"""
+Options and result bookkeeping for the pytest benchmark suite (`python -m pytest benchmarks`).
+
+Every measurement is written to `--bench-results` at the end of the session and compared against
+`--bench-baseline`; a stage whose median time per item is slower, or that uses more peak memory, than the
+baseline allows fails its test. Times are compared after scaling by a fixed calibration workload timed
+alongside every stage, so a busier or slower machine does not read as a regression.
+"""
+import gc
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from statistics import median
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+import pytest
+
+BENCH_DIR = Path(__file__).parent
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-sizes", default="1000,10000,100000", help="Comma separated synthetic listing sizes")
+    group.addoption("--bench-html-parser", default="lxml",
+                    help="products.html_parser of the parsing stages; the baseline is recorded with lxml because "
+                         "html.parser's tree builder is quadratic in the number of <img> tags (hours at 100k cards)")
+    group.addoption("--bench-repeat", type=int, default=5, help="Timed samples per stage; the median is kept")
+    group.addoption("--bench-min-time", type=float, default=0.2,
+                    help="Minimum seconds per timed sample; fast stages are run several times per sample")
+    group.addoption("--bench-baseline", default=str(BENCH_DIR / "baseline.json"))
+    group.addoption("--bench-results", default=str(BENCH_DIR / "results" / "latest.json"))
+    group.addoption("--bench-time-tolerance", type=float, default=0.5,
+                    help="Allowed slowdown over the baseline, as a fraction (0.5 = 50%%)")
+    group.addoption("--bench-memory-tolerance", type=float, default=0.2,
+                    help="Allowed peak memory growth over the baseline, as a fraction")
+    group.addoption("--bench-update-baseline", action="store_true", help="Store this run's results as the baseline")
+
+
+def pytest_generate_tests(metafunc):
+    if "size" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("--bench-sizes").split(",") if size.strip()]
+        # Session scope groups the tests by size, so only one size's inputs are held in memory at a time.
+        metafunc.parametrize("size", sizes, scope="session", ids=[f"{size // 1000}k" if size >= 1000 else str(size) for size in sizes])
+
+
+def _calibration_workload():
+    """Fixed pure-Python work (parsing, string building, dict and list churn) the hot paths are made of."""
+    rows = [{"name": f"Lenovo V{i}", "price": f"${i}.99", "specs": str(i) * 8} for i in range(2000)]
+    text = json.dumps(rows)
+    parsed = json.loads(text)
+    return sorted(parsed, key=lambda row: row["specs"])[-1]["price"].strip("$").split(".")
+
+
+class BenchRecorder:
+    """Measures stages, checks them against the baseline and collects the results of the session."""
+
+    def __init__(self, options):
+        self.options = options
+        self.results: Dict[str, dict] = {}
+        baseline_path = Path(options.getoption("--bench-baseline"))
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else {}
+        self.baseline = baseline.get("results", {})
+        # Numbers recorded with another HTML parser are not comparable.
+        if baseline.get("html_parser", options.getoption("--bench-html-parser")) != options.getoption("--bench-html-parser"):
+            self.baseline = {}
+
+    def _sampler(self, run: Callable[[], object]) -> Callable[[], float]:
+        """Return a function timing one sample of `run`, calling it often enough to last --bench-min-time."""
+        start = time.perf_counter()
+        run()  # warm-up, also sizes the samples
+        calls = max(1, math.ceil(self.options.getoption("--bench-min-time") / (time.perf_counter() - start)))
+
+        def sample() -> float:
+            # Like timeit, time with the cyclic GC off: a full collection over the session's inputs costs
+            # ~0.5s and lands in some samples but not others, which made the median flip between runs.
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                for _ in range(calls):
+                    run()
+                return (time.perf_counter() - start) / calls
+            finally:
+                gc.enable()
+        return sample
+
+    def _time(self, run: Callable[[], object]) -> Tuple[float, float]:
+        """
+        Median seconds per call of `run` and of the calibration workload over --bench-repeat samples each.
+        The samples alternate, so both medians see the same machine load.
+        """
+        stage, calibration = self._sampler(run), self._sampler(_calibration_workload)
+        timings, calibrations = [], []
+        for _ in range(max(1, self.options.getoption("--bench-repeat"))):
+            timings.append(stage())
+            calibrations.append(calibration())
+        return median(timings), median(calibrations)
+
+    def measure(self, stage: str, size: int, run: Callable[[], object]) -> dict:
+        """
+        Time `run` as the median of --bench-repeat samples, each calling it often enough to last at least
+        --bench-min-time with the garbage collector off, then run it once more under tracemalloc for its peak
+        memory.
+        Fails the calling test when the result regresses past the baseline tolerances.
+
+        Returns:
+            dict: median `seconds` and `per_item_us` per call and `peak_bytes` of the stage
+        """
+        seconds, calibration = self._time(run)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result = {
+            "seconds": round(seconds, 6), "per_item_us": round(seconds / size * 1e6, 3),
+            "calibration_us": round(calibration * 1e6, 3), "peak_bytes": peak,
+        }
+        key = f"{stage}[{size}]"
+        self.results[key] = result
+        self._check(key, result)
+        return result
+
+    def _check(self, key: str, result: dict):
+        expected = self.baseline.get(key)
+        if expected is None or self.options.getoption("--bench-update-baseline"):
+            return
+        # How much slower the machine ran the calibration workload next to this stage than next to the baseline.
+        speed_ratio = result["calibration_us"] / expected.get("calibration_us", result["calibration_us"])
+        time_limit = expected["per_item_us"] * speed_ratio * (1 + self.options.getoption("--bench-time-tolerance"))
+        memory_limit = expected["peak_bytes"] * (1 + self.options.getoption("--bench-memory-tolerance"))
+        failures = []
+        if result["per_item_us"] > time_limit:
+            failures.append(
+                f"{result['per_item_us']:.3f} us/item > {time_limit:.3f} "
+                f"(baseline {expected['per_item_us']:.3f}, machine speed ratio {speed_ratio:.2f})"
+            )
+        if result["peak_bytes"] > memory_limit:
+            failures.append(f"peak {result['peak_bytes']} B > {memory_limit:.0f} B (baseline {expected['peak_bytes']} B)")
+        if failures:
+            pytest.fail(f"{key} regressed: " + "; ".join(failures), pytrace=False)
+
+    def report(self) -> dict:
+        return {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "html_parser": self.options.getoption("--bench-html-parser"),
+            "results": dict(sorted(self.results.items())),
+        }
+
+
+@pytest.fixture(scope="session")
+def bench(request) -> BenchRecorder:
+    recorder = BenchRecorder(request.config)
+    request.config._bench_recorder = recorder
+    return recorder
+
+
+def pytest_sessionfinish(session):
+    recorder = getattr(session.config, "_bench_recorder", None)
+    if recorder is None or not recorder.results:
+        return
+    report = json.dumps(recorder.report(), indent=2)
+    results_path = Path(session.config.getoption("--bench-results"))
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    results_path.write_text(report, encoding="utf-8")
+    if session.config.getoption("--bench-update-baseline"):
+        baseline_path = Path(session.config.getoption("--bench-baseline"))
+        if baseline_path.exists():
+            # Keep entries of stages or sizes that were not part of this run.
+            merged = json.loads(baseline_path.read_text(encoding="utf-8")).get("results", {})
+            merged.update(recorder.results)
+            recorder.results = merged
+            report = json.dumps(recorder.report(), indent=2)
+        baseline_path.write_text(report, encoding="utf-8")
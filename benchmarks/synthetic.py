@@ -0,0 +1,74 @@
+"""Synthetic webscraper.io-like listings used by the benchmarks."""
+import random
+from typing import List
+
+BRANDS = ["Lenovo", "Asus", "Acer", "Dell", "HP", "Apple", "Toshiba", "MSI", "Prestigio", "Hewlett"]
+CPUS = ["Core i3-6006U", "Core i5-7200U", "Core i7-7500U", "Celeron N3350", "Pentium N4200", "AMD A6-9220",
+        "Ryzen 5 2500U", "Apple M1", "Atom x5-Z8350", "Snapdragon 835"]
+SCREENS = ["11.6\"", "13.3\"", "14\"", "15.6\"", "17.3\""]
+RAMS = ["2GB", "4GB", "8GB", "16GB", "32GB DDR4"]
+STORAGE = ["32GB eMMC", "128GB SSD", "256GB SSD", "500GB HDD", "1TB", "1TB + 128GB SSD"]
+OSES = ["Windows 10 Home", "Windows 10 Pro", "Win7 Pro 64bit", "FreeDOS", "Endless OS", "No OS", "macOS", "Linux",
+        "Android", "Windows 10 Home + Office"]
+
+
+def description(rng: random.Random, name: str) -> str:
+    """Return a comma separated spec line in the shape of the listing descriptions."""
+    return ", ".join([
+        name, rng.choice(SCREENS) + " HD", rng.choice(CPUS), rng.choice(RAMS), rng.choice(STORAGE), rng.choice(OSES),
+    ])
+
+
+def descriptions(count: int, seed: int = 0) -> List[tuple]:
+    """Return `count` (description, name) pairs drawn from a fixed spec vocabulary."""
+    rng = random.Random(seed)
+    pairs = []
+    for i in range(count):
+        name = f"{rng.choice(BRANDS)} Model {rng.randrange(500)}"
+        pairs.append((description(rng, name), name))
+    return pairs
+
+
+def card_row(index: int, rng: random.Random) -> list:
+    """Return the [name, price, rating, reviews, description, href] row for one synthetic card."""
+    name = f"{rng.choice(BRANDS)} Model {index}"
+    return [
+        name,
+        f"${rng.randrange(100, 3000)}.{rng.randrange(100):02d}",
+        rng.randrange(1, 6),
+        f"{rng.randrange(0, 15)} reviews",
+        description(rng, name),
+        f"/test-sites/e-commerce/more/product/{index}",
+    ]
+
+
+def card_html(row: list) -> str:
+    """Render a card row as a `.thumbnail` product card."""
+    name, price, rating, reviews, desc, href = row
+    stars = '<span class="ws-icon ws-icon-star"></span>' * rating
+    return (
+        '<div class="col-md-4 col-xl-4 col-lg-4"><div class="card thumbnail"><div class="product-wrapper card-body">'
+        '<img class="img-fluid card-img-top image img-responsive" alt="item" src="/images/test-sites/e-commerce/items/cart2.png">'
+        f'<div class="caption"><h4 class="price float-end card-title pull-right">{price}</h4>'
+        f'<h4><a href="{href}" class="title" title="{name}">{name}</a></h4>'
+        f'<p class="description card-text">{desc}</p></div>'
+        f'<div class="ratings"><p class="review-count float-end pull-right">{reviews}</p>'
+        f'<p data-rating="{rating}">{stars}</p></div></div></div></div>'
+    )
+
+
+def card_rows(count: int, seed: int = 0) -> List[list]:
+    """Return `count` synthetic card rows."""
+    rng = random.Random(seed)
+    return [card_row(i, rng) for i in range(count)]
+
+
+def listing_html(count: int, seed: int = 0) -> str:
+    """Return a full category page containing `count` product cards."""
+    cards = "".join(card_html(row) for row in card_rows(count, seed))
+    return (
+        "<!DOCTYPE html><html><head><title>Laptops</title></head><body><div class=\"container test-site\">"
+        f"<div class=\"row ecomerce-items ecomerce-items-more\">{cards}</div>"
+        "<a class=\"btn btn-lg btn-block btn-primary ecomerce-items-scroll-more\" style=\"display: none\">More</a>"
+        "</div></body></html>"
+    )
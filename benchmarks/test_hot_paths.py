@@ -0,0 +1,119 @@
+"""
+Hot-path benchmarks on synthetic listings of `--bench-sizes` cards, one test per stage and size:
+
+    python -m pytest benchmarks                           # 1k/10k/100k, compared against benchmarks/baseline.json
+    python -m pytest benchmarks --bench-sizes 1000,10000  # quick run
+    python -m pytest benchmarks --bench-update-baseline   # accept the current numbers
+"""
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+import yaml
+
+from benchmarks.synthetic import card_rows, listing_html
+from scraper.base_extractor import BaseExtractor
+from scraper.description_parser import DescriptionParser
+from scraper.product_converter import ProductConverter
+from scraper.product_list_extractor import ProductListExtractor
+
+pytestmark = pytest.mark.benchmark
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.yaml"
+
+
+@pytest.fixture(scope="session")
+def config(request) -> dict:
+    config = yaml.safe_load(CONFIG_PATH.read_text(encoding="utf-8"))
+    config["global"]["logging_level"] = "WARNING"
+    config["products"]["html_parser"] = request.config.getoption("--bench-html-parser")
+    return config
+
+
+@pytest.fixture(scope="session")
+def extractor(config) -> ProductListExtractor:
+    return ProductListExtractor(None, config, "laptops")
+
+
+@pytest.fixture(scope="session")
+def corpus(extractor):
+    """
+    Inputs of every stage for one size at a time: listing HTML, raw and structured products (built from the
+    synthetic rows, so no parse tree is kept) and (description, name) pairs.
+    """
+
+    @lru_cache(maxsize=1)
+    def build(size: int) -> dict:
+        rows = card_rows(size)
+        parser = extractor._card_parser()
+        return {
+            "html": listing_html(size),
+            "raw": [parser.parse_fields(row) for row in rows],
+            "structured": list(extractor._parse_fields(rows, parser, structured=True)),
+            "descriptions": [(row[4], row[0]) for row in rows],
+        }
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def cards(extractor, corpus):
+    """Card nodes of one size's listing; a 100k-card tree takes ~2 GB, so only the latest one is cached."""
+
+    @lru_cache(maxsize=1)
+    def select(size: int) -> list:
+        return extractor._select_cards(corpus(size)["html"])
+
+    return select
+
+
+def test_parse_products(bench, extractor, corpus, size):
+    html = corpus(size)["html"]
+    bench.measure("ProductListExtractor._parse_products", size, lambda: extractor._parse_products(html))
+
+
+def test_card_parser_parse(bench, extractor, cards, size):
+    nodes, parser = cards(size), extractor._card_parser()
+    bench.measure("CardParser.parse", size, lambda: [parser.parse(card) for card in nodes])
+
+
+def test_card_parser_to_structured(bench, extractor, cards, size):
+    nodes, parser = cards(size), extractor._card_parser()
+    bench.measure("CardParser.to_structured", size, lambda: [parser.to_structured(card) for card in nodes])
+
+
+def test_product_converter_to_structured(bench, config, corpus, size):
+    raw = corpus(size)["raw"]
+    converter = ProductConverter(config["products"]["currency_rates"], config["products"]["target_currency"])
+    bench.measure("ProductConverter.to_structured", size, lambda: [converter.to_structured(p) for p in raw])
+
+
+def test_card_parser_to_structured_batch(bench, extractor, corpus, size):
+    rows, parser = card_rows(size), extractor._card_parser()
+    bench.measure("CardParser.to_structured_batch", size, lambda: parser.to_structured_batch(rows))
+
+
+def test_product_converter_to_structured_batch(bench, config, corpus, size):
+    raw = corpus(size)["raw"]
+    converter = ProductConverter(config["products"]["currency_rates"], config["products"]["target_currency"])
+    bench.measure("ProductConverter.to_structured_batch", size, lambda: converter.to_structured_batch(raw))
+
+
+def test_description_parser_parse(bench, corpus, size):
+    pairs = corpus(size)["descriptions"]
+
+    def run():
+        DescriptionParser.cache_clear()
+        return [DescriptionParser.parse(description, name) for description, name in pairs]
+
+    bench.measure("DescriptionParser.parse", size, run)
+
+
+def test_write_to_json(bench, corpus, size, tmp_path):
+    products = corpus(size)["structured"]
+    bench.measure("write_to_json", size, lambda: BaseExtractor.write_to_json(products, tmp_path / "products.json"))
+
+
+def test_write_to_csv(bench, corpus, size, tmp_path):
+    products = corpus(size)["structured"]
+    bench.measure("write_to_csv", size, lambda: BaseExtractor.write_to_csv(products, tmp_path / "products.csv"))
@@ -0,0 +1,113 @@
+import math
+from collections import deque
+from typing import Any, Dict, Optional
+
+# WebDriverWait's own poll interval, used whenever learning is disabled.
+DEFAULT_POLL_INTERVAL = 0.5
+# Poll interval of an enabled wait before its first observation, fine enough not to inflate the first samples.
+INITIAL_POLL_INTERVAL = 0.1
+MIN_POLL_INTERVAL = 0.02
+
+
+class AdaptiveWait:
+    """
+    Timeout and poll interval of one kind of wait (the 'Load More' button appearing, new cards rendering),
+    learned from the durations of recent successful waits. The timeout is `multiplier` times a rolling
+    `percentile` of those durations and the condition is polled a few times per typical wait, so a site
+    answering in 200 ms is no longer polled every half second nor waited on for the full configured time,
+    while a slow site gets up to `max_wait_time`. Consecutive timeouts back off exponentially by `idle_backoff`.
+
+    Durations are always recorded for `stats()`; with `enabled` false the configured timeout and the
+    WebDriverWait default poll interval are used unchanged.
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        enabled: bool = False,
+        percentile: float = 0.95,
+        multiplier: float = 3.0,
+        min_samples: int = 5,
+        window: int = 50,
+        min_wait_time: float = 0.5,
+        max_wait_time: Optional[float] = None,
+        idle_backoff: float = 2.0
+    ):
+        """
+        Args:
+            initial (float): configured timeout in seconds, used until `min_samples` waits were observed.
+            enabled (bool): apply the learned timeout, poll interval and idle backoff.
+            percentile (float): percentile (0-1] of recent waits the timeout is based on.
+            multiplier (float): headroom factor applied to that percentile.
+            min_samples (int): successful waits needed before the learned timeout replaces `initial`.
+            window (int): number of most recent waits kept.
+            min_wait_time (float): lower bound of the learned timeout.
+            max_wait_time (float): upper bound of the learned and backed-off timeout; defaults to 4 x `initial`.
+            idle_backoff (float): factor applied to the timeout for every consecutive timed-out wait.
+        """
+        self.initial = initial
+        self.enabled = enabled
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.min_samples = min_samples
+        self.min_wait_time = min_wait_time
+        self.max_wait_time = max_wait_time if max_wait_time is not None else 4 * initial
+        self.idle_backoff = idle_backoff
+        self.samples = deque(maxlen=window)
+        self.idle_streak = 0
+        self.timeouts = 0
+
+    @classmethod
+    def from_config(cls, initial: float, config: Dict[str, Any]) -> "AdaptiveWait":
+        """Build from the `products.adaptive_waits` section."""
+        return cls(initial, **config)
+
+    def observe(self, seconds: float):
+        """Record the duration of a wait whose condition was met."""
+        self.samples.append(seconds)
+        self.idle_streak = 0
+
+    def timed_out(self):
+        """Record a wait that hit its timeout; the next one waits `idle_backoff` times longer."""
+        self.timeouts += 1
+        self.idle_streak += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Nearest-rank `q` quantile of the recorded waits, or None before the first one."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+    @property
+    def timeout(self) -> float:
+        """Seconds the next wait may take, including the backoff for preceding timeouts."""
+        if not self.enabled:
+            return self.initial
+        if len(self.samples) < self.min_samples:
+            base = self.initial
+        else:
+            base = min(max(self.multiplier * self.quantile(self.percentile), self.min_wait_time), self.max_wait_time)
+        return min(base * self.idle_backoff ** self.idle_streak, max(self.max_wait_time, base))
+
+    @property
+    def poll_interval(self) -> float:
+        """Seconds between condition checks: about a fifth of the median wait, at most WebDriverWait's default."""
+        if not self.enabled:
+            return DEFAULT_POLL_INTERVAL
+        median = self.quantile(0.5)
+        if median is None:
+            return INITIAL_POLL_INTERVAL
+        return min(max(median / 5, MIN_POLL_INTERVAL), DEFAULT_POLL_INTERVAL)
+
+    def stats(self) -> Dict[str, Any]:
+        """Observed and learned values for the run summary."""
+        p50, p95 = self.quantile(0.5), self.quantile(0.95)
+        return {
+            "samples": len(self.samples),
+            "timeouts": self.timeouts,
+            "p50": round(p50, 3) if p50 is not None else None,
+            "p95": round(p95, 3) if p95 is not None else None,
+            "timeout": round(self.timeout, 3),
+            "poll_interval": round(self.poll_interval, 3),
+        }
@@ -1,26 +1,44 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Optional, List, Union
-from selenium.webdriver.remote.webdriver import WebDriver
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
 from pydantic import BaseModel
-import json
-import csv
 import logging
 
+from scraper.columnar_writer import ColumnarWriter
+from scraper.tracing import Span
+from scraper.writers import CsvWriter, JsonArrayWriter, JsonLinesWriter
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+    from scraper.governor import RateGovernor
+    from scraper.http_fetcher import HttpFetcher
+
 
 class BaseExtractor(ABC):
     """Abstract base class for all extractors, providing core utilities for scraping and exporting data."""
 
-    def __init__(self, driver: WebDriver, config: dict[str, Any], category_key: str):
+    def __init__(
+        self,
+        driver: Optional["WebDriver"],
+        config: dict[str, Any],
+        category_key: str,
+        fetcher: Optional["HttpFetcher"] = None,
+        trace: Optional[Span] = None
+    ):
         """
         Initialize the extractor.
 
         Args:
-            driver (WebDriver): Selenium WebDriver instance.
+            driver (WebDriver): Selenium WebDriver instance, or None when fetching over HTTP only.
             config (dict): Configuration dictionary.
             category_key (str): Category name used to resolve selectors.
+            fetcher (HttpFetcher): Shared HTTP fetcher; created from config on first use when omitted.
+            trace (Span): span that receives the timing spans of this extractor's phases.
         """
         self.driver = driver
+        self._fetcher = fetcher
+        self.trace = trace if trace is not None else Span(self.__class__.__name__)
         self.config = config
         self.category_key = category_key
         self.products_config = config.get("products", {})
@@ -36,34 +54,41 @@ class BaseExtractor(ABC):
         """Main extraction method to be implemented by subclasses."""
         pass
 
+    @property
+    def fetcher(self) -> "HttpFetcher":
+        """Return the HTTP fetcher, creating one from the `http:` config section if none was given."""
+        if self._fetcher is None:
+            from scraper.http_fetcher import HttpFetcher
+            self._fetcher = HttpFetcher.from_config(self.config)
+        return self._fetcher
+
+    @property
+    def governor(self) -> Optional["RateGovernor"]:
+        """Return the fetcher's shared RateGovernor when `governor.enabled`, so browser requests are paced too."""
+        if not self.config.get("governor", {}).get("enabled", False):
+            return None
+        return self.fetcher.governor
+
     def get_selector(self, key: str) -> Optional[str]:
         """Return the configured CSS selector for a given key."""
         return self.selectors.get(key)
 
     @staticmethod
-    def write_to_json(models: List[BaseModel], filepath: Union[str, Path]):
-        """Write a list of Pydantic models to a JSON file."""
-        if not models:
-            return
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as file:
-            json.dump(
-                [model.model_dump(mode="json") for model in models],
-                file,
-                indent=2,
-                ensure_ascii=False
-            )
+    def write_to_json(models: Iterable[BaseModel], filepath: Union[str, Path], compression: Optional[str] = None) -> int:
+        """Stream Pydantic models into an indented JSON array file and return how many were written."""
+        return JsonArrayWriter(filepath, compression).write_all(models)
+
+    @staticmethod
+    def write_to_jsonl(models: Iterable[BaseModel], filepath: Union[str, Path], compression: Optional[str] = None) -> int:
+        """Stream Pydantic models into a JSON Lines file and return how many were written."""
+        return JsonLinesWriter(filepath, compression).write_all(models)
+
+    @staticmethod
+    def write_to_csv(models: Iterable[BaseModel], filepath: Union[str, Path], compression: Optional[str] = None) -> int:
+        """Stream Pydantic models into a CSV file and return how many were written."""
+        return CsvWriter(filepath, compression).write_all(models)
 
     @staticmethod
-    def write_to_csv(models: List[BaseModel], filepath: Union[str, Path]):
-        """Write a list of Pydantic models to a CSV file."""
-        if not models:
-            return
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", newline="", encoding="utf-8") as file:
-            writer = csv.DictWriter(file, fieldnames=models[0].model_dump(mode="json").keys())
-            writer.writeheader()
-            for model in models:
-                writer.writerow(model.model_dump(mode="json"))
+    def write_to_parquet(models: Iterable[BaseModel], filepath: Union[str, Path], compression: Optional[str] = None) -> int:
+        """Write Pydantic models into a Parquet file in typed row groups and return how many were written."""
+        return ColumnarWriter(filepath, "parquet", compression).write_all(models)
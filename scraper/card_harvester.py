@@ -0,0 +1,81 @@
+from typing import Callable, List, Optional
+
+from scraper.enums import DomPruning
+
+# Defines prune(cards, mode): removes harvested cards from the live DOM (or swaps in empty placeholders of the
+# same height, so the scroll position and layout stay put) and adds their number to window.__scraperPruned,
+# which ClickExecutor.get_count adds back so the "card count increased" check keeps seeing every loaded card.
+PRUNE_FUNCTION = """
+function prune(cards, mode) {
+    if (mode === "placeholder") {
+        var heights = cards.map(function (card) { return card.offsetHeight; });
+        cards.forEach(function (card, i) {
+            var placeholder = document.createElement("scraper-pruned");
+            placeholder.style.display = "block";
+            placeholder.style.height = heights[i] + "px";
+            card.replaceWith(placeholder);
+        });
+    } else if (mode === "remove") {
+        cards.forEach(function (card) { card.remove(); });
+    } else {
+        return;
+    }
+    window.__scraperPruned = (window.__scraperPruned || 0) + cards.length;
+}
+"""
+
+
+class CardHarvester:
+    """
+    Pulls the outer HTML of product cards that were appended to the live DOM since the last harvest,
+    so cards can be parsed while pagination is still running instead of from one final page_source dump.
+    With `pruning` enabled every harvest also drops the harvested cards from the DOM, which keeps
+    browser memory and selector costs flat on very long listings.
+    """
+
+    _SLICE_SCRIPT = PRUNE_FUNCTION + (
+        "var cards = Array.prototype.slice.call(document.querySelectorAll(arguments[0]));"
+        "var html = cards.slice(arguments[1]).map(function (card) { return card.outerHTML; });"
+        "prune(cards, arguments[2]);"
+        "return html;"
+    )
+
+    def __init__(
+        self,
+        driver,
+        logger,
+        get_selector: Callable[[str], Optional[str]],
+        item_selector: str = "product_card",
+        pruning: DomPruning = DomPruning.OFF
+    ):
+        """Initialize CardHarvester with WebDriver, logger, selector resolver, the card selector key and pruning mode."""
+        self.driver = driver
+        self.logger = logger
+        self.get_selector = get_selector
+        self.item_selector = item_selector
+        self.pruning = pruning
+        self.harvested = 0
+        self.pruned = 0
+
+    @property
+    def start(self) -> int:
+        """Index of the first unharvested card among the cards still in the DOM."""
+        return self.harvested - self.pruned
+
+    def harvest(self) -> List[str]:
+        """Return the outer HTML of every card not harvested yet, in DOM order."""
+        selector = self.get_selector(self.item_selector)
+        if not selector:
+            self.logger.error(f"Missing selector for '{self.item_selector}'", extra={"event": "missing_selector"})
+            return []
+
+        start = self.start
+        fragments = self.driver.execute_script(self._SLICE_SCRIPT, selector, start, self.pruning.value) or []
+        self.harvested += len(fragments)
+        if self.pruning != DomPruning.OFF:
+            self.pruned += start + len(fragments)
+        self.logger.debug(
+            f"Harvested {len(fragments)} new cards ({self.harvested} total, {self.pruned} pruned).",
+            extra={"event": "cards_harvested", "count": len(fragments), "total": self.harvested}
+        )
+        return fragments
@@ -1,8 +1,11 @@
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Sequence
 
-from scraper.models import RawProduct, StructuredProduct
+from pydantic import ValidationError
+
+from scraper.html_backends import SoupBackend
+from scraper.models import RAW_PRODUCT_LIST, RawProduct, StructuredProduct
 from scraper.product_converter import ProductConverter
 from scraper.utils import clean_review_count
 
@@ -12,7 +15,7 @@ class CardParser:
     Parses individual product cards from the HTML into structured RawProduct objects.
     """
 
-    def __init__(self, get_selector, config, logger, currency_rates=None, target_currency="USD"):
+    def __init__(self, get_selector, config, logger, currency_rates=None, target_currency="USD", backend=None):
         """
         Initialize the CardParser.
 
@@ -20,10 +23,12 @@ class CardParser:
             get_selector: Callable that returns a CSS selector by key.
             config: Configuration dictionary.
             logger: Logger instance for structured logging.
+            backend: HTML backend from `create_html_backend` that produced the cards; defaults to html.parser.
         """
         self.get_selector = get_selector
         self.config = config
         self.logger = logger
+        self.backend = backend or SoupBackend()
         self.converter = ProductConverter(currency_rates or {"USD": 1.0}, target_currency)
 
     def parse(self, card) -> Optional[RawProduct]:
@@ -31,68 +36,151 @@ class CardParser:
         Parse a single product card into a RawProduct object.
 
         Args:
-            card: BeautifulSoup Tag object representing a product card.
+            card: Card node from the HTML backend (BeautifulSoup Tag or selectolax Node).
 
         Returns:
             RawProduct if parsing succeeds, otherwise None.
         """
+        fields = self.card_fields(card)
+        return self.parse_fields(fields) if fields else None
+
+    def card_fields(self, card) -> Optional[tuple]:
+        """
+        Extract the raw values of a single product card.
+
+        Args:
+            card: Card node from the HTML backend (BeautifulSoup Tag or selectolax Node).
+
+        Returns:
+            (name, price, rating, reviews, description, href), or None if the card could not be read.
+        """
         try:
             name = self._text(card, "name")
             price = self._text(card, "price")
-            rating = float(len(card.select(self.get_selector("rating"))))
+            rating = float(self.backend.count(card, self.get_selector("rating")))
             reviews = self._text(card, "reviews")
             description = self._text(card, "description") or ""
             href = self._attr(card, "product_link", "href")
+        except Exception as e:
+            self._log_failure("Exception during parsing", card,  error=str(e))
+            return None
+        return name, price, rating, reviews, description, href
+
+    def parse_fields(self, fields: Sequence) -> Optional[RawProduct]:
+        """
+        Build a RawProduct from already extracted card values.
+
+        Args:
+            fields: (name, price, rating, reviews, description, href), e.g. a row from ScriptCardExtractor.
+
+        Returns:
+            RawProduct if parsing succeeds, otherwise None.
+        """
+        products = self.parse_batch([fields])
+        return products[0] if products else None
+
+    def parse_batch(self, rows: Sequence[Sequence]) -> List[RawProduct]:
+        """
+        Build RawProduct objects from many extracted cards with a single TypeAdapter validation pass
+        and one `last_scraped` timestamp for the whole batch.
+
+        Args:
+            rows: (name, price, rating, reviews, description, href) per card.
 
+        Returns:
+            List[RawProduct]: the cards that parsed, in input order; failures are logged and skipped.
+        """
+        scraped_at = datetime.utcnow()
+        base_url = self.config["base_url"]
+        origin = "{0.scheme}://{0.netloc}".format(urlsplit(base_url))
+        kept, records = [], []
+        for fields in rows:
+            record = self._record(fields, base_url, origin, scraped_at)
+            if record is not None:
+                kept.append(fields)
+                records.append(record)
+        if not records:
+            return []
+        try:
+            return RAW_PRODUCT_LIST.validate_python(records)
+        except ValidationError as e:
+            failed = {}
+            for error in e.errors():
+                failed.setdefault(error["loc"][0], error["msg"])
+            for index, message in failed.items():
+                name, price, _, _, _, href = kept[index]
+                self._log_failure("Exception during parsing", None, name, price, href, error=message)
+            # Items are validated independently, so the remaining records cannot fail again.
+            return RAW_PRODUCT_LIST.validate_python([r for i, r in enumerate(records) if i not in failed])
+
+    def to_structured(self, card) -> Optional[StructuredProduct]:
+        raw = self.parse(card)
+        return self.converter.to_structured(raw) if raw else None
+
+    def fields_to_structured(self, fields: Sequence) -> Optional[StructuredProduct]:
+        raw = self.parse_fields(fields)
+        return self.converter.to_structured(raw) if raw else None
+
+    def to_structured_batch(self, rows: Sequence[Sequence]) -> List[StructuredProduct]:
+        """Parse and convert many extracted cards, see `parse_batch` and `ProductConverter.to_structured_batch`."""
+        return self.converter.to_structured_batch(self.parse_batch(rows))
+
+    def _record(self, fields: Sequence, base_url: str, origin: str, scraped_at: datetime) -> Optional[dict]:
+        """Checks the critical fields of one card and returns its RawProduct input dict, or None."""
+        name, price, rating, reviews, description, href = fields
+        try:
             # Check for critical missing fields
             if not name:
-                self._log_failure("Missing product name", card, name, price, href)
+                self._log_failure("Missing product name", None, name, price, href)
                 return None
             if not price:
-                self._log_failure("Missing product price", card, name, price, href)
+                self._log_failure("Missing product price", None, name, price, href)
                 return None
             if not href:
-                self._log_failure("Missing product URL", card, name, price, href)
+                self._log_failure("Missing product URL", None, name, price, href)
                 return None
 
-            return RawProduct(
-                name=name,
-                price_usd=price,
-                rating=rating,
-                num_reviews=clean_review_count(reviews),
-                description_raw=description,
-                url=urljoin(self.config["base_url"], href),
-                last_scraped=datetime.utcnow()
-            )
+            return {
+                "name": name,
+                "price_usd": price,
+                "rating": float(rating),
+                "num_reviews": clean_review_count(reviews),
+                "description_raw": description or "",
+                "url": self._absolute_url(href, base_url, origin),
+                "last_scraped": scraped_at,
+            }
         except Exception as e:
-            self._log_failure("Exception during parsing", card,  error=str(e))
+            self._log_failure("Exception during parsing", None, name, price, href, error=str(e))
             return None
 
-    def to_structured(self, card) -> Optional[StructuredProduct]:
-        raw = self.parse(card)
-        return self.converter.to_structured(raw) if raw else None
+    @staticmethod
+    def _absolute_url(href: str, base_url: str, origin: str) -> str:
+        """Resolves `href` against `base_url`; root-relative links skip urljoin, which is most of a card's cost."""
+        if href.startswith("/") and not href.startswith("//") and "/." not in href:
+            return origin + href
+        return urljoin(base_url, href)
 
     def _text(self, card, key) -> Optional[str]:
         selector = self.get_selector(key)
-        tag = card.select_one(selector)
-        if not tag:
+        tag = self.backend.select_one(card, selector)
+        if tag is None:
             self.logger.warning(
                 f"Selector '{key}' not found in card.",
                 extra={"selector": selector, "key": key}
             )
             return None
-        return tag.get_text(strip=True)
+        return self.backend.text(tag)
 
     def _attr(self, card, key, attr) -> Optional[str]:
         selector = self.get_selector(key)
-        tag = card.select_one(selector)
-        if not tag:
+        tag = self.backend.select_one(card, selector)
+        if tag is None:
             self.logger.warning(
                 f"Selector '{key}' not found in card for attribute '{attr}'.",
                 extra={"selector": selector, "key": key, "attr": attr}
             )
             return None
-        return tag.get(attr)
+        return self.backend.attr(tag, attr)
 
     def _log_failure(self, reason, card, name=None, price=None, href=None, error=None):
         self.logger.warning(
@@ -105,7 +193,3 @@ class CardParser:
                 "error": error,
             }
         )
-
-    def to_structured(self, card) -> Optional[StructuredProduct]:
-        raw = self.parse(card)
-        return self.converter.to_structured(raw) if raw else None
@@ -0,0 +1,104 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+from scraper.models import RAW_PRODUCT_LIST, STRUCTURED_PRODUCT_LIST, RawProduct, StructuredProduct
+
+logger = logging.getLogger(__name__)
+
+
+class PaginationCheckpoint:
+    """
+    On-disk progress of one category's pagination: an append-only JSON Lines journal of the products
+    emitted so far and a small state file (click count, cards harvested, next 'Load More' page, journal
+    length) that is replaced atomically after every journal append. A run that crashes (Chrome, a failed
+    click, the process itself) resumes from the last state instead of the category page; the journal is
+    emitted again first, so the resumed output neither misses nor repeats products.
+    """
+
+    def __init__(self, directory: Union[str, Path], category: str, fingerprint: Dict[str, Any]):
+        """
+        Args:
+            directory: checkpoint directory (`checkpoint.dir`), created on first use.
+            category (str): category the checkpoint belongs to; names its files.
+            fingerprint (dict): run settings that must match for a checkpoint to be resumed (url, structured, ...).
+        """
+        self.directory = Path(directory)
+        self.state_path = self.directory / f"{category}.state.json"
+        self.journal_path = self.directory / f"{category}.jsonl"
+        self.fingerprint = fingerprint
+        self.state: Dict[str, Any] = {}
+        self._journal = None
+
+    def resume(self) -> Tuple[Dict[str, Any], List[Union[RawProduct, StructuredProduct]]]:
+        """
+        Load the last checkpoint, dropping journal lines written after it (a torn last append).
+
+        Returns:
+            (state, products): the saved progress and the products already emitted; ({}, []) without a
+            usable checkpoint, in which case any stale files are removed.
+        """
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self.clear()
+            return {}, []
+        except ValueError as e:
+            logger.warning(f"Unreadable checkpoint {self.state_path}, starting over: {e}")
+            self.clear()
+            return {}, []
+        if state.get("fingerprint") != self.fingerprint:
+            logger.warning(f"Checkpoint {self.state_path} was written with different settings, starting over.")
+            self.clear()
+            return {}, []
+
+        lines = []
+        if self.journal_path.exists():
+            with open(self.journal_path, "rb") as f:
+                lines = [f.readline() for _ in range(state["products"])]
+                valid_bytes = f.tell()
+            os.truncate(self.journal_path, valid_bytes)
+        if sum(line.endswith(b"\n") for line in lines) != state["products"]:
+            logger.warning(f"Checkpoint journal {self.journal_path} is shorter than its state, starting over.")
+            self.clear()
+            return {}, []
+        adapter = STRUCTURED_PRODUCT_LIST if self.fingerprint.get("structured") else RAW_PRODUCT_LIST
+        products = adapter.validate_python([json.loads(line) for line in lines])
+        self.state = state
+        logger.info(
+            f"Resuming from checkpoint: {state.get('clicks', 0)} clicks, {state.get('harvested', 0)} cards harvested, "
+            f"{len(products)} products already emitted.",
+            extra={"event": "checkpoint_resumed", "clicks": state.get("clicks", 0), "products": len(products)}
+        )
+        return state, products
+
+    def record(self, products: Sequence[Union[RawProduct, StructuredProduct]], **progress):
+        """Append the products emitted since the last call, then atomically save the progress that led to them."""
+        if self._journal is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+        for product in products:
+            self._journal.write(product.model_dump_json())
+            self._journal.write("\n")
+        self._journal.flush()
+        self.state.update(progress)
+        self.state["products"] = self.state.get("products", 0) + len(products)
+        self.state["fingerprint"] = self.fingerprint
+        tmp = self.state_path.with_name(f".{self.state_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.state), encoding="utf-8")
+        os.replace(tmp, self.state_path)
+
+    def clear(self):
+        """Delete the checkpoint, e.g. once the category finished."""
+        self.close()
+        for path in (self.state_path, self.journal_path):
+            if path.exists():
+                path.unlink()
+        self.state = {}
+
+    def close(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
@@ -1,11 +1,18 @@
 import time
-from typing import Optional, Callable
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 
+from scraper.adaptive_wait import AdaptiveWait
 from scraper.enums import ClickStatus
+from scraper.governor import RateGovernor
+
+# Cards still in the DOM plus the ones CardHarvester pruned, counted in the page: find_elements would send a
+# reference to every matching element over the wire on each poll, so its cost grew with the listing length.
+_COUNT_SCRIPT = "return document.querySelectorAll(arguments[0]).length + (window.__scraperPruned || 0);"
 
 
 class ClickExecutor:
@@ -15,21 +22,38 @@ class ClickExecutor:
         logger,
         get_selector: Callable[[str], Optional[str]],
         button_wait_time: int = 10,
-        content_wait_time: int = 10
+        content_wait_time: int = 10,
+        adaptive_waits: Optional[Dict[str, Any]] = None,
+        governor: Optional[RateGovernor] = None,
+        page_url: str = ""
     ):
-        """Initialize ClickExecutor with WebDriver, logger, selector resolver, and timeouts."""
+        """
+        Initialize ClickExecutor with WebDriver, logger, selector resolver, and timeouts.
+        `adaptive_waits` (the `products.adaptive_waits` section) lets both timeouts and their poll
+        intervals be learned from the observed waits; see AdaptiveWait. With a `governor`, every click
+        and its wait hold a request slot of `page_url`'s host.
+        """
         self.driver = driver
         self.logger = logger
         self.get_selector = get_selector
         self.button_wait_time = button_wait_time
         self.content_wait_time = content_wait_time
+        self.button_wait = AdaptiveWait.from_config(button_wait_time, adaptive_waits or {})
+        self.content_wait = AdaptiveWait.from_config(content_wait_time, adaptive_waits or {})
+        self.governor = governor
+        self.page_url = page_url
+        self.last_wait = 0.0
 
     def try_click_and_wait(
         self,
         button_name: str,
         wait_condition: Callable[[], bool]
     ) -> ClickStatus:
-        """Click a button and wait for the given condition to become True. Returns ClickStatus."""
+        """
+        Click a button and wait for the given condition to become True. Returns ClickStatus.
+        The seconds spent waiting for the condition are kept in `last_wait`.
+        """
+        self.last_wait = 0.0
         try:
             button = self._find_button(button_name)
             if not button or not self._is_button_visible(button):
@@ -39,11 +63,21 @@ class ClickExecutor:
                 )
                 return ClickStatus.BUTTON_HIDDEN
 
-            self._click(button)
-            start = time.time()
-
-            WebDriverWait(self.driver, self.content_wait_time).until(lambda d: wait_condition())
-            duration = round(time.time() - start, 2)
+            with self.governor.slot(self.page_url) if self.governor is not None else nullcontext() as permit:
+                if permit is not None:
+                    # A click plus its render wait takes seconds; kept out of the host's HTTP latency baseline,
+                    # it is learned by `content_wait` instead.
+                    permit.timed = False
+                self._click(button)
+                start = time.time()
+                try:
+                    WebDriverWait(
+                        self.driver, self.content_wait.timeout, poll_frequency=self.content_wait.poll_interval
+                    ).until(lambda d: wait_condition())
+                finally:
+                    self.last_wait = time.time() - start
+            self.content_wait.observe(self.last_wait)
+            duration = round(self.last_wait, 2)
 
             self.logger.debug(
                 f"Click on '{button_name}' succeeded and condition met.",
@@ -57,6 +91,7 @@ class ClickExecutor:
             return ClickStatus.SUCCESS
 
         except TimeoutException:
+            self.content_wait.timed_out()
             self.logger.info(
                 f"Click on '{button_name}' timed out waiting for condition.",
                 extra={"event": "no_state_change", "button": button_name, "status": ClickStatus.NO_NEW_ITEMS.value}
@@ -76,21 +111,28 @@ class ClickExecutor:
             return ClickStatus.FAILURE
 
     def get_count(self, selector_name: str) -> Optional[int]:
-        """Return number of elements matching the given selector name, or None on failure."""
+        """
+        Return the number of elements matching the given selector name, including those pruned from the DOM
+        after harvesting, or None on failure.
+        """
         selector = self.get_selector(selector_name)
         if not selector:
             self.logger.error(f"Missing selector for '{selector_name}'", extra={"event": "missing_selector"})
             return None
 
         try:
-            return len(self.driver.find_elements(By.CSS_SELECTOR, selector))
-        except (TimeoutException, NoSuchElementException) as e:
+            return int(self.driver.execute_script(_COUNT_SCRIPT, selector))
+        except (TimeoutException, NoSuchElementException, WebDriverException) as e:
             self.logger.warning(
                 f"Failed to count elements for '{selector_name}': {e}",
                 extra={"event": "count_failed", "selector": selector_name, "error": str(e)}
             )
             return None
 
+    def wait_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Observed durations and current timeout / poll interval of the button and content waits."""
+        return {"button": self.button_wait.stats(), "content": self.content_wait.stats()}
+
     def is_button_present_and_visible(self, name: str) -> bool:
         """Check if the button is present in the DOM and is visible."""
         selector = self.get_selector(name)
@@ -109,11 +151,15 @@ class ClickExecutor:
             self.logger.error(f"No selector found for '{name}'.", extra={"event": "missing_selector", "button": name})
             return None
 
+        start = time.time()
         try:
-            return WebDriverWait(self.driver, self.button_wait_time).until(
-                EC.presence_of_element_located((By.CLASS_NAME, selector))
-            )
+            button = WebDriverWait(
+                self.driver, self.button_wait.timeout, poll_frequency=self.button_wait.poll_interval
+            ).until(EC.presence_of_element_located((By.CLASS_NAME, selector)))
+            self.button_wait.observe(time.time() - start)
+            return button
         except TimeoutException:
+            self.button_wait.timed_out()
             self.logger.warning(
                 f"Button '{name}' not found in time.",
                 extra={"event": "button_timeout", "button": name}
@@ -0,0 +1,133 @@
+import importlib.util
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+from pydantic import BaseModel
+
+from scraper.models import StructuredProduct
+
+# Formats handled by ColumnarWriter; compression is applied inside the file, not as a file suffix.
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+
+def _require_pyarrow():
+    if importlib.util.find_spec("pyarrow") is None:
+        raise RuntimeError("Parquet/Arrow output requires the 'pyarrow' package (pip install pyarrow)")
+    import pyarrow
+    return pyarrow
+
+
+def product_schema(model_class: type):
+    """
+    Arrow schema for product models: typed numeric columns, UTC timestamps and dictionary-encoded
+    low-cardinality strings (brand, cpu, os, currency).
+    """
+    pa = _require_pyarrow()
+    category = pa.dictionary(pa.int32(), pa.string())
+    if model_class is StructuredProduct:
+        return pa.schema([
+            ("name", pa.string()),
+            ("price", pa.float64()),
+            ("currency", category),
+            ("rating", pa.float64()),
+            ("num_reviews", pa.int32()),
+            ("description", pa.string()),
+            ("url", pa.string()),
+            ("last_scraped", pa.timestamp("us", tz="UTC")),
+            ("brand", category),
+            ("screen_inches", pa.float32()),
+            ("ram_gb", pa.int32()),
+            ("storage_gb", pa.int32()),
+            ("cpu", category),
+            ("os", category),
+            ("specs", pa.map_(pa.string(), pa.string())),
+        ])
+    return pa.schema([
+        ("name", pa.string()),
+        ("price_usd", pa.float64()),
+        ("rating", pa.float64()),
+        ("num_reviews", pa.int32()),
+        ("description_raw", pa.string()),
+        ("url", pa.string()),
+        ("last_scraped", pa.timestamp("us", tz="UTC")),
+    ])
+
+
+class ColumnarWriter:
+    """
+    Batches product models into typed columns and writes them as Parquet row groups or Arrow IPC
+    record batches of `row_group_size` rows, so memory is bounded by one batch.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        output_format: str = "parquet",
+        compression: Optional[str] = None,
+        row_group_size: int = 50_000
+    ):
+        """
+        Args:
+            path: output file path.
+            output_format (str): "parquet" or "arrow" (Arrow IPC file).
+            compression (str): gzip/zstd codec inside the file; Parquet defaults to snappy, Arrow IPC only supports zstd.
+            row_group_size (int): rows buffered per row group / record batch.
+        """
+        self.path = Path(path)
+        self.output_format = output_format
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.count = 0
+        self._rows: List[dict] = []
+        self._schema = None
+        self._writer = None
+
+    def write(self, model: BaseModel):
+        if self._schema is None:
+            self._schema = product_schema(type(model))
+        self._rows.append(model.model_dump())
+        if len(self._rows) >= self.row_group_size:
+            self._flush()
+
+    def write_all(self, models: Iterable[BaseModel]) -> int:
+        """Write every model of the iterable, close the file and return the number of rows written."""
+        try:
+            for model in models:
+                self.write(model)
+        finally:
+            self.close()
+        return self.count
+
+    def close(self):
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _flush(self):
+        if not self._rows:
+            return
+        pa = _require_pyarrow()
+        columns = {field.name: [row.get(field.name) for row in self._rows] for field in self._schema}
+        if "specs" in columns:
+            columns["specs"] = [list(specs.items()) if specs else None for specs in columns["specs"]]
+        batch = pa.RecordBatch.from_pydict(columns, schema=self._schema)
+        if self._writer is None:
+            self._writer = self._open()
+        if self.output_format == "parquet":
+            self._writer.write_batch(batch, row_group_size=self.row_group_size)
+        else:
+            self._writer.write_batch(batch)
+        self.count += len(self._rows)
+        self._rows = []
+
+    def _open(self):
+        pa = _require_pyarrow()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.output_format == "parquet":
+            import pyarrow.parquet as pq
+            return pq.ParquetWriter(str(self.path), self._schema, compression=self.compression or "snappy")
+        if self.output_format == "arrow":
+            options = pa.ipc.IpcWriteOptions(compression="zstd" if self.compression else None)
+            return pa.ipc.new_file(str(self.path), self._schema, options=options)
+        raise ValueError(f"Unsupported columnar format: {self.output_format}")
@@ -0,0 +1,227 @@
+import argparse
+import copy
+import json
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+from scraper.columnar_writer import COLUMNAR_FORMATS
+from scraper.driver_pool import RecyclingDriver
+from scraper.http_fetcher import HttpFetcher
+from scraper.replay import replay_session
+from scraper.runner import export_traces, run_job, uses_browser
+from scraper.utils import load_config
+from scraper.writers import WRITERS
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs kept for GET /jobs/<id>.
+MAX_FINISHED_JOBS = 1000
+
+
+class ScrapeDaemon:
+    """
+    Long-lived scraper that keeps parsed config, a pool of warm browsers and one pooled HTTP session,
+    and runs scrape jobs submitted over a local JSON/HTTP API on them, so frequent small jobs skip
+    interpreter startup, imports and browser launch.
+    """
+
+    def __init__(self, config: dict[str, Any], workers: int = 2, warm_start: bool = True):
+        """
+        Args:
+            config (dict): parsed configuration shared by every job (jobs override format, structured flag and output dir).
+            workers (int): jobs run concurrently, each on its own recycled browser.
+            warm_start (bool): launch the browsers now instead of on the first job.
+        """
+        self.config = config
+        self.workers = max(1, workers)
+        self.fetcher = HttpFetcher.from_config(config)
+        self.browsers: "queue.Queue[RecyclingDriver]" = queue.Queue()
+        for _ in range(self.workers):
+            browser = RecyclingDriver(config, config["global"].get("driver_max_jobs", 20))
+            if warm_start and uses_browser(config):
+                browser.warm()
+            self.browsers.put(browser)
+        self.pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="scrape-job")
+        self.jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def submit(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue a job: `category` (required), `format`, `structured` and `output_dir` (optional).
+
+        Returns:
+            dict: the job record with its `id` and `status`
+        """
+        category = request.get("category")
+        if not category:
+            raise ValueError("'category' is required")
+        global_config = self.config["global"]
+        output_format = request.get("format") or global_config.get("output_format", "json")
+        if output_format not in WRITERS and output_format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        job = {
+            "id": uuid.uuid4().hex[:12],
+            "category": category,
+            "format": output_format,
+            "structured": bool(request.get("structured", global_config["structured_products_data"])),
+            "output_dir": request.get("output_dir") or global_config.get("output_dir", "output"),
+            "status": "queued",
+            "submitted": time.time(),
+        }
+        with self._lock:
+            self.jobs[job["id"]] = job
+            self.futures[job["id"]] = self.pool.submit(self._run, job)
+            self._trim()
+        return dict(job)
+
+    def _run(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one job; any failure, including outside `run_job`, finishes the job as 'failed'."""
+        job["status"] = "running"
+        try:
+            config = copy.deepcopy(self.config)
+            config["global"]["structured_products_data"] = job["structured"]
+            browser = self.browsers.get()
+            try:
+                result = run_job(config, job["category"], job["output_dir"], job["format"], browser, self.fetcher)
+            finally:
+                self.browsers.put(browser)
+            trace = result.pop("trace", None)
+            if trace is not None:
+                result.update(export_traces(config, [trace], job["output_dir"]))
+            job.update(result=result, status=result["status"], finished=time.time())
+        except Exception as e:
+            logger.exception(f"Job {job['id']} ({job['category']}) failed: {e}")
+            job.update(status="failed", error=str(e), finished=time.time())
+        return job
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Block until the job has finished and return its record (None for an unknown id)."""
+        future = self.futures.get(job_id)
+        if future is None:
+            return self.get(job_id)
+        future.result(timeout=timeout)
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self.jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            statuses = [job["status"] for job in self.jobs.values()]
+        return {
+            "workers": self.workers,
+            "uptime": round(time.time() - self.started, 1),
+            "queued": statuses.count("queued"),
+            "running": statuses.count("running"),
+            "ok": statuses.count("ok"),
+            "failed": statuses.count("failed"),
+            "http_cache": self.fetcher.cache_stats(),
+        }
+
+    def _trim(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job["status"] in ("ok", "failed")]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job_id]
+            self.futures.pop(job_id, None)
+
+    def close(self):
+        """Finish queued jobs, then close the browsers and the HTTP session."""
+        self.pool.shutdown(wait=True)
+        while not self.browsers.empty():
+            self.browsers.get().quit()
+        self.fetcher.close()
+
+
+class _JobApiHandler(BaseHTTPRequestHandler):
+    """
+    POST /jobs            {"category": ..., "format": ..., "structured": ..., "output_dir": ..., "wait": true}
+    GET  /jobs/<id>       job record with `result` (output path, products, seconds, ...) once finished
+    GET  /health          worker and job counters
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/jobs":
+            return self._reply(404, {"error": "not found"})
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            job = self.server.scrape_daemon.submit(request)
+        except (ValueError, json.JSONDecodeError) as e:
+            return self._reply(400, {"error": str(e)})
+        if request.get("wait"):
+            job = self.server.scrape_daemon.wait(job["id"])
+            return self._reply(200, job)
+        self._reply(202, job)
+
+    def do_GET(self):
+        path = self.path.rstrip("/")
+        if path == "/health":
+            return self._reply(200, self.server.scrape_daemon.stats())
+        if path.startswith("/jobs/"):
+            job = self.server.scrape_daemon.get(path.rsplit("/", 1)[1])
+            return self._reply(200, job) if job is not None else self._reply(404, {"error": "unknown job"})
+        self._reply(404, {"error": "not found"})
+
+    def _reply(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def serve(daemon: ScrapeDaemon, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    """Create the job API server for the daemon; call `serve_forever()` on it (port 0 picks a free one)."""
+    server = ThreadingHTTPServer((host, port), _JobApiHandler)
+    server.daemon_threads = True
+    server.scrape_daemon = daemon
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the scraper as a daemon with warm browsers and a local job API")
+    parser.add_argument("--config", default="config.yaml")
+    parser.add_argument("--host")
+    parser.add_argument("--port", type=int)
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    config = load_config(args.config)
+    daemon_config = config.get("daemon", {})
+    with replay_session(config) as config:
+        daemon = ScrapeDaemon(
+            config,
+            workers=args.workers or daemon_config.get("workers", 2),
+            warm_start=daemon_config.get("warm_start", True),
+        )
+        server = serve(daemon, args.host or daemon_config.get("host", "127.0.0.1"), args.port or daemon_config.get("port", 8765))
+        logger.info(f"Scrape daemon listening on http://{server.server_address[0]}:{server.server_address[1]}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down.")
+        finally:
+            server.server_close()
+            daemon.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,73 +1,114 @@
 import re
+from functools import lru_cache
 from typing import Optional
 
+# Number of distinct (description, name) pairs whose parse results are memoized.
+CACHE_SIZE = 16384
+# Bump whenever a change alters the parsed specs, so ProductStore converts stored products again.
+PARSER_VERSION = 1
+
+# One scan over the description finds every token the extractors need:
+# - screen sizes like 14", 15.6″
+# - GB/TB amounts (RAM is the first GB amount, storage is the sum of all of them); the (?<!\d)
+#   guard anchors them at the start of a digit run so long digit runs cannot backtrack quadratically
+# - the position of every CPU or OS keyword, matched zero-width so overlapping keywords ("amdos")
+#   are all seen; the full CPU/OS patterns are then matched only at those positions
+# The leading character class lets the scan skip every position that cannot start a token.
+_SCAN = re.compile(
+    r'(?=[\dacdefilmnprsw])(?:'
+    r'(?P<screen>\d{1,2}(?:\.\d+)?)\s*[″"]'
+    r'|(?<!\d)(?P<size>\d+)\s*(?P<unit>gb|tb)'
+    r'|(?=(?P<cpu>intel|amd|apple|core\s*i\d|i\d|celeron|pentium|ryzen|snapdragon))'
+    r'|(?=(?P<os>win|freedos|endless|no|macos|linux|dos|android|ios))'
+    r')',
+    re.IGNORECASE
+)
+
+_CPU = re.compile(r'(?:intel|amd|apple|core\s*i\d|i\d|celeron|pentium|ryzen|snapdragon)[^,]*', re.IGNORECASE)
+
+# Ordered by priority: the first pattern that matches anywhere in the text wins.
+# The Windows pattern emulates an atomic group with (?=(...))\1 so the version/edition words are
+# consumed once and never re-split by backtracking on long or adversarial strings.
+_OS_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'windows\s+\d+(?=((?:\s+\w+)*))\1(?:\s*\+\s*\w+.*)?',  # Windows 10 Home, Windows 10 Pro + Office
+    r'win\d?\s*pro\s*\d*bit',                              # Win7 Pro 64bit
+    r'freedos',
+    r'endless\s+os',
+    r'no\s+os',
+    r'macos',
+    r'linux',
+    r'dos\b',
+    r'android',
+    r'ios',
+))
+
+
 class DescriptionParser:
     @staticmethod
     def parse(description: str, name: str):
-        brand = name.split()[0] if name else None
-
-        screen_inches = DescriptionParser._extract_screen_size(description)
-        ram_gb = DescriptionParser._extract_ram(description)
-        storage_gb = DescriptionParser._extract_storage(description)
-        cpu = DescriptionParser._extract_cpu(description)
-        os = DescriptionParser._extract_os(description)
-
-        return {
-            "brand": brand,
-            "screen_inches": screen_inches,
-            "ram_gb": ram_gb,
-            "storage_gb": storage_gb,
-            "cpu": cpu,
-            "os": os,
-        }
+        return dict(_parse_cached(description, name))
 
     @staticmethod
-    def _extract_screen_size(text: str) -> Optional[float]:
-        # Matches patterns like 14", 15.6″, etc.
-        match = re.search(r'(\d{1,2}(?:\.\d+)?)\s*[″"]', text)
-        if match:
-            return float(match.group(1))
-        return None
+    def cache_info():
+        """Return hit/miss statistics of the parse memo."""
+        return _parse_cached.cache_info()
 
     @staticmethod
-    def _extract_ram(text: str) -> Optional[int]:
-        match = re.search(r'(\d+)\s*gb\s*(ram|ddr\d*|ddr\dL)?', text, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
-        return None
+    def cache_clear():
+        """Drop every memoized parse result."""
+        _parse_cached.cache_clear()
 
-    @staticmethod
-    def _extract_storage(text: str) -> Optional[int]:
-        total = 0
-        for match in re.finditer(r'(\d+)\s*(gb|tb)(\s*(ssd|hdd|emmc|ssh[d]?))?', text, re.IGNORECASE):
-            value, unit = int(match.group(1)), match.group(2).lower()
-            if unit == 'tb':
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_cached(description: str, name: str) -> tuple:
+    screen_inches = None
+    ram_gb = None
+    storage_gb = 0
+    cpu_at = None
+    os_at = []
+
+    for match in _SCAN.finditer(description):
+        kind = match.lastgroup  # the alternative that matched; "unit" closes last for GB/TB amounts
+        if kind == "unit":
+            value = int(match.group("size"))
+            if match.group("unit").lower() == "tb":
                 value *= 1024
-            total += value
-        return total if total else None
+            elif ram_gb is None:
+                ram_gb = value
+            storage_gb += value
+        elif kind == "os":
+            os_at.append(match.start())
+        elif kind == "cpu":
+            if cpu_at is None:
+                cpu_at = match.start()
+        elif screen_inches is None:
+            screen_inches = float(match.group("screen"))
 
-    @staticmethod
-    def _extract_cpu(text: str) -> Optional[str]:
-        # Match keywords and take surrounding context
-        match = re.search(r'((?:intel|amd|apple|core\s*i\d|i\d|celeron|pentium|ryzen|snapdragon)[^,]*)', text, re.IGNORECASE)
-        return match.group(1).strip() if match else None
+    return (
+        ("brand", name.split()[0] if name else None),
+        ("screen_inches", screen_inches),
+        ("ram_gb", ram_gb),
+        ("storage_gb", storage_gb or None),
+        ("cpu", _match_cpu(description, cpu_at)),
+        ("os", _match_os(description, os_at)),
+    )
 
-    @staticmethod
-    def _extract_os(text: str) -> Optional[str]:
-        os_patterns = [
-            r'windows\s+\d+(?:\s+\w+)*(?:\s*\+\s*\w+.*)?',  # Windows 10 Home, Windows 10 Pro + Office
-            r'win\d?\s*pro\s*\d*bit',                       # Win7 Pro 64bit
-            r'freedos',
-            r'endless\s+os',
-            r'no\s+os',
-            r'macos',
-            r'linux',
-            r'dos\b',
-            r'android',
-            r'ios',
-        ]
-        for pattern in os_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0).strip()
+
+def _match_cpu(text: str, position: Optional[int]) -> Optional[str]:
+    if position is None:
         return None
+    match = _CPU.match(text, position)
+    return match.group(0).strip() if match else None
+
+
+def _match_os(text: str, positions: list) -> Optional[str]:
+    best_priority, best = len(_OS_PATTERNS), None
+    for position in positions:
+        for priority, pattern in enumerate(_OS_PATTERNS[:best_priority]):
+            match = pattern.match(text, position)
+            if match:
+                best_priority, best = priority, match.group(0).strip()
+                break
+        if best_priority == 0:
+            break
+    return best
@@ -0,0 +1,351 @@
+import argparse
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from multiprocessing import Process
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from scraper.driver_pool import RecyclingDriver
+from scraper.enums import JobKind, JobStatus
+from scraper.http_fetcher import HttpFetcher
+from scraper.models import RAW_PRODUCT_LIST, STRUCTURED_PRODUCT_LIST
+from scraper.product_converter import ProductConverter
+from scraper.product_detail_extractor import ProductDetailExtractor
+from scraper.product_list_extractor import ProductListExtractor
+from scraper.replay import replay_session
+from scraper.runner import uses_browser
+from scraper.utils import load_config
+from scraper.work_queue import Job, JobRecord, WorkQueue
+from scraper.writers import output_path, write_stream
+
+logger = logging.getLogger(__name__)
+
+
+def open_queue(config: dict[str, Any]) -> WorkQueue:
+    """Open the WorkQueue described by the `queue:` config section."""
+    queue_config = config.get("queue", {})
+    return WorkQueue(
+        queue_config.get("path", "output/queue.sqlite"),
+        max_attempts=queue_config.get("max_attempts", 3),
+        journal_mode=queue_config.get("journal_mode", "wal"),
+    )
+
+
+def _dump(products: list, structured: bool) -> list:
+    """Products as JSON-ready dicts, in one TypeAdapter pass."""
+    return (STRUCTURED_PRODUCT_LIST if structured else RAW_PRODUCT_LIST).dump_python(products, mode="json")
+
+
+def _load(products: list, structured: bool) -> list:
+    return (STRUCTURED_PRODUCT_LIST if structured else RAW_PRODUCT_LIST).validate_python(products)
+
+
+def run_listing_job(
+    config: dict[str, Any],
+    job: Job,
+    browser: RecyclingDriver,
+    fetcher: HttpFetcher
+) -> Tuple[Dict[str, Any], List[tuple]]:
+    """
+    Extract one category listing. With `detail.enabled` the products become detail jobs of
+    `queue.detail_chunk` products each instead of the result.
+
+    Returns:
+        (result, follow_ups): the job result and the `(kind, category, part, payload)` jobs to queue with it
+    """
+    structured = config["global"]["structured_products_data"]
+    failed = True
+    try:
+        driver = browser.acquire() if uses_browser(config) else None
+        products = list(ProductListExtractor(driver, config, job.category, fetcher=fetcher).extract(structured))
+        failed = False
+    finally:
+        browser.release(failed=failed)
+
+    if not config.get("detail", {}).get("enabled", False):
+        return {"structured": structured, "count": len(products), "products": _dump(products, structured)}, []
+    chunk = max(1, config.get("queue", {}).get("detail_chunk", 200))
+    follow_ups = [
+        (JobKind.DETAIL, job.category, part, {"structured": structured, "products": _dump(chunk_products, structured)})
+        for part, chunk_products in enumerate(products[i:i + chunk] for i in range(0, len(products), chunk))
+    ]
+    return {"structured": structured, "count": len(products), "detail_jobs": len(follow_ups)}, follow_ups
+
+
+def run_detail_job(config: dict[str, Any], job: Job, fetcher: HttpFetcher) -> Dict[str, Any]:
+    """Fetch the detail pages of one chunk of a category's products and return them enriched."""
+    products = _load(job.payload["products"], job.payload["structured"])
+    enriched = ProductDetailExtractor(None, config, job.category, fetcher=fetcher).extract(products)
+    return {"structured": True, "count": len(enriched), "products": _dump(enriched, True)}
+
+
+@contextmanager
+def _renewing(queue: WorkQueue, job: Job, worker: str, lease_seconds: float) -> Iterator[None]:
+    """Renew the job's lease every third of `lease_seconds` while the block runs."""
+    stop = threading.Event()
+
+    def renew():
+        while not stop.wait(lease_seconds / 3):
+            if not queue.renew(job, worker, lease_seconds):
+                logger.warning(f"Lost the lease of {job.kind.value} job {job.id} ({job.category}).")
+                return
+
+    thread = threading.Thread(target=renew, name=f"lease-{job.id}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def run_worker(config: dict[str, Any], worker: Optional[str] = None) -> Dict[str, int]:
+    """
+    Lease and run listing and detail jobs from the queue until the coordinator closes the run,
+    reusing one recycled browser and one HTTP session for every job.
+
+    Returns:
+        dict: number of jobs this worker finished (`done`) and gave back after an error (`failed`)
+    """
+    worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+    queue_config = config.get("queue", {})
+    lease_seconds = queue_config.get("lease_seconds", 300)
+    poll_seconds = queue_config.get("poll_seconds", 1)
+    counts = {"done": 0, "failed": 0}
+    browser = RecyclingDriver(config, config["global"].get("driver_max_jobs", 20))
+    logger.info(f"Worker {worker} started.")
+    try:
+        with open_queue(config) as queue, HttpFetcher.from_config(config) as fetcher:
+            while True:
+                job = queue.lease(worker, lease_seconds)
+                if job is None:
+                    if queue.get_meta("state") == "closed":
+                        break
+                    time.sleep(poll_seconds)
+                    continue
+                start = time.time()
+                try:
+                    with _renewing(queue, job, worker, lease_seconds):
+                        if job.kind == JobKind.LISTING:
+                            result, follow_ups = run_listing_job(config, job, browser, fetcher)
+                        else:
+                            result, follow_ups = run_detail_job(config, job, fetcher), []
+                except Exception as e:
+                    status = queue.fail(job, worker, str(e))
+                    counts["failed"] += 1
+                    logger.exception(
+                        f"{job.kind.value} job {job.id} ({job.category}) failed on attempt {job.attempts}, "
+                        f"now {status.value}: {e}",
+                        extra={"event": "job_failed", "category": job.category}
+                    )
+                    continue
+                result.update(worker=worker, seconds=round(time.time() - start, 2))
+                if queue.complete(job, worker, result, follow_ups):
+                    counts["done"] += 1
+                    logger.info(f"Finished {job.kind.value} job {job.id} ({job.category}) in {result['seconds']}s")
+                else:
+                    logger.warning(f"Discarded the result of {job.kind.value} job {job.id}: its lease expired.")
+    finally:
+        browser.quit()
+    logger.info(f"Worker {worker} done: {counts['done']} jobs finished, {counts['failed']} failed.")
+    return counts
+
+
+def _worker_process(config: dict[str, Any]):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    run_worker(config)
+
+
+def _reap_workers(queue: WorkQueue, processes: List[Process], reaped: set) -> bool:
+    """
+    Give back the jobs of local worker processes that exited before the run was closed (e.g. the browser
+    failed to start), instead of leaving them leased until their leases expire.
+
+    Returns:
+        bool: True once none of the local workers is alive
+    """
+    for process in processes:
+        if process.pid in reaped or process.is_alive():
+            continue
+        reaped.add(process.pid)
+        worker = f"{socket.gethostname()}:{process.pid}"
+        released = queue.release_worker(worker, f"worker exited with code {process.exitcode}")
+        logger.error(
+            f"Worker process {process.pid} exited with code {process.exitcode}; gave back {released} leased jobs.",
+            extra={"event": "worker_exited"}
+        )
+    return len(reaped) == len(processes)
+
+
+def merge_category(
+    config: dict[str, Any],
+    jobs: List[JobRecord],
+    category: str,
+    output_dir: str,
+    output_format: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Write a category's output file once its listing and every detail chunk are finished.
+    A detail chunk that failed for good contributes its listing products unchanged.
+
+    Returns:
+        dict: category summary, or None while jobs of the category are still queued or leased
+    """
+    listing, details = jobs[0], jobs[1:]
+    if listing.status == JobStatus.FAILED:
+        return {"category": category, "status": "failed", "error": listing.error, "attempts": listing.attempts}
+    if listing.status != JobStatus.DONE or any(job.status not in (JobStatus.DONE, JobStatus.FAILED) for job in details):
+        return None
+
+    products_config = config["products"]
+    converter = ProductConverter(
+        products_config.get("currency_rates") or {"USD": 1.0}, products_config.get("target_currency") or "USD"
+    )
+    detail_enabled = config.get("detail", {}).get("enabled", False)
+    parts = [job.result if job.status == JobStatus.DONE else job.payload for job in details] or [listing.result]
+    products = []
+    for part in parts:
+        loaded = _load(part.get("products", []), part["structured"])
+        products.extend(converter.to_structured_batch(loaded) if detail_enabled and not part["structured"] else loaded)
+
+    global_config = config["global"]
+    compression = global_config.get("output_compression")
+    kind = "structured" if global_config["structured_products_data"] or detail_enabled else "raw"
+    out_path = output_path(output_dir, f"{category}_{kind}", output_format, compression)
+    count = write_stream(products, out_path, output_format, compression, global_config.get("flush_every", 500))
+    logger.info(f"Merged {count} products of '{category}' from {len(jobs)} jobs into {out_path}")
+    summary = {
+        "category": category,
+        "status": "ok",
+        "products": count,
+        "output": out_path,
+        "jobs": len(jobs),
+        "attempts": sum(job.attempts for job in jobs),
+    }
+    detail_failed = sum(job.status == JobStatus.FAILED for job in details)
+    if detail_failed:
+        summary["detail_failed"] = detail_failed
+    return summary
+
+
+def run_coordinator(
+    config: dict[str, Any],
+    categories: List[str],
+    output_dir: str,
+    output_format: str,
+    workers: int = 0,
+    resume: bool = False
+) -> Dict[str, Any]:
+    """
+    Queue one listing job per category, optionally start `workers` local worker processes, and merge each
+    category into one output file as soon as all of its jobs are finished. Workers started elsewhere with
+    `python -m scraper.distributed worker` against the same queue share the work. The run is closed
+    (idle workers exit) once every category is merged or failed, or once every local worker has died and no
+    job is leased by any other worker; categories left unfinished then fail and `resume` continues them.
+
+    Args:
+        resume (bool): continue the queue of an interrupted run instead of starting a fresh one.
+
+    Returns:
+        dict: combined summary with per-category results, job counts and total wall time
+    """
+    start = time.time()
+    queue_config = config.get("queue", {})
+    with replay_session(config) as config, open_queue(config) as queue:
+        if not resume:
+            queue.reset()
+        for category in categories:
+            queue.enqueue(JobKind.LISTING, category)
+        queue.set_meta("state", "open")
+        processes = [Process(target=_worker_process, args=(config,), daemon=True) for _ in range(workers)]
+        for process in processes:
+            process.start()
+        logger.info(f"Queued {len(categories)} categories in {queue.path} with {workers} local worker(s)")
+
+        results: Dict[str, Dict[str, Any]] = {}
+        reaped: set = set()
+        abandoned = 0
+        try:
+            while len(results) < len(categories):
+                unfinished = queue.unfinished()
+                for category in categories:
+                    if category not in results and category not in unfinished:
+                        result = merge_category(config, queue.jobs(category), category, output_dir, output_format)
+                        if result is not None:
+                            result["seconds"] = round(time.time() - start, 2)
+                            results[category] = result
+                if len(results) == len(categories):
+                    break
+                # Two polls in a row, so a worker started elsewhere has had a poll interval to lease a job.
+                idle = bool(processes) and _reap_workers(queue, processes, reaped) and not queue.counts()["leased"]
+                abandoned = abandoned + 1 if idle else 0
+                if abandoned >= 2:
+                    logger.error("Every local worker exited and no other worker holds a job; ending the run.")
+                    for category in categories:
+                        results.setdefault(category, {
+                            "category": category, "status": "failed", "error": "no worker left",
+                            "seconds": round(time.time() - start, 2),
+                        })
+                    break
+                time.sleep(queue_config.get("poll_seconds", 1))
+        finally:
+            queue.set_meta("state", "closed")
+            for process in processes:
+                process.join()
+        jobs = queue.counts()
+
+    summary = {
+        "workers": workers,
+        "seconds": round(time.time() - start, 2),
+        "products": sum(result.get("products", 0) for result in results.values()),
+        "failed": [category for category, result in results.items() if result["status"] != "ok"],
+        "jobs": jobs,
+        "categories": [results[category] for category in categories],
+    }
+    logger.info(f"Scraped {summary['products']} products from {len(categories)} categories in {summary['seconds']}s")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distribute categories and detail pages over queue workers")
+    parser.add_argument("role", choices=["coordinator", "worker"])
+    parser.add_argument("--config", default="config.yaml")
+    parser.add_argument("--queue", help="SQLite queue file (overrides queue.path)")
+    parser.add_argument("--category", nargs="+", help="Coordinator: categories, or 'all' for global.categories")
+    parser.add_argument("--workers", type=int, default=0, help="Coordinator: local worker processes to start")
+    parser.add_argument("--output", help="Coordinator: output directory")
+    parser.add_argument("--format", choices=["json", "jsonl", "csv", "parquet", "arrow"])
+    parser.add_argument("--resume", action="store_true", help="Coordinator: continue an interrupted run's queue")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    config = load_config(args.config)
+    if args.queue:
+        config.setdefault("queue", {})["path"] = args.queue
+    if args.role == "worker":
+        with replay_session(config) as config:
+            run_worker(config)
+        return
+
+    global_config = config["global"]
+    categories = args.category or [global_config.get("category", "laptops")]
+    if "all" in categories:
+        categories = global_config.get("categories") or [global_config.get("category", "laptops")]
+    output_dir = args.output or global_config.get("output_dir", "output")
+    summary = run_coordinator(
+        config, categories, output_dir, args.format or global_config.get("output_format", "json"),
+        workers=args.workers, resume=args.resume
+    )
+    os.makedirs(output_dir, exist_ok=True)
+    summary_path = f"{output_dir}/summary.json"
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    logger.info(f"Run summary written to {summary_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import logging
+from typing import TYPE_CHECKING, Any, Optional
+
+from scraper.utils import create_driver
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+
+class RecyclingDriver:
+    """
+    Holds one lazily created WebDriver that is reused across scrape jobs and restarted
+    after `max_jobs` jobs (or after a failed job) to cap browser memory leaks.
+    """
+
+    def __init__(self, config: dict[str, Any], max_jobs: int = 20):
+        """
+        Args:
+            config (dict): Configuration dictionary passed to `create_driver`.
+            max_jobs (int): jobs served by one browser before it is restarted; 0 disables recycling.
+        """
+        self.config = config
+        self.max_jobs = max_jobs
+        self.driver: Optional["WebDriver"] = None
+        self.jobs = 0
+        self.restarts = 0
+
+    def acquire(self) -> "WebDriver":
+        """Return a live driver, restarting it first if it has served `max_jobs` jobs."""
+        if self.driver is not None and self.max_jobs and self.jobs >= self.max_jobs:
+            logger.info(f"Recycling browser after {self.jobs} jobs.")
+            self.quit()
+        if self.driver is None:
+            self.driver = create_driver(self.config)
+            self.jobs = 0
+            self.restarts += 1
+        return self.driver
+
+    def warm(self):
+        """Start the browser ahead of the first job, without counting a job."""
+        if self.driver is None:
+            self.acquire()
+
+    def release(self, failed: bool = False):
+        """Mark the current job as done; a failed job discards the browser so the next one starts clean."""
+        self.jobs += 1
+        if failed:
+            self.quit()
+
+    def quit(self):
+        """Close the browser, if one is running."""
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.warning(f"Failed to close browser cleanly: {e}")
+        finally:
+            self.driver = None
@@ -5,4 +5,49 @@ class ClickStatus(Enum):
     SUCCESS = "clicked_and_loaded"
     BUTTON_HIDDEN = "button_hidden"
     NO_NEW_ITEMS = "no_new_items"
-    FAILURE = "failure"
\ No newline at end of file
+    FAILURE = "failure"
+
+
+class ExtractionBackend(Enum):
+    PAGE_SOURCE = "page_source"
+    SCRIPT = "script"
+
+
+class PaginationMode(Enum):
+    WEBDRIVER = "webdriver"
+    SCRIPT = "script"
+
+
+class FetchMode(Enum):
+    BROWSER = "browser"
+    HTTP = "http"
+
+
+class HtmlParser(Enum):
+    HTML_PARSER = "html.parser"
+    LXML = "lxml"
+    SELECTOLAX = "selectolax"
+
+
+class ReplayMode(Enum):
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class DomPruning(Enum):
+    OFF = "off"
+    REMOVE = "remove"
+    PLACEHOLDER = "placeholder"
+
+
+class JobKind(Enum):
+    LISTING = "listing"
+    DETAIL = "detail"
+
+
+class JobStatus(Enum):
+    QUEUED = "queued"
+    LEASED = "leased"
+    DONE = "done"
+    FAILED = "failed"
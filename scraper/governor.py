@@ -0,0 +1,321 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hosts (
+    host TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL,
+    rate REAL NOT NULL,
+    blocked_until REAL NOT NULL DEFAULT 0,
+    latency REAL,
+    baseline REAL,
+    adjusted REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS slots (
+    id INTEGER PRIMARY KEY,
+    host TEXT NOT NULL,
+    expires REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS slots_host ON slots (host);
+"""
+
+# Responses that mean "slow down": the rate is cut right away and Retry-After is honoured.
+THROTTLE_STATUSES = (429, 503)
+# Seconds between checks for a free concurrency slot (held by another thread or process).
+SLOT_POLL_INTERVAL = 0.02
+# Minimum seconds between two slowdowns caused by throttled responses of requests that were in flight together.
+THROTTLE_COOLDOWN = 1.0
+# Weight of the newest latency in the per-host moving average.
+LATENCY_ALPHA = 0.2
+# Share of the configured rate restored per quiet `adjust_interval`, and baseline latency drift per interval.
+RECOVERY_STEP = 0.1
+BASELINE_DRIFT = 0.05
+
+COUNTERS = ("requests", "waits", "wait_seconds", "throttled", "slowdowns")
+
+
+class HostLimits(NamedTuple):
+    rate: float
+    burst: float
+    max_concurrency: int
+
+
+class Permit:
+    """
+    One granted request slot; `record` the response so the governor can react to throttling and latency.
+    Set `timed` to False when the slot's duration says nothing about the site's HTTP latency (e.g. a browser click
+    and its render wait).
+    """
+
+    def __init__(self, slot: int, host: str):
+        self.slot = slot
+        self.host = host
+        self.start = time.perf_counter()
+        self.timed = True
+        self.status: Optional[int] = None
+        self.retry_after: Optional[str] = None
+
+    def record(self, status: Optional[int], retry_after: Optional[str] = None):
+        self.status = status
+        self.retry_after = retry_after
+
+
+class RateGovernor:
+    """
+    Politeness and throughput control above every HTTP request, browser navigation and 'Load More' click:
+    a token bucket per host (`rate` requests per second, bursts of `burst`) plus a cap of `max_concurrency`
+    requests in flight per host. The state lives in one SQLite file, so every thread, asyncio task and worker
+    process using the same `path` shares the limits ("" keeps them per process).
+
+    The effective rate adapts AIMD style: a 429/503 (or latency above `latency_factor` x its baseline) multiplies
+    it by `slowdown`, down to `min_rate`, and Retry-After pauses the host; every quiet `adjust_interval`
+    restores a tenth of the configured rate. Slots of a crashed process are freed after `slot_ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = "",
+        rate: float = 5.0,
+        burst: float = 10,
+        max_concurrency: int = 8,
+        hosts: Optional[Dict[str, Dict[str, Any]]] = None,
+        min_rate: float = 0.5,
+        slowdown: float = 0.5,
+        latency_factor: float = 3.0,
+        adjust_interval: float = 5.0,
+        slot_ttl: float = 120.0,
+        timeout: float = 30
+    ):
+        """
+        Args:
+            path: SQLite state file shared by processes, created on first use; "" for per-process state.
+            rate (float): requests per second per host.
+            burst (float): requests a host may receive back to back after a quiet period.
+            max_concurrency (int): requests in flight per host.
+            hosts (dict): per-host overrides of rate, burst and max_concurrency, keyed by host[:port].
+            min_rate (float): floor of the automatic slowdown.
+            slowdown (float): rate factor applied on throttling or rising latency.
+            latency_factor (float): latency moving average over its baseline that counts as rising.
+            adjust_interval (float): seconds between latency-driven slowdowns and recoveries.
+            slot_ttl (float): seconds after which an unreleased slot (crashed process) is reclaimed.
+            timeout (float): seconds to wait for another process's write transaction.
+        """
+        self.defaults = HostLimits(rate, burst, max_concurrency)
+        self.hosts = hosts or {}
+        self.min_rate = min_rate
+        self.slowdown = slowdown
+        self.latency_factor = latency_factor
+        self.adjust_interval = adjust_interval
+        self.slot_ttl = slot_ttl
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(
+            str(path) if path else ":memory:", timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        if path:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self.counters: Dict[str, float] = dict.fromkeys(COUNTERS, 0)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict) -> Optional["RateGovernor"]:
+        """Create the governor from the `governor:` section, or return None when it is disabled."""
+        governor_config = dict(config.get("governor") or {})
+        if not governor_config.pop("enabled", False):
+            return None
+        return cls(**governor_config)
+
+    @staticmethod
+    def host(url: str) -> str:
+        """Bucket key of a URL: its host[:port]."""
+        return urlsplit(url).netloc or url
+
+    def limits(self, host: str) -> HostLimits:
+        return self.defaults._replace(**self.hosts.get(host, {}))
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def _try_acquire(self, host: str) -> Tuple[Optional[Permit], float]:
+        """Take a token and a slot for `host` if both are available; otherwise return the seconds to wait."""
+        limits = self.limits(host)
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM slots WHERE expires < ?", (now,))
+            row = conn.execute(
+                "SELECT tokens, updated, rate, blocked_until FROM hosts WHERE host = ?", (host,)
+            ).fetchone()
+            if row is None:
+                tokens, updated, rate, blocked_until = limits.burst, now, limits.rate, 0.0
+                conn.execute(
+                    "INSERT INTO hosts (host, tokens, updated, rate) VALUES (?, ?, ?, ?)", (host, tokens, now, rate)
+                )
+            else:
+                tokens, updated, rate, blocked_until = row
+                rate = min(rate, limits.rate)  # the state file may predate a lower configured rate
+            if now < blocked_until:
+                return None, blocked_until - now
+            tokens = min(limits.burst, tokens + (now - updated) * rate)
+            in_flight = conn.execute("SELECT COUNT(*) FROM slots WHERE host = ?", (host,)).fetchone()[0]
+            permit, wait = None, 0.0
+            if in_flight >= limits.max_concurrency:
+                wait = SLOT_POLL_INTERVAL
+            elif tokens >= 1:
+                tokens -= 1
+                slot = conn.execute(
+                    "INSERT INTO slots (host, expires) VALUES (?, ?)", (host, now + self.slot_ttl)
+                ).lastrowid
+                permit = Permit(slot, host)
+            else:
+                wait = (1 - tokens) / rate
+            conn.execute("UPDATE hosts SET tokens = ?, updated = ? WHERE host = ?", (tokens, now, host))
+        return permit, wait
+
+    def _count_wait(self, waited: float):
+        with self._lock:
+            self.counters["requests"] += 1
+            if waited:
+                self.counters["waits"] += 1
+                self.counters["wait_seconds"] += waited
+
+    def acquire(self, host: str) -> Permit:
+        """Block the calling thread until `host` may receive another request."""
+        start, waited = time.perf_counter(), False
+        while True:
+            permit, wait = self._try_acquire(host)
+            if permit is not None:
+                self._count_wait(time.perf_counter() - start if waited else 0.0)
+                return permit
+            waited = True
+            time.sleep(wait)
+
+    async def acquire_async(self, host: str) -> Permit:
+        """Like `acquire`, but yields to the event loop while waiting."""
+        start, waited = time.perf_counter(), False
+        while True:
+            permit, wait = self._try_acquire(host)
+            if permit is not None:
+                self._count_wait(time.perf_counter() - start if waited else 0.0)
+                return permit
+            waited = True
+            await asyncio.sleep(wait)
+
+    def release(self, permit: Permit):
+        """Free the permit's slot and feed its status and latency into the host's rate."""
+        latency = time.perf_counter() - permit.start
+        limits = self.limits(permit.host)
+        now = time.time()
+        throttled = permit.status in THROTTLE_STATUSES
+        pause = _retry_after_seconds(permit.retry_after) if throttled else None
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM slots WHERE id = ?", (permit.slot,))
+            row = conn.execute(
+                "SELECT rate, blocked_until, latency, baseline, adjusted FROM hosts WHERE host = ?", (permit.host,)
+            ).fetchone()
+            if row is None:
+                return
+            rate, blocked_until, average, baseline, adjusted = row
+            if permit.timed:
+                average = latency if average is None else (1 - LATENCY_ALPHA) * average + LATENCY_ALPHA * latency
+                baseline = average if baseline is None else min(baseline, average)
+            slower = False
+            if throttled and now - adjusted >= min(THROTTLE_COOLDOWN, self.adjust_interval):
+                slower = True
+            elif average is not None and now - adjusted >= self.adjust_interval:
+                slower = average > self.latency_factor * baseline
+                if not slower:
+                    rate = min(limits.rate, rate + RECOVERY_STEP * limits.rate)
+                baseline += BASELINE_DRIFT * (average - baseline)
+                adjusted = now
+            if slower:
+                rate = max(self.min_rate, rate * self.slowdown)
+                adjusted = now
+            if pause:
+                blocked_until = max(blocked_until, now + pause)
+            conn.execute(
+                "UPDATE hosts SET rate = ?, blocked_until = ?, latency = ?, baseline = ?, adjusted = ? WHERE host = ?",
+                (rate, blocked_until, average, baseline, adjusted, permit.host)
+            )
+        with self._lock:
+            self.counters["throttled"] += throttled
+            self.counters["slowdowns"] += slower
+        if slower:
+            reason = f"HTTP {permit.status}" if throttled else f"latency {average:.2f}s"
+            logger.warning(
+                f"Slowing down requests to {permit.host} to {rate:.2f}/s ({reason}).",
+                extra={"event": "rate_slowdown", "host": permit.host, "rate": rate}
+            )
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[Permit]:
+        """Hold a request slot for `url`'s host while the block runs."""
+        permit = self.acquire(self.host(url))
+        try:
+            yield permit
+        finally:
+            self.release(permit)
+
+    @asynccontextmanager
+    async def slot_async(self, url: str) -> AsyncIterator[Permit]:
+        """`slot` for asyncio tasks."""
+        permit = await self.acquire_async(self.host(url))
+        try:
+            yield permit
+        finally:
+            self.release(permit)
+
+    def stats(self) -> Dict[str, Any]:
+        """This process's request/wait/throttle counters."""
+        with self._lock:
+            return {key: round(value, 3) for key, value in self.counters.items()}
+
+    def host_state(self, host: str) -> Dict[str, Any]:
+        """Current shared rate, tokens, pause and latency of a host (empty before its first request)."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT rate, tokens, blocked_until, latency, baseline FROM hosts WHERE host = ?", (host,)
+            ).fetchone()
+            in_flight = self.conn.execute("SELECT COUNT(*) FROM slots WHERE host = ?", (host,)).fetchone()[0]
+        if row is None:
+            return {}
+        rate, tokens, blocked_until, latency, baseline = row
+        return {"rate": rate, "tokens": tokens, "blocked_until": blocked_until, "latency": latency,
+                "baseline": baseline, "in_flight": in_flight}
+
+    def close(self):
+        self.conn.close()
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After header (delta seconds or HTTP date), or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
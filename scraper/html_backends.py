@@ -0,0 +1,105 @@
+import importlib.util
+import logging
+from typing import Dict, List, Optional
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+from scraper.enums import HtmlParser
+
+logger = logging.getLogger(__name__)
+
+
+class SoupBackend:
+    """
+    BeautifulSoup tree built with `html.parser` or `lxml`. CSS selectors are compiled once
+    through soupsieve and reused for every card instead of being re-resolved per lookup.
+    """
+
+    def __init__(self, features: str = HtmlParser.HTML_PARSER.value):
+        self.name = features
+        self.features = features
+        self._compiled: Dict[str, soupsieve.SoupSieve] = {}
+
+    def compile(self, selector: str) -> soupsieve.SoupSieve:
+        """Return the compiled form of a CSS selector, compiling it on first use."""
+        compiled = self._compiled.get(selector)
+        if compiled is None:
+            compiled = self._compiled[selector] = soupsieve.compile(selector)
+        return compiled
+
+    def select_cards(self, html: str, selector: str) -> list:
+        """Parse a page or fragment and return the nodes matching the card selector."""
+        return self.compile(selector).select(BeautifulSoup(html, self.features))
+
+    def select_one(self, node, selector: str):
+        """Return the first match inside `node`, or None."""
+        return self.compile(selector).select_one(node)
+
+    def count(self, node, selector: str) -> int:
+        """Return the number of matches inside `node`."""
+        return len(self.compile(selector).select(node))
+
+    @staticmethod
+    def text(node) -> str:
+        """Return the node's text with every text part stripped."""
+        return node.get_text(strip=True)
+
+    @staticmethod
+    def attr(node, attr: str) -> Optional[str]:
+        """Return an attribute of the node, or None."""
+        return node.get(attr)
+
+
+class SelectolaxBackend:
+    """C-based parser (selectolax, lexbor engine when available); much faster tree building and selection."""
+
+    name = HtmlParser.SELECTOLAX.value
+
+    def __init__(self):
+        try:
+            from selectolax.lexbor import LexborHTMLParser as parser_class
+        except ImportError:
+            from selectolax.parser import HTMLParser as parser_class
+        self._parser_class = parser_class
+
+    def select_cards(self, html: str, selector: str) -> list:
+        return self._parser_class(html).css(selector)
+
+    def select_one(self, node, selector: str):
+        return node.css_first(selector)
+
+    def count(self, node, selector: str) -> int:
+        return len(node.css(selector))
+
+    @staticmethod
+    def text(node) -> str:
+        return node.text(strip=True)
+
+    @staticmethod
+    def attr(node, attr: str) -> Optional[str]:
+        return node.attributes.get(attr)
+
+
+def available_parsers() -> List[str]:
+    """Return the configured-parser names whose libraries are installed."""
+    names = [HtmlParser.HTML_PARSER.value]
+    if importlib.util.find_spec("lxml") is not None:
+        names.append(HtmlParser.LXML.value)
+    if importlib.util.find_spec("selectolax") is not None:
+        names.append(HtmlParser.SELECTOLAX.value)
+    return names
+
+
+def create_html_backend(name: str = HtmlParser.HTML_PARSER.value):
+    """
+    Create the parser backend configured in `products.html_parser`, falling back to
+    `html.parser` (with a warning) when the requested library is not installed.
+    """
+    parser = HtmlParser(name)
+    if parser.value not in available_parsers():
+        logger.warning(f"HTML parser '{parser.value}' is not installed. Falling back to 'html.parser'.")
+        parser = HtmlParser.HTML_PARSER
+    if parser == HtmlParser.SELECTOLAX:
+        return SelectolaxBackend()
+    return SoupBackend(parser.value)
@@ -0,0 +1,201 @@
+import logging
+import sqlite3
+import threading
+import time
+from email.utils import formatdate
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    content_type TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS fetches (
+    url TEXT PRIMARY KEY,
+    expires REAL NOT NULL
+);
+"""
+
+COUNTERS = ("hits", "revalidated", "misses", "stores", "evictions", "waits")
+
+# Seconds between checks while another thread or process fetches the same URL.
+CLAIM_POLL_INTERVAL = 0.05
+
+
+class CachedResponse(NamedTuple):
+    status: int
+    body: bytes
+    content_type: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+
+class HttpCache:
+    """
+    Disk cache of GET responses in one SQLite file (WAL mode), shared by every thread and worker process.
+    Entries younger than `ttl` are served without a request; older ones are revalidated with
+    If-None-Match / If-Modified-Since. The least recently used entries are evicted beyond `max_bytes`.
+    A missing or stale URL is claimed before it is fetched, so concurrent misses for it wait for one fetch.
+    """
+
+    def __init__(self, path: Union[str, Path], ttl: float = 3600, max_bytes: int = 512 * 1024 * 1024,
+                 timeout: float = 30, claim_ttl: float = 60):
+        """
+        Args:
+            path: SQLite database file, created on first use.
+            ttl (float): seconds a response is served without revalidation.
+            max_bytes (int): total body size kept; least recently used entries are evicted beyond it.
+            timeout (float): seconds to wait for another process's write transaction.
+            claim_ttl (float): seconds after which an unreleased fetch claim (crashed process) is taken over.
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.claim_ttl = claim_ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict) -> Optional["HttpCache"]:
+        """Create the cache from `http.cache`, or return None when it is disabled."""
+        cache_config = config.get("http", {}).get("cache") or {}
+        if not cache_config.get("enabled", False):
+            return None
+        return cls(
+            cache_config.get("path", "cache/http.sqlite"),
+            ttl=cache_config.get("ttl_seconds", 3600),
+            max_bytes=int(cache_config.get("max_mb", 512) * 1024 * 1024),
+            claim_ttl=cache_config.get("claim_ttl_seconds", 60),
+        )
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the stored response for the URL (fresh or stale), marking it as recently used."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT status, body, content_type, etag, last_modified, stored_at FROM responses WHERE url = ?",
+                (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url))
+        return CachedResponse(*row)
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry: CachedResponse) -> Dict[str, str]:
+        """Validators of a stale entry for a conditional GET."""
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        elif not entry.etag:
+            headers["If-Modified-Since"] = formatdate(entry.stored_at, usegmt=True)
+        return headers
+
+    def claim(self, url: str) -> Optional[int]:
+        """
+        Claim the fetch of a missing or stale URL.
+
+        Returns:
+            int: claim id to `release` after the fetch, or None while another thread or process holds an
+            unexpired claim on the URL
+        """
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.execute("DELETE FROM fetches WHERE url = ? AND expires < ?", (url, now))
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO fetches (url, expires) VALUES (?, ?)", (url, now + self.claim_ttl)
+                )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return cursor.lastrowid if cursor.rowcount == 1 else None
+
+    def release(self, claim: int):
+        """Drop a fetch claim once its response is stored (or was not cacheable)."""
+        with self._lock:
+            self.conn.execute("DELETE FROM fetches WHERE rowid = ?", (claim,))
+
+    def refresh(self, url: str):
+        """Restart the TTL of an entry after a 304 Not Modified."""
+        now = time.time()
+        with self._lock:
+            self.conn.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+
+    def put(self, url: str, status: int, body: bytes, content_type: Optional[str],
+            etag: Optional[str], last_modified: Optional[str]):
+        """Store a response, evicting least recently used entries while the cache exceeds `max_bytes`."""
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(url, status, content_type, etag, last_modified, body, size, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (url, status, content_type, etag, last_modified, body, len(body), now, now)
+                )
+                evicted = self._evict()
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.counters["stores"] += 1
+            self.counters["evictions"] += evicted
+
+    def _evict(self) -> int:
+        excess = self.conn.execute("SELECT total(size) FROM responses").fetchone()[0] - self.max_bytes
+        evicted = 0
+        if excess <= 0:
+            return evicted
+        rows = self.conn.execute("SELECT url, size FROM responses ORDER BY accessed_at").fetchall()
+        for url, size in rows:
+            if excess <= 0:
+                break
+            self.conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            excess -= size
+            evicted += 1
+        return evicted
+
+    def count(self, counter: str):
+        with self._lock:
+            self.counters[counter] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of this process's hit/revalidated/miss/store/eviction/wait counters."""
+        with self._lock:
+            return dict(self.counters)
+
+    def close(self):
+        stats = self.stats()
+        if any(stats.values()):
+            logger.info(
+                "HTTP cache: " + ", ".join(f"{value} {key}" for key, value in stats.items()),
+                extra={"event": "http_cache_stats", **stats}
+            )
+        self.conn.close()
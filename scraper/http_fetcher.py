@@ -0,0 +1,212 @@
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from scraper.enums import ReplayMode
+from scraper.governor import THROTTLE_STATUSES, RateGovernor
+from scraper.http_cache import CLAIM_POLL_INTERVAL, CachedResponse, HttpCache
+from scraper.replay import SnapshotStore, replay_mode, snapshot_store
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Connection": "keep-alive",
+}
+
+
+class HttpFetcher:
+    """
+    Fetches pages over a pooled keep-alive requests.Session, used instead of a WebDriver
+    wherever the data is available in plain HTML/XHR responses.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        timeout: float = 10,
+        max_retries: int = 2,
+        backoff_factor: float = 0.5,
+        headers: Optional[Dict[str, str]] = None,
+        recorder: Optional[SnapshotStore] = None,
+        cache: Optional[HttpCache] = None,
+        governor: Optional[RateGovernor] = None
+    ):
+        """
+        Initialize the fetcher.
+
+        Args:
+            pool_size (int): connections kept alive per host; should be >= the fetch concurrency.
+            timeout (float): connect/read timeout per request in seconds.
+            max_retries (int): retries for connection errors and 5xx/429 responses.
+            backoff_factor (float): exponential backoff factor between retries.
+            headers (dict): extra headers merged over DEFAULT_HEADERS.
+            recorder (SnapshotStore): when set, every response is saved to it for offline replay.
+            cache (HttpCache): when set, fresh responses are served from disk and stale ones revalidated.
+            governor (RateGovernor): when set, every request that reaches the network waits for a per-host slot.
+        """
+        self.timeout = timeout
+        self.recorder = recorder
+        self.cache = cache
+        self.governor = governor
+        self.session = requests.Session()
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+            raise_on_status=False,  # hand back the last response, so it is recorded and its Retry-After seen
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.headers.update(headers or {})
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "HttpFetcher":
+        """
+        Create a fetcher from the `http:` section of the config, with the `http.cache` disk cache and the
+        `governor` rate limiter when enabled, recording responses in `replay.mode: record`.
+        """
+        http_config = config.get("http", {})
+        recording = replay_mode(config) == ReplayMode.RECORD
+        return cls(
+            pool_size=http_config.get("pool_size", 10),
+            timeout=http_config.get("timeout", 10),
+            max_retries=http_config.get("max_retries", 2),
+            backoff_factor=http_config.get("backoff_factor", 0.5),
+            headers=http_config.get("headers"),
+            recorder=snapshot_store(config) if recording else None,
+            cache=HttpCache.from_config(config),
+            governor=RateGovernor.from_config(config),
+        )
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET the given URL on the pooled session and raise for HTTP error statuses (recorded first, so replay
+        ends pagination the same way). With a cache, fresh entries are returned without a request and stale
+        ones are revalidated with a conditional GET. A missing or stale URL is claimed first: while another
+        thread or worker process fetches it, this call waits for that response instead of fetching it again.
+        """
+        entry = self.cache.get(url) if self.cache is not None else None
+        claim = None
+        if self.cache is not None and (entry is None or not self.cache.is_fresh(entry)):
+            claim, entry = self._claim(url, entry)
+        if claim is None and entry is not None and self.cache.is_fresh(entry):
+            self.cache.count("hits")
+            response = self._cached_response(url, entry)
+            self._record(url, response)  # a recording must hold every page, including the ones the cache served
+            return response
+
+        try:
+            headers = dict(kwargs.pop("headers", None) or {})
+            if entry is not None:
+                headers.update(HttpCache.conditional_headers(entry))
+            response = self._send(url, timeout=kwargs.pop("timeout", self.timeout), headers=headers, **kwargs)
+            if entry is not None and response.status_code == 304:
+                self.cache.refresh(url)
+                self.cache.count("revalidated")
+                response = self._cached_response(url, entry)
+            elif self.cache is not None:
+                self.cache.count("misses")
+                if response.status_code == 200:
+                    self.cache.put(
+                        url, response.status_code, response.content, response.headers.get("Content-Type"),
+                        response.headers.get("ETag"), response.headers.get("Last-Modified")
+                    )
+        finally:
+            if claim is not None:
+                self.cache.release(claim)
+        self._record(url, response)
+        response.raise_for_status()
+        return response
+
+    def _claim(self, url: str, entry: Optional[CachedResponse]) -> Tuple[Optional[int], Optional[CachedResponse]]:
+        """
+        Claim the fetch of a missing or stale URL in the cache, polling while another fetcher holds the claim.
+
+        Returns:
+            tuple: the claim id (None when the entry turned fresh meanwhile) and the latest cache entry
+        """
+        waited = False
+        while True:
+            claim = self.cache.claim(url)
+            if claim is not None:
+                entry = self.cache.get(url)  # the previous holder may have stored it just before releasing
+                if entry is not None and self.cache.is_fresh(entry):
+                    self.cache.release(claim)
+                    claim = None
+                break
+            waited = True
+            time.sleep(CLAIM_POLL_INTERVAL)
+            entry = self.cache.get(url)
+            if entry is not None and self.cache.is_fresh(entry):
+                break
+        if waited:
+            self.cache.count("waits")
+        return claim, entry
+
+    def _record(self, url: str, response: requests.Response):
+        """Save the response to the snapshot recorder, when recording."""
+        if self.recorder is not None:
+            self.recorder.save(
+                url, response.status_code, response.content, response.headers.get("Content-Type", "text/html")
+            )
+
+    def _send(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET on the session, inside a governor slot when rate limiting is enabled. A 429/503 that urllib3 retried
+        away, or gave up on, still counts as throttling.
+        """
+        if self.governor is None:
+            return self.session.get(url, **kwargs)
+        with self.governor.slot(url) as permit:
+            response = self.session.get(url, **kwargs)
+            retries = getattr(response.raw, "retries", None)
+            statuses = [attempt.status for attempt in getattr(retries, "history", ())] + [response.status_code]
+            permit.record(
+                next((status for status in statuses if status in THROTTLE_STATUSES), response.status_code),
+                response.headers.get("Retry-After")
+            )
+            return response
+
+    def governor_stats(self) -> Dict[str, float]:
+        """Request/wait/throttle counters of the rate governor, empty without one."""
+        return self.governor.stats() if self.governor is not None else {}
+
+    @staticmethod
+    def _cached_response(url: str, entry: CachedResponse) -> requests.Response:
+        """Build a requests.Response from a cache entry."""
+        response = requests.Response()
+        response.url = url
+        response.status_code = entry.status
+        response._content = entry.body
+        if entry.content_type:
+            response.headers["Content-Type"] = entry.content_type
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit/revalidated/miss/store/eviction/wait counters of the disk cache, empty without one."""
+        return self.cache.stats() if self.cache is not None else {}
+
+    def get_text(self, url: str, **kwargs) -> str:
+        """GET the given URL and return the decoded response body."""
+        return self.get(url, **kwargs).text
+
+    def close(self):
+        """Close every pooled connection, the disk cache (logging its counters) and the governor state."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+        if self.governor is not None:
+            self.governor.close()
+
+    def __enter__(self) -> "HttpFetcher":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
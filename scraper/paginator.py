@@ -1,7 +1,9 @@
 from logging import Logger
+from typing import Iterator, Optional
 
 from scraper.click_executor import ClickExecutor
 from scraper.enums import ClickStatus
+from scraper.tracing import Span
 
 
 class Paginator:
@@ -10,14 +12,23 @@ class Paginator:
         logger: Logger,
         executor: ClickExecutor,
         max_idle_clicks: int = 3,
-        item_selector: str = "product_card"
+        item_selector: str = "product_card",
+        trace: Optional[Span] = None
     ):
         self.executor = executor
         self.logger = logger
         self.max_idle_clicks = max_idle_clicks
         self.item_selector = item_selector
+        self.trace = trace if trace is not None else Span("paginate")
+        # True when pagination ended on an error (item count unavailable, failed click) rather than running out.
+        self.failed = False
 
     def scroll_until_done(self) -> None:
+        for _ in self.iter_clicks():
+            pass
+
+    def iter_clicks(self) -> Iterator[int]:
+        """Click 'Load More' until no new items appear, yielding the click number after each successful click."""
         clicks: int = 0
         idle_clicks: int = 0
 
@@ -25,17 +36,21 @@ class Paginator:
             prev_count = self.executor.get_count(self.item_selector)
             if prev_count is None:
                 self.logger.error("Cannot determine number of items.")
+                self.failed = True
                 break
 
-            status = self.executor.try_click_and_wait(
-                "load_more",
-                lambda: (count := self.executor.get_count(self.item_selector)) is not None and count > prev_count
-            )
+            with self.trace.span("click", items_before=prev_count) as span:
+                status = self.executor.try_click_and_wait(
+                    "load_more",
+                    lambda: (count := self.executor.get_count(self.item_selector)) is not None and count > prev_count
+                )
+                span.set(status=status.value, wait_seconds=round(self.executor.last_wait, 6))
 
             if status == ClickStatus.SUCCESS:
                 clicks += 1
                 idle_clicks = 0
                 self.logger.debug(f"Click #{clicks} succeeded, more items loaded.")
+                yield clicks
 
             elif status in (ClickStatus.NO_NEW_ITEMS, ClickStatus.BUTTON_HIDDEN):
                 button_visible = self.executor.is_button_present_and_visible("load_more")
@@ -49,6 +64,8 @@ class Paginator:
 
             else:
                 self.logger.error("Click failed. Ending pagination.")
+                self.failed = True
                 break
 
+        self.trace.set(clicks=clicks, idle_clicks=idle_clicks)
         self.logger.info(f"Pagination done. {clicks} clicks, {idle_clicks} idle attempts.")
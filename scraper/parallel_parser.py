@@ -0,0 +1,118 @@
+import copy
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Pattern, Sequence, Tuple
+
+from scraper.tracing import Span
+
+# `tag`, `.class` or `tag.class`: card selectors whose opening tags can be found without parsing the page.
+_SIMPLE_SELECTOR = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*)?(?:\.(?P<cls>[\w-]+))?$")
+
+# Per-process state of a parse worker: its own extractor, CardParser and ProductConverter.
+_worker: Dict[str, Any] = {}
+
+
+def card_start_pattern(selector: str) -> Optional[Pattern]:
+    """
+    Build a regex matching the opening tag of every card for a simple card selector.
+
+    Returns:
+        Pattern, or None when the selector is too complex to locate cards without a parse tree.
+    """
+    match = _SIMPLE_SELECTOR.match(selector.strip())
+    if not match or not (match.group("tag") or match.group("cls")):
+        return None
+    tag = re.escape(match.group("tag")) if match.group("tag") else r"[a-zA-Z][\w-]*"
+    if not match.group("cls"):
+        return re.compile(rf"<{tag}\b", re.IGNORECASE)
+    cls = re.escape(match.group("cls"))
+    return re.compile(
+        rf"<{tag}\b[^>]*?\sclass\s*=\s*[\"']?(?:[^\"'>]*?\s)?{cls}(?=[\s\"'>])", re.IGNORECASE
+    )
+
+
+def card_shards(html: str, selector: str, cards_per_shard: int) -> Optional[List[str]]:
+    """
+    Split a listing page into HTML fragments of about `cards_per_shard` cards each, cutting the text in front of
+    card opening tags so every card lands whole in exactly one fragment. The first fragment keeps the page head.
+
+    Returns:
+        List[str] in page order, or None when the selector is not simple or the page has too few cards to split.
+    """
+    pattern = card_start_pattern(selector)
+    if pattern is None:
+        return None
+    starts = [match.start() for match in pattern.finditer(html)]
+    if len(starts) <= cards_per_shard:
+        return None
+    cuts = [0] + starts[cards_per_shard::cards_per_shard] + [len(html)]
+    return [html[start:end] for start, end in zip(cuts, cuts[1:])]
+
+
+def _init_worker(config: dict[str, Any], category: str):
+    """Create the worker's extractor and CardParser once; workers never start nested pools."""
+    from scraper.product_list_extractor import ProductListExtractor
+
+    config = copy.deepcopy(config)
+    config["products"]["parse_workers"] = 1
+    extractor = ProductListExtractor(None, config, category)
+    _worker["extractor"] = extractor
+    _worker["parser"] = extractor._card_parser()
+
+
+def _parse_shard(html: str, structured: bool) -> Tuple[list, float, int]:
+    """Parse one fragment in the worker, returning its products, the worker's seconds and its card count."""
+    start = time.perf_counter()
+    extractor = _worker["extractor"]
+    cards = extractor._select_cards(html)
+    products = list(extractor._parse_cards(cards, _worker["parser"], structured))
+    return products, time.perf_counter() - start, len(cards)
+
+
+def _run_in_worker(job: Callable, *args) -> Any:
+    """Run a module-level `job(extractor, *args)` with the worker's extractor."""
+    return job(_worker["extractor"], *args)
+
+
+class ParallelParser:
+    """
+    Process pool that parses card shards of large pages, or whole saved pages, on every core.
+    Each worker keeps its own extractor, CardParser and ProductConverter; results come back in input order.
+    """
+
+    def __init__(self, config: dict[str, Any], category: str, workers: int, trace: Optional[Span] = None):
+        """
+        Args:
+            config (dict): Configuration dictionary passed to every worker.
+            category (str): category whose selectors the workers use.
+            workers (int): number of worker processes.
+            trace (Span): span that receives the aggregated `parse_shard` child span.
+        """
+        self.workers = workers
+        self.trace = trace if trace is not None else Span("parallel_parse")
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config, category))
+
+    def parse_shards(self, shards: Sequence[str], structured: bool) -> Iterator[Any]:
+        """
+        Yield the products of all shards in page order, each shard's products as soon as it and every shard
+        before it are done, so writers start while later shards are still being parsed.
+        """
+        shard_span = self.trace.child("parse_shard")
+        for products, seconds, cards in self.pool.map(_parse_shard, shards, [structured] * len(shards)):
+            shard_span.add(seconds, cards=cards, products=len(products))
+            yield from products
+
+    def map(self, job: Callable, *iterables) -> Iterator[Any]:
+        """Run `job(extractor, *args)` in the workers for every argument tuple, yielding results in order."""
+        iterables = [list(iterable) for iterable in iterables]
+        return self.pool.map(_run_in_worker, [job] * len(iterables[0]), *iterables)
+
+    def close(self):
+        self.pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,6 +1,7 @@
 from scraper.description_parser import DescriptionParser
-from scraper.models import StructuredProduct
+from scraper.models import STRUCTURED_PRODUCT_LIST, RawProduct, StructuredProduct
 from datetime import datetime,timezone
+from typing import List, Optional, Sequence
 
 class ProductConverter:
     def __init__(self, currency_rates: dict = None, target_currency: str = "USD"):
@@ -8,17 +9,42 @@ class ProductConverter:
         self.target_currency = target_currency.upper()
 
     def to_structured(self, raw):
+        return self.to_structured_batch([raw])[0]
+
+    def to_structured_batch(
+        self,
+        raws: Sequence[RawProduct],
+        scraped_at: Optional[datetime] = None
+    ) -> List[StructuredProduct]:
+        """
+        Convert a batch of validated RawProduct objects with one rate lookup and one timestamp.
+
+        The RawProduct validators already coerced every field, so the whole batch is checked in a single
+        TypeAdapter pass instead of one StructuredProduct validation per product.
+
+        Args:
+            raws: RawProduct objects, e.g. the result of CardParser.parse_batch.
+            scraped_at: timestamp for the whole batch; defaults to now (UTC).
+
+        Returns:
+            List[StructuredProduct]: one product per input, in the same order.
+        """
         rate = self.rates.get(self.target_currency, 1.0)
-        converted_price = round(raw.price_usd * rate, 2)
-        parsed = DescriptionParser.parse(raw.description_raw or "", raw.name)
-        return StructuredProduct(
-            name=raw.name,
-            price=converted_price,
-            currency=self.target_currency,
-            rating=raw.rating,
-            num_reviews=raw.num_reviews,
-            description=raw.description_raw or "",
-            url=raw.url,
-            last_scraped=datetime.now(timezone.utc),
-            **parsed
-        )
+        currency = self.target_currency
+        scraped_at = scraped_at or datetime.now(timezone.utc)
+        prices = [round(raw.price_usd * rate, 2) for raw in raws]
+        parse = DescriptionParser.parse
+        return STRUCTURED_PRODUCT_LIST.validate_python([
+            dict(
+                name=raw.name,
+                price=price,
+                currency=currency,
+                rating=raw.rating,
+                num_reviews=raw.num_reviews,
+                description=raw.description_raw or "",
+                url=raw.url,
+                last_scraped=scraped_at,
+                **parse(raw.description_raw or "", raw.name)
+            )
+            for raw, price in zip(raws, prices)
+        ])
@@ -1,14 +1,121 @@
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import requests
+from bs4 import BeautifulSoup
 
 from scraper.base_extractor import BaseExtractor
+from scraper.description_parser import DescriptionParser
 from scraper.models import StructuredProduct, RawProduct
+from scraper.product_converter import ProductConverter
+
+SPEC_FIELDS = ("brand", "screen_inches", "ram_gb", "storage_gb", "cpu", "os")
 
 
 class ProductDetailExtractor(BaseExtractor):
     """
-    Placeholder class for future product detail scraping from product URLs.
-    Currently returns a StructuredProduct from RawProduct without modifications.
+    Fetches product detail pages concurrently and merges the real star rating and any extra
+    specs found there into StructuredProduct. Listing pages always show five stars, so the
+    detail page is the only reliable source for `rating`.
     """
 
-    def extract(self, product: RawProduct) -> List[StructuredProduct]:
-        self.logger.warning("Detail extraction not yet implemented. Returning raw product as structured.")
+    def extract(self, products: Iterable[Union[RawProduct, StructuredProduct]]) -> List[StructuredProduct]:
+        """
+        Enrich listing products with data from their detail pages.
+
+        Args:
+            products: RawProduct or StructuredProduct objects from ProductListExtractor.
+
+        Returns:
+            List[StructuredProduct]: enriched products, in the same order as the input.
+        """
+        converter = ProductConverter(
+            self.products_config.get("currency_rates") or {"USD": 1.0},
+            self.products_config.get("target_currency") or "USD"
+        )
+        products = list(products)
+        converted = iter(converter.to_structured_batch([p for p in products if not isinstance(p, StructuredProduct)]))
+        structured = [p if isinstance(p, StructuredProduct) else next(converted) for p in products]
+        urls = list(dict.fromkeys(product.url for product in structured))
+        concurrency = max(1, self.config.get("detail", {}).get("concurrency", 8))
+        self.logger.info(f"Fetching {len(urls)} detail pages with concurrency {concurrency}")
+        start = time.time()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            details = dict(zip(urls, pool.map(self._fetch_detail, urls)))
+
+        enriched = [self._merge(product, details[product.url]) for product in structured]
+        elapsed = time.time() - start
+        fetched = sum(1 for detail in details.values() if detail is not None)
+        self.logger.info(f"Merged {fetched}/{len(urls)} detail pages in {elapsed:.2f} seconds")
+        return enriched
+
+    def _fetch_detail(self, url: str) -> Optional[Dict[str, Any]]:
+        """Fetch and parse one detail page, returning None when it cannot be fetched."""
+        try:
+            start = time.perf_counter()
+            html = self.fetcher.get_text(url)
+            fetched = time.perf_counter()
+            self.trace.child("fetch").add(fetched - start, pages=1, bytes=len(html))
+            detail = self._parse_detail(html)
+            self.trace.child("parse").add(time.perf_counter() - fetched)
+            return detail
+        except requests.RequestException as e:
+            self.logger.warning(
+                f"Failed to fetch detail page {url}: {e}",
+                extra={"event": "detail_fetch_failed", "url": url, "error": str(e)}
+            )
+            return None
+
+    def _parse_detail(self, html: str) -> Dict[str, Any]:
+        """
+        Extract rating, description and configured extra specs from a detail page.
+
+        Returns:
+            dict: `rating` (float or None), `description` (str or None) and `specs` (dict of joined texts)
+        """
+        detail_config = self.config.get("detail", {})
+        selectors = detail_config.get("selectors", {})
+        soup = BeautifulSoup(html, "html.parser")
+
+        rating = None
+        rating_tag = soup.select_one(selectors.get("rating", "div.ratings p[data-rating]"))
+        if rating_tag is not None:
+            value = rating_tag.get(selectors.get("rating_attr", "data-rating"))
+            try:
+                rating = float(value) if value is not None else float(len(rating_tag.select(".ws-icon-star")))
+            except ValueError:
+                rating = None
+
+        description_tag = soup.select_one(selectors.get("description", ".description"))
+        description = description_tag.get_text(strip=True) if description_tag else None
+
+        specs = {}
+        for name, selector in (detail_config.get("specs") or {}).items():
+            values = [tag.get_text(strip=True) for tag in soup.select(selector)]
+            if values:
+                specs[name] = ", ".join(values)
+
+        return {"rating": rating, "description": description, "specs": specs}
+
+    @staticmethod
+    def _merge(product: StructuredProduct, detail: Optional[Dict[str, Any]]) -> StructuredProduct:
+        """Overlay detail page data on a listing product; listing values win for specs it already has."""
+        if not detail:
+            return product
+
+        update: Dict[str, Any] = {}
+        if detail["rating"] is not None:
+            update["rating"] = detail["rating"]
+        if detail["description"]:
+            parsed = DescriptionParser.parse(detail["description"], product.name)
+            update.update({
+                field: parsed[field] for field in SPEC_FIELDS
+                if getattr(product, field) is None and parsed[field] is not None
+            })
+            if not product.description:
+                update["description"] = detail["description"]
+        if detail["specs"]:
+            update["specs"] = {**(product.specs or {}), **detail["specs"]}
+        return product.model_copy(update=update)
@@ -1,13 +1,34 @@
 import time
+from contextlib import nullcontext
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
-from typing import List, Union
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional, Sequence, Union
 
 from scraper.base_extractor import BaseExtractor
+from scraper.card_harvester import CardHarvester
 from scraper.card_parser import CardParser
-from scraper.click_executor import ClickExecutor
+from scraper.checkpoint import PaginationCheckpoint
+from scraper.enums import DomPruning, ExtractionBackend, FetchMode, HtmlParser, PaginationMode
+from scraper.html_backends import create_html_backend
 from scraper.models import RawProduct, StructuredProduct
-from scraper.paginator import Paginator
+from scraper.parallel_parser import ParallelParser, card_shards
+from scraper.script_extractor import ScriptCardExtractor
+from scraper.tracing import Span
+
+if TYPE_CHECKING:
+    from scraper.paginator import Paginator
+    from scraper.script_paginator import ScriptPaginator
+
+# Counts the resources the page has loaded so far and their transferred bytes (Resource Timing API).
+_PAGE_WEIGHT_SCRIPT = """
+var entries = performance.getEntriesByType('resource'), bytes = 0;
+for (var i = 0; i < entries.length; i++) { bytes += entries[i].transferSize || 0; }
+return [entries.length, bytes];
+"""
+
+# Cards validated and converted per TypeAdapter pass; bounds memory while keeping the parse lazy.
+PARSE_BATCH_SIZE = 1000
 
 
 class ProductListExtractor(BaseExtractor):
@@ -16,19 +37,58 @@ class ProductListExtractor(BaseExtractor):
     Responsible for navigating, paginating, and parsing all product data into structured models.
     """
 
-    def extract(self) -> List[Union[RawProduct, StructuredProduct]]:
+    _html_backend = None
+    _pagination_failed = False
+    _click_executor = None
+
+    def extract(self, structured: Optional[bool] = None) -> Iterable[Union[RawProduct, StructuredProduct]]:
         """
         Main entrypoint: navigates to the category page, paginates until done,
         and extracts all products as RawProduct or StructuredProduct objects.
 
+        With `products.streaming` enabled, returns a generator that yields products
+        after every successful 'Load More' click while pagination continues.
+        With `products.fetch_mode: http` no browser is used: the category page and the
+        'Load More' endpoint are fetched directly over a pooled HTTP session.
+        Every phase (navigation, pagination clicks, page_source transfer, parse, convert) is timed under `self.trace`.
+
+        Args:
+            structured (bool): overrides `global.structured_products_data`, e.g. to get RawProduct for a ProductStore
+
         Returns:
-            List[RawProduct | StructuredProduct]: all extracted product data
+            Iterable[RawProduct | StructuredProduct]: all extracted product data
         """
-        self.driver.get(self._category_url())
+        if structured is None:
+            structured = self.config["global"]["structured_products_data"]
+        if self._fetch_mode() == FetchMode.HTTP:
+            products = self._extract_http(structured)
+            return products if self.products_config.get("streaming", False) else list(products)
+
+        url = self._category_url()
+        with self.trace.span("navigate", url=url) as span:
+            with self.governor.slot(url) if self.governor is not None else nullcontext() as permit:
+                if permit is not None:
+                    permit.timed = False  # a full page load is no sample of the host's request latency
+                self.driver.get(url)
+            span.set(**self._page_weight())
+        if self.products_config.get("streaming", False):
+            self.logger.info(f"Streaming {'structured' if structured else 'raw'} products")
+            return self._extract_streaming(structured)
+
+        if self.config.get("checkpoint", {}).get("enabled", False):
+            self.logger.warning("checkpoint.enabled needs products.streaming in browser mode; not checkpointing.")
+        if self._dom_pruning() != DomPruning.OFF:
+            self.logger.warning("products.dom_pruning needs products.streaming; keeping every card in the DOM.")
         self._paginate()
-        html = self.driver.page_source
-        structured = self.config["global"]["structured_products_data"]
         self.logger.info(f"Extracting {'structured' if structured else 'raw'} products")
+        if self._extraction_backend() == ExtractionBackend.SCRIPT:
+            with self.trace.span("script_extract") as span:
+                rows = self._script_extractor().extract()
+                span.set(rows=len(rows))
+            return self._parse_rows(rows, structured)
+        with self.trace.span("page_source") as span:
+            html = self.driver.page_source
+            span.set(bytes=len(html))
         return self._parse_products(html, structured)
 
     def _category_url(self) -> str:
@@ -41,51 +101,530 @@ class ProductListExtractor(BaseExtractor):
         category_url = self.config["products"]["category_url"]
         return urljoin(self.config["base_url"], f"{category_url.rstrip('/')}/{self.category_key}")
 
+    def _paginator(self, trace: Optional[Span] = None) -> Union["Paginator", "ScriptPaginator"]:
+        """
+        Builds the paginator for the configured `products.pagination_mode`: a Paginator backed by a
+        ClickExecutor, or a ScriptPaginator that runs the whole loop inside the browser.
+
+        Args:
+            trace (Span): span that receives one child span per click
+
+        Returns:
+            Paginator | ScriptPaginator: paginator for the currently loaded category page
+        """
+        # Selenium-backed modules are imported on first use, so parsing saved HTML never loads selenium.
+        from scraper.click_executor import ClickExecutor
+        from scraper.paginator import Paginator
+        from scraper.script_paginator import ScriptPaginator
+
+        max_idle_clicks = self.products_config.get("max_load_more_idle_clicks", 3)
+        mode = PaginationMode(self.products_config.get("pagination_mode", PaginationMode.WEBDRIVER.value))
+        if mode == PaginationMode.SCRIPT:
+            browser_config = self.config.get("browser", {})
+            return ScriptPaginator(
+                driver=self.driver,
+                logger=self.logger,
+                get_selector=self.get_selector,
+                max_idle_clicks=max_idle_clicks,
+                button_wait_time=self.config["products"]["load_more_button_wait_time"],
+                content_wait_time=self.config["products"]["load_cards_wait_time"],
+                wait_after_click_ms=browser_config.get("wait_after_click_ms", 0),
+                scroll_into_view=browser_config.get("scroll_into_view_before_click", True),
+                script_timeout=self.products_config.get("pagination_script_timeout", 600),
+                trace=trace
+            )
+
+        # One ClickExecutor per extractor, so waits learned while fast-forwarding a resumed run carry over.
+        if self._click_executor is None:
+            self._click_executor = ClickExecutor(
+                driver=self.driver,
+                logger=self.logger,
+                get_selector=self.get_selector,
+                button_wait_time=self.config["products"]["load_more_button_wait_time"],
+                content_wait_time=self.config["products"]["load_cards_wait_time"],
+                adaptive_waits=self.products_config.get("adaptive_waits"),
+                governor=self.governor,
+                page_url=self._category_url()
+            )
+        return Paginator(
+            executor=self._click_executor, logger=self.logger, max_idle_clicks=max_idle_clicks, trace=trace
+        )
+
+    @property
+    def pagination_failed(self) -> bool:
+        """
+        True when the last extraction's pagination ended on an error (a failed click, or a 'Load More' page that
+        could not be fetched) rather than running out, so the listing may be incomplete.
+        """
+        return self._pagination_failed
+
+    def wait_stats(self) -> dict:
+        """
+        Returns the button and content wait statistics of the webdriver pagination (observed durations,
+        learned timeout and poll interval), or an empty dict when no ClickExecutor was used.
+        """
+        return self._click_executor.wait_stats() if self._click_executor is not None else {}
+
     def _paginate(self):
         """
         Uses a ClickExecutor and Paginator to load all products
         by clicking 'Load More' buttons until all items are visible.
         """
-        click_executor = ClickExecutor(
-            driver=self.driver,
-            logger=self.logger,
-            get_selector=self.get_selector,
-            button_wait_time=self.config["products"]["load_more_button_wait_time"],
-            content_wait_time=self.config["products"]["load_cards_wait_time"]
-        )
+        with self.trace.span("paginate") as span:
+            paginator = self._paginator(span)
+            paginator.scroll_until_done()
+        self._pagination_failed = paginator.failed
+        span.set(**self._page_weight())
 
-        paginator = Paginator(executor=click_executor, logger=self.logger)
-        paginator.scroll_until_done()
+    def _page_weight(self) -> dict:
+        """
+        Returns the number of resources the page has loaded and their transferred bytes, so the trace shows
+        what `browser.block_resources` saves; empty when blocking is disabled (no extra round trip per
+        navigation) or the browser does not expose resource timings.
+        """
+        if not (self.config.get("browser", {}).get("block_resources") or {}).get("enabled", False):
+            return {}
+        try:
+            resources, transferred = self.driver.execute_script(_PAGE_WEIGHT_SCRIPT)
+        except Exception as e:
+            self.logger.debug(f"Resource timings unavailable: {e}")
+            return {}
+        return {"resources": resources, "transfer_bytes": transferred}
 
-    def _parse_products(self, html: str, structured: bool = True) -> List[Union[StructuredProduct, RawProduct]]:
+    def _extract_streaming(self, structured: bool) -> Iterator[Union[RawProduct, StructuredProduct]]:
         """
-        Parses product cards from the given HTML and returns a list of structured product models.
+        Harvests and parses only the newly appended cards after every successful 'Load More' click.
+        With `checkpoint.enabled` the products and the click/harvest progress are journaled after every harvest;
+        a resumed run emits the journal, re-clicks to the saved click count without parsing and harvests from
+        the saved card index on. A pagination error then raises instead of ending the category early.
 
         Args:
-            html (str): the full HTML source of the loaded category page
+            structured (bool): whether to yield StructuredProduct instead of RawProduct
 
-        Returns:
-            List[RawProduct]: parsed product data
+        Yields:
+            RawProduct | StructuredProduct: parsed product data, in page order
         """
-        soup = BeautifulSoup(html, "html.parser")
-        cards = soup.select(self.get_selector("product_card"))
-        self.logger.info(f"Found {len(cards)} product cards")
+        parser = self._card_parser()
+        use_script = self._extraction_backend() == ExtractionBackend.SCRIPT
+        pruning = self._dom_pruning()
+        if use_script:
+            harvester = self._script_extractor(pruning)
+        else:
+            harvester = CardHarvester(
+                driver=self.driver, logger=self.logger, get_selector=self.get_selector, pruning=pruning
+            )
+        start = time.time()
+        checkpoint = self._checkpoint(structured)
+        state, resumed = checkpoint.resume() if checkpoint else ({}, [])
+        resumed_urls = {product.url for product in resumed}
+        count = len(resumed)
+        yield from resumed
+        resume_clicks = state.get("clicks", 0)
+        if resume_clicks:
+            self._fast_forward(resume_clicks)
+        harvester.harvested = state.get("harvested", 0)
+
+        harvest_span = self.trace.child("harvest")
+        for clicks in self._iter_pages():
+            harvest_start = time.perf_counter()
+            batch = harvester.harvest()
+            harvest_span.add(time.perf_counter() - harvest_start, cards=len(batch))
+            harvest_span.set(pruned=harvester.pruned)
+            if not batch:
+                continue
+            if use_script:
+                products = self._parse_fields(batch, parser, structured, self.trace)
+            else:
+                html = "".join(batch)
+                harvest_span.add(calls=0, bytes=len(html))
+                select_start = time.perf_counter()
+                cards = self._select_cards(html)
+                self.trace.child("select").add(time.perf_counter() - select_start, cards=len(cards))
+                products = self._parse_cards(cards, parser, structured, self.trace)
+            products = self._checkpointed(
+                products, checkpoint, resumed_urls, clicks=resume_clicks + clicks, harvested=harvester.harvested
+            )
+            for product in products:
+                count += 1
+                yield product
+
+        if checkpoint is not None:
+            if self._pagination_failed:
+                checkpoint.close()
+                raise RuntimeError(
+                    f"Pagination failed after {checkpoint.state.get('clicks', 0)} clicks; "
+                    f"checkpoint kept in {checkpoint.state_path} for the next attempt"
+                )
+            checkpoint.clear()
+        elapsed = time.time() - start
+        self.logger.info(
+            f"Streamed {count} {'structured' if structured else 'raw'} products from "
+            f"{harvester.harvested} cards in {elapsed:.2f} seconds")
+
+    def _extract_http(self, structured: bool) -> Iterator[Union[RawProduct, StructuredProduct]]:
+        """
+        Fetches the category page, then pages through the 'Load More' endpoint with bounded concurrency
+        and parses each response with the same CardParser as the browser path. Stops at the first page
+        that returns no cards that were not already seen. With `checkpoint.enabled` every page's products
+        and the next page number are journaled, and a resumed run continues at that page.
+
+        Args:
+            structured (bool): whether to yield StructuredProduct instead of RawProduct
+
+        Yields:
+            RawProduct | StructuredProduct: parsed product data, in page order
+        """
+        http_config = self.config.get("http", {})
+        concurrency = max(1, http_config.get("concurrency", 4))
+        max_pages = http_config.get("max_pages", 200)
+        first_page = self.products_config.get("load_more_start_page", 2)
+        parser = self._card_parser()
+        seen = set()
         start = time.time()
+        checkpoint = self._checkpoint(structured)
+        state, resumed = checkpoint.resume() if checkpoint else ({}, [])
+        resumed_urls = {product.url for product in resumed}
+        count = len(resumed)
+        yield from resumed
+
+        next_page, last_page = state.get("next_page", first_page), first_page + max_pages
+        # `page` is the number of the page being parsed; the category page counts as the one before first_page,
+        # so its products are journaled with next_page=first_page.
+        page = first_page - 2
+        pages = iter([] if state else [self._fetch_page(self._category_url())])
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            while True:
+                exhausted = False
+                for html in pages:
+                    page += 1
+                    cards = self._unseen_cards(self._select_cards(html) if html else [], seen)
+                    if not cards:
+                        exhausted = True
+                        break
+                    products = self._parse_cards(cards, parser, structured, self.trace)
+                    for product in self._checkpointed(products, checkpoint, resumed_urls, next_page=page + 1):
+                        count += 1
+                        yield product
+                if exhausted:
+                    break
+                if next_page >= last_page:
+                    self.logger.warning(f"Stopped after {max_pages} 'Load More' pages (http.max_pages).")
+                    break
+                batch = range(next_page, min(next_page + concurrency, last_page))
+                next_page = batch.stop
+                page = batch.start - 1
+                pages = pool.map(self._fetch_load_more_page, batch)
+
+        if checkpoint is not None:
+            checkpoint.clear()
+
+        elapsed = time.time() - start
+        self.logger.info(
+            f"Fetched {len(seen)} cards over HTTP and parsed {count} "
+            f"{'structured' if structured else 'raw'} products in {elapsed:.2f} seconds")
+
+    def _load_more_url(self, page: int) -> str:
+        """
+        Builds the URL of the endpoint behind the 'Load More' button for the given page,
+        from the `products.load_more_url` template (`{url}` is the category URL).
+        """
+        template = self.products_config.get("load_more_url", "{url}?page={page}")
+        return urljoin(self.config["base_url"], template.format(url=self._category_url(), page=page))
+
+    def _fetch_load_more_page(self, page: int) -> Optional[str]:
+        """
+        Fetches one 'Load More' page, returning None when the endpoint has no such page. Errors other than a
+        4xx answer (connection errors, 429, 5xx) also end pagination but mark it as failed.
+        """
+        import requests
+
+        url = self._load_more_url(page)
+        try:
+            return self._fetch_page(url)
+        except requests.RequestException as e:
+            status = e.response.status_code if e.response is not None else None
+            if status is None or status == 429 or status >= 500:
+                self._pagination_failed = True
+            self.logger.info(
+                f"'Load More' page {page} unavailable, ending pagination.",
+                extra={"event": "load_more_unavailable", "url": url, "error": str(e)}
+            )
+            return None
+
+    def _fetch_page(self, url: str) -> str:
+        """Fetches one page over HTTP, adding its time and size to the aggregated `fetch` span."""
+        start = time.perf_counter()
+        html = self.fetcher.get_text(url)
+        self.trace.child("fetch").add(time.perf_counter() - start, pages=1, bytes=len(html))
+        return html
+
+    def _unseen_cards(self, cards: list, seen: set) -> list:
+        """Filters out cards already returned by an earlier page, recording the keys of the new ones in `seen`."""
+        fresh = []
+        for card in cards:
+            key = self._card_key(card)
+            if key not in seen:
+                seen.add(key)
+                fresh.append(card)
+        return fresh
+
+    def _card_key(self, card) -> str:
+        """
+        Identifies a card by its product link, read through the HTML backend so it works for every parser
+        (a selectolax node has no markup in `str()`); cards without a link fall back to their text.
+        """
+        backend = self.html_backend
+        link = backend.select_one(card, self.get_selector("product_link"))
+        href = backend.attr(link, "href") if link is not None else None
+        return href or backend.text(card)
+
+    def _iter_pages(self) -> Iterator[int]:
+        """
+        Yields the number of completed clicks once for the initially loaded page, once after every
+        successful 'Load More' click and once more after pagination ends, so late-rendered cards are harvested too.
+        Sets `_pagination_failed` when pagination ended on an error.
+        """
+        yield 0
+        clicks = 0
+        paginator = self._paginator(self.trace.child("paginate"))
+        for clicks in paginator.iter_clicks():
+            yield clicks
+        self._pagination_failed = paginator.failed
+        yield clicks
 
+    def _fast_forward(self, clicks: int):
+        """Clicks 'Load More' until `clicks` clicks succeeded (or pagination ends) without harvesting anything."""
+        done = 0
+        with self.trace.span("fast_forward", target=clicks) as span:
+            for done in self._paginator(span).iter_clicks():
+                if done >= clicks:
+                    break
+            span.set(clicks=done)
+        self.logger.info(f"Fast-forwarded {done}/{clicks} 'Load More' clicks of the resumed run.")
+
+    def _checkpoint(self, structured: bool) -> Optional[PaginationCheckpoint]:
+        """Returns this category's PaginationCheckpoint in `checkpoint.dir`, or None unless `checkpoint.enabled`."""
+        checkpoint_config = self.config.get("checkpoint", {})
+        if not checkpoint_config.get("enabled", False):
+            return None
+        fingerprint = {"url": self._category_url(), "mode": self._fetch_mode().value, "structured": structured}
+        return PaginationCheckpoint(checkpoint_config.get("dir", "output/checkpoints"), self.category_key, fingerprint)
+
+    @staticmethod
+    def _checkpointed(
+        products: Iterable[Union[StructuredProduct, RawProduct]],
+        checkpoint: Optional[PaginationCheckpoint],
+        resumed_urls: set,
+        **progress
+    ) -> Iterable[Union[StructuredProduct, RawProduct]]:
+        """Drops products already emitted before a resume and journals the rest together with `progress`."""
+        if checkpoint is None:
+            return products
+        products = [product for product in products if product.url not in resumed_urls]
+        checkpoint.record(products, **progress)
+        return products
+
+    def _fetch_mode(self) -> FetchMode:
+        """Returns the configured fetch mode, defaulting to driving a browser."""
+        return FetchMode(self.products_config.get("fetch_mode", FetchMode.BROWSER.value))
+
+    def _extraction_backend(self) -> ExtractionBackend:
+        """Returns the configured card extraction backend, defaulting to the page_source + BeautifulSoup path."""
+        return ExtractionBackend(self.products_config.get("extraction_backend", ExtractionBackend.PAGE_SOURCE.value))
+
+    def _script_extractor(self, pruning: DomPruning = DomPruning.OFF) -> ScriptCardExtractor:
+        """Builds a ScriptCardExtractor that reads every card's fields in one execute_script call."""
+        return ScriptCardExtractor(
+            driver=self.driver, logger=self.logger, get_selector=self.get_selector, pruning=pruning
+        )
+
+    def _dom_pruning(self) -> DomPruning:
+        """Returns the configured `products.dom_pruning` mode for streaming harvests, defaulting to off."""
+        return DomPruning(self.products_config.get("dom_pruning", DomPruning.OFF.value))
+
+    @property
+    def html_backend(self):
+        """The `products.html_parser` backend, created once per extractor so compiled selectors are reused."""
+        if self._html_backend is None:
+            self._html_backend = create_html_backend(
+                self.products_config.get("html_parser", HtmlParser.HTML_PARSER.value)
+            )
+        return self._html_backend
+
+    def _select_cards(self, html: str) -> list:
+        """Parses the given HTML with the configured backend and returns the product card nodes."""
+        return self.html_backend.select_cards(html, self.get_selector("product_card"))
+
+    def _card_parser(self) -> CardParser:
+        """
+        Builds a CardParser using the configured currency conversion settings.
+
+        Returns:
+            CardParser: parser for individual product cards
+        """
         currency_rates = self.products_config.get("currency_rates")
         target_currency = self.products_config.get("target_currency")
-        parser = CardParser(
+        return CardParser(
             self.get_selector,
             self.config,
             self.logger,
             currency_rates=currency_rates if currency_rates else None,
-            target_currency=target_currency if target_currency else "USD"
+            target_currency=target_currency if target_currency else "USD",
+            backend=self.html_backend
         )
-        if structured:
-            products = [p for card in cards if (p := parser.to_structured(card))]
-        else:
-            products = [p for card in cards if (p := parser.parse(card))]
+
+    @staticmethod
+    def _parse_cards(
+        cards: Iterable,
+        parser: CardParser,
+        structured: bool = True,
+        trace: Optional[Span] = None
+    ) -> Iterator[Union[StructuredProduct, RawProduct]]:
+        """
+        Lazily parses product cards, skipping the ones that fail to parse.
+
+        Args:
+            cards: card nodes from the HTML backend
+            parser (CardParser): parser used for every card
+            structured (bool): whether to yield StructuredProduct instead of RawProduct
+            trace (Span): span that receives the aggregated `parse` and `convert` child spans
+
+        Yields:
+            RawProduct | StructuredProduct: parsed product data
+        """
+        return ProductListExtractor._parse_timed(cards, parser.card_fields, parser, structured, trace)
+
+    @staticmethod
+    def _parse_fields(
+        rows: Iterable[Sequence],
+        parser: CardParser,
+        structured: bool = True,
+        trace: Optional[Span] = None
+    ) -> Iterator[Union[StructuredProduct, RawProduct]]:
+        """
+        Lazily parses card rows extracted in the browser, skipping the ones that fail to parse.
+
+        Args:
+            rows: [name, price, rating, reviews, description, href] rows from ScriptCardExtractor
+            parser (CardParser): parser used for every row
+            structured (bool): whether to yield StructuredProduct instead of RawProduct
+            trace (Span): span that receives the aggregated `parse` and `convert` child spans
+
+        Yields:
+            RawProduct | StructuredProduct: parsed product data
+        """
+        return ProductListExtractor._parse_timed(rows, None, parser, structured, trace)
+
+    @staticmethod
+    def _parse_timed(
+        items: Iterable,
+        fields: Optional[Callable],
+        parser: CardParser,
+        structured: bool,
+        trace: Optional[Span]
+    ) -> Iterator[Union[StructuredProduct, RawProduct]]:
+        """
+        Parses items into RawProduct (and converts them to StructuredProduct when `structured`) in batches of
+        PARSE_BATCH_SIZE, timing both steps separately; the totals are added to `trace` once the iteration ends.
+
+        Args:
+            items: card nodes, or field rows when `fields` is None
+            fields: extracts the field row of one item, e.g. CardParser.card_fields
+        """
+        clock = time.perf_counter
+        parse_seconds = convert_seconds = 0.0
+        items_seen = parsed = 0
+        items = iter(items)
+        try:
+            while True:
+                chunk = list(islice(items, PARSE_BATCH_SIZE))
+                if not chunk:
+                    break
+                items_seen += len(chunk)
+                start = clock()
+                rows = chunk if fields is None else [row for row in map(fields, chunk) if row is not None]
+                products = parser.parse_batch(rows)
+                parsed_at = clock()
+                parse_seconds += parsed_at - start
+                parsed += len(products)
+                if structured:
+                    products = parser.converter.to_structured_batch(products)
+                    convert_seconds += clock() - parsed_at
+                yield from products
+        finally:
+            if trace is not None:
+                trace.child("parse").add(parse_seconds, items=items_seen, products=parsed)
+                if structured:
+                    trace.child("convert").add(convert_seconds, products=parsed)
+
+    def _parse_rows(self, rows: List[Sequence], structured: bool = True) -> List[Union[StructuredProduct, RawProduct]]:
+        """
+        Parses card rows returned by ScriptCardExtractor into product models.
+
+        Args:
+            rows (List[Sequence]): one [name, price, rating, reviews, description, href] row per card
+
+        Returns:
+            List[RawProduct | StructuredProduct]: parsed product data
+        """
+        self.logger.info(f"Found {len(rows)} product cards")
+        start = time.time()
+
+        products = list(self._parse_fields(rows, self._card_parser(), structured, self.trace))
+        elapsed = time.time() - start
+        self.logger.info(
+            f"Parsed {len(products)} {'structured' if structured else 'raw'} products in {elapsed:.2f} seconds")
+        return products
+
+    def _parse_products(self, html: str, structured: bool = True) -> Iterable[Union[StructuredProduct, RawProduct]]:
+        """
+        Parses product cards from the given HTML and returns a list of structured product models.
+        With `products.parse_workers` > 1 a page of more than `products.parse_shard_cards` cards is split into
+        shards that a process pool parses; the products are then streamed back in page order.
+
+        Args:
+            html (str): the full HTML source of the loaded category page
+
+        Returns:
+            Iterable[RawProduct | StructuredProduct]: parsed product data (a list unless parsed in parallel)
+        """
+        workers = self.products_config.get("parse_workers", 1)
+        if workers > 1:
+            shard_cards = self.products_config.get("parse_shard_cards", 2000)
+            shards = card_shards(html, self.get_selector("product_card"), shard_cards)
+            if shards:
+                return self._parse_parallel(shards, structured, min(workers, len(shards)))
+        with self.trace.span("select", bytes=len(html)) as span:
+            cards = self._select_cards(html)
+            span.set(cards=len(cards))
+        self.logger.info(f"Found {len(cards)} product cards")
+        start = time.time()
+
+        products = list(self._parse_cards(cards, self._card_parser(), structured, self.trace))
         elapsed = time.time() - start
         self.logger.info(
             f"Parsed {len(products)} {'structured' if structured else 'raw'} products in {elapsed:.2f} seconds")
         return products
+
+    def _parse_parallel(
+        self,
+        shards: List[str],
+        structured: bool,
+        workers: int
+    ) -> Iterator[Union[StructuredProduct, RawProduct]]:
+        """
+        Parses page shards from `card_shards` on a ParallelParser pool and yields the products in page order.
+        The `parallel_parse` span stays open while the caller consumes the products, like the streaming spans.
+        """
+        self.logger.info(f"Parsing {len(shards)} shards with {workers} processes")
+        start = time.time()
+        count = 0
+        with self.trace.span("parallel_parse", shards=len(shards), workers=workers) as span:
+            with ParallelParser(self.config, self.category_key, workers, span) as parser:
+                for product in parser.parse_shards(shards, structured):
+                    count += 1
+                    yield product
+            span.set(products=count)
+        elapsed = time.time() - start
+        self.logger.info(
+            f"Parsed {count} {'structured' if structured else 'raw'} products in {elapsed:.2f} seconds")
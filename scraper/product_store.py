@@ -0,0 +1,169 @@
+import hashlib
+import json
+import logging
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple, Union
+
+from scraper.description_parser import PARSER_VERSION
+from scraper.models import RawProduct, StructuredProduct
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    url TEXT PRIMARY KEY,
+    category TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    structured TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS products_category ON products (category);
+"""
+
+
+class Delta(NamedTuple):
+    """Result of syncing one category's listing with the store."""
+    snapshot: List[StructuredProduct]
+    new: List[StructuredProduct]
+    changed: List[StructuredProduct]
+    removed: List[StructuredProduct]
+    unchanged: int
+
+
+def conversion_settings(**settings: Any) -> str:
+    """
+    Canonical form of everything besides the card fields that shapes a stored StructuredProduct: the given
+    settings (currency rates, target currency, detail stage), the DescriptionParser version and the model schema.
+    """
+    settings.update(parser_version=PARSER_VERSION, schema=sorted(StructuredProduct.model_fields))
+    return json.dumps(settings, sort_keys=True, default=str)
+
+
+def content_hash(product: RawProduct, settings: str = "") -> str:
+    """
+    Hash of the card fields of a listing product (everything except the url key and the scrape time)
+    and of the `conversion_settings` its stored StructuredProduct was built with.
+    """
+    fields = (product.name, repr(product.price_usd), repr(product.rating), str(product.num_reviews),
+              product.description_raw or "", settings)
+    return hashlib.blake2b("\x1f".join(fields).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ProductStore:
+    """
+    Persistent SQLite store of the last seen StructuredProduct of every product url, with a content hash
+    of its card fields and conversion settings. Syncing a new listing only converts new or changed cards
+    (all of them after a settings change) and reports the new/changed/removed deltas. The database runs in
+    WAL mode so worker processes can sync their categories concurrently.
+    """
+
+    def __init__(self, path: Union[str, Path], timeout: float = 30):
+        """
+        Args:
+            path: SQLite database file, created on first use.
+            timeout (float): seconds to wait for another process's write transaction.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def sync(
+        self,
+        category: str,
+        products: Iterable[RawProduct],
+        convert: Callable[[List[RawProduct]], List[StructuredProduct]],
+        settings: str = "",
+        complete: bool = True
+    ) -> Delta:
+        """
+        Compare a category's listing with the stored products and persist the result in one transaction.
+
+        Args:
+            category (str): category the listing belongs to; stored products of it that are missing
+                from the listing are reported as removed and deleted.
+            products: RawProduct objects in page order; repeated urls keep their first occurrence.
+            convert: batch conversion of the new and changed products (e.g. ProductConverter plus the detail stage).
+            settings (str): `conversion_settings` of `convert`; stored products built with other settings are
+                converted again and reported as changed.
+            complete (bool): False when the listing may be partial (pagination ended on an error); stored
+                products missing from it are then kept instead of reported as removed.
+
+        Returns:
+            Delta: current snapshot in page order plus the new, changed and removed products
+        """
+        stored: Dict[str, Tuple[str, str]] = {
+            url: (digest, structured) for url, digest, structured in self.conn.execute(
+                "SELECT url, content_hash, structured FROM products WHERE category = ?", (category,)
+            )
+        }
+        now = datetime.now(timezone.utc)
+        entries = []
+        pending: List[RawProduct] = []
+        seen = set()
+        for product in products:
+            if product.url in seen:
+                continue
+            seen.add(product.url)
+            digest = content_hash(product, settings)
+            previous = stored.get(product.url)
+            if previous is not None and previous[0] == digest:
+                entries.append((product.url, digest, previous[1]))
+            else:
+                entries.append((product.url, digest, None))
+                pending.append(product)
+
+        converted = {product.url: product for product in convert(pending)} if pending else {}
+        snapshot, new, changed, rows, kept = [], [], [], [], []
+        for url, digest, structured_json in entries:
+            if structured_json is not None:
+                product = StructuredProduct.model_validate_json(structured_json)
+                product.last_scraped = now
+                kept.append((now.isoformat(), url))
+            else:
+                product = converted.get(url)
+                if product is None:
+                    continue
+                (changed if url in stored else new).append(product)
+                rows.append((url, category, digest, product.model_dump_json(), now.isoformat(), now.isoformat()))
+            snapshot.append(product)
+        removed_urls = [url for url in stored if url not in seen]
+        if not complete and removed_urls:
+            logger.warning(
+                f"{category}: listing is incomplete; keeping {len(removed_urls)} stored products it did not contain.",
+                extra={"event": "delta_partial", "category": category}
+            )
+            removed_urls = []
+        removed = [StructuredProduct.model_validate_json(stored[url][1]) for url in removed_urls]
+
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany("DELETE FROM products WHERE url = ?", [(url,) for url in removed_urls])
+            self.conn.executemany("UPDATE products SET last_seen = ? WHERE url = ?", kept)
+            self.conn.executemany(
+                "INSERT INTO products (url, category, content_hash, structured, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(url) DO UPDATE SET category = excluded.category, "
+                "content_hash = excluded.content_hash, structured = excluded.structured, last_seen = excluded.last_seen",
+                rows
+            )
+
+        delta = Delta(snapshot, new, changed, removed, len(kept))
+        logger.info(
+            f"{category}: {len(new)} new, {len(changed)} changed, {len(removed)} removed, {delta.unchanged} unchanged",
+            extra={"event": "delta", "category": category}
+        )
+        return delta
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "ProductStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,230 @@
+import argparse
+import copy
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Union
+from urllib.parse import urlsplit
+
+from scraper.enums import FetchMode, ReplayMode
+
+logger = logging.getLogger(__name__)
+
+
+class Snapshot(NamedTuple):
+    status: int
+    body: bytes
+    content_type: str
+
+
+class SnapshotStore:
+    """
+    Directory of recorded HTTP responses (category pages, 'Load More' responses, detail pages),
+    keyed by URL path + query so a snapshot recorded from the live site replays on any host.
+    Each response is one JSON file written atomically, so several worker processes can record at once.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    @staticmethod
+    def key(url: str) -> str:
+        """Host-independent key of a URL: its path plus query string."""
+        parts = urlsplit(url)
+        return (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    def save(self, url: str, status: int, body: bytes, content_type: str = "text/html; charset=utf-8"):
+        """Record one response, replacing an earlier snapshot of the same URL."""
+        key = self.key(url)
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        record = {
+            "key": key,
+            "url": url,
+            "status": status,
+            "content_type": content_type,
+            "body": body.decode("utf-8", errors="surrogateescape"),
+        }
+        tmp.write_text(json.dumps(record), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def get(self, url: str) -> Optional[Snapshot]:
+        """Return the snapshot recorded for the URL (or key), or None."""
+        path = self._path(self.key(url))
+        if not path.exists():
+            return None
+        return self._load(path)[1]
+
+    def load_all(self) -> Dict[str, Snapshot]:
+        """Read every snapshot into memory, keyed by path + query."""
+        snapshots = {}
+        for path in sorted(self.root.glob("*.json")):
+            key, snapshot = self._load(path)
+            snapshots[key] = snapshot
+        return snapshots
+
+    @staticmethod
+    def _load(path: Path):
+        record = json.loads(path.read_text(encoding="utf-8"))
+        body = record["body"].encode("utf-8", errors="surrogateescape")
+        return record["key"], Snapshot(record["status"], body, record["content_type"])
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    """Serves `server.snapshots` over keep-alive HTTP/1.1 after the configured latency."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(self.server.delay())
+        snapshot = self.server.snapshots.get(self.path)
+        if snapshot is None:
+            logger.warning(f"No snapshot for {self.path}", extra={"event": "replay_miss", "path": self.path})
+            snapshot = Snapshot(404, b"not recorded", "text/plain; charset=utf-8")
+        self.send_response(snapshot.status)
+        self.send_header("Content-Type", snapshot.content_type)
+        self.send_header("Content-Length", str(len(snapshot.body)))
+        self.end_headers()
+        self.wfile.write(snapshot.body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ReplayServer:
+    """
+    Local HTTP stand-in for the target site that serves a SnapshotStore with configurable latency
+    and jitter, so extraction runs and benchmarks repeat without the network.
+    """
+
+    def __init__(
+        self,
+        store: SnapshotStore,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """
+        Args:
+            store (SnapshotStore): recorded responses to serve.
+            latency_ms (float): delay added before every response.
+            jitter_ms (float): each delay is drawn uniformly from latency_ms ± jitter_ms.
+            seed (int): seed of the jitter generator, for repeatable runs.
+            host (str): interface to bind.
+            port (int): port to bind; 0 picks a free one.
+        """
+        self.store = store
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _ReplayHandler)
+        self._server.daemon_threads = True
+        self._server.snapshots = store.load_all()
+        self._server.delay = self._delay
+        self._thread = None
+        self.url = f"http://{host}:{self._server.server_port}"
+
+    def _delay(self) -> float:
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def start(self) -> "ReplayServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Replaying {len(self._server.snapshots)} snapshots from {self.store.root} at {self.url}")
+        return self
+
+    def serve_forever(self):
+        """Serve in the calling thread until interrupted."""
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def replay_mode(config: dict[str, Any]) -> ReplayMode:
+    """Returns the configured `replay.mode`, defaulting to off."""
+    return ReplayMode(config.get("replay", {}).get("mode", ReplayMode.OFF.value))
+
+
+def snapshot_store(config: dict[str, Any]) -> SnapshotStore:
+    """The SnapshotStore at `replay.snapshot_dir`."""
+    return SnapshotStore(config.get("replay", {}).get("snapshot_dir", "snapshots"))
+
+
+@contextmanager
+def replay_session(config: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """
+    In replay mode, serve the snapshot store for the duration of the block and yield a copy of the
+    config whose `base_url` points at the local stand-in; otherwise yield the config unchanged.
+
+    Raises:
+        ValueError: when recording or replaying with `products.fetch_mode: browser`, whose page loads and
+            'Load More' requests are made by the browser and never pass through the recording HttpFetcher
+    """
+    mode = replay_mode(config)
+    fetch_mode = FetchMode(config["products"].get("fetch_mode", FetchMode.BROWSER.value))
+    if mode != ReplayMode.OFF and fetch_mode == FetchMode.BROWSER:
+        raise ValueError(
+            f"replay.mode '{mode.value}' needs products.fetch_mode 'http': browser traffic is not recorded"
+        )
+    if mode != ReplayMode.REPLAY:
+        yield config
+        return
+    replay_config = config.get("replay", {})
+    server = ReplayServer(
+        snapshot_store(config),
+        latency_ms=replay_config.get("latency_ms", 0),
+        jitter_ms=replay_config.get("jitter_ms", 0),
+        seed=replay_config.get("seed"),
+    )
+    with server:
+        replayed = copy.deepcopy(config)
+        replayed["base_url"] = server.url
+        yield replayed
+
+
+def main():
+    """Serve a snapshot directory on a fixed port, e.g. for browser runs against `base_url: http://127.0.0.1:8000`."""
+    parser = argparse.ArgumentParser(description="Serve recorded snapshots as a local stand-in for the site")
+    parser.add_argument("snapshot_dir")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    server = ReplayServer(SnapshotStore(args.snapshot_dir), args.latency_ms, args.jitter_ms, args.seed, args.host, args.port)
+    logger.info(f"Serving {args.snapshot_dir} at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
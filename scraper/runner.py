@@ -0,0 +1,322 @@
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import util
+from typing import Any, Dict, List, Optional
+
+from scraper.driver_pool import RecyclingDriver
+from scraper.enums import FetchMode
+from scraper.http_fetcher import HttpFetcher
+from scraper.product_detail_extractor import ProductDetailExtractor
+from scraper.product_converter import ProductConverter
+from scraper.product_list_extractor import ProductListExtractor
+from scraper.product_store import ProductStore, conversion_settings
+from scraper.replay import replay_session
+from scraper.tracing import Span, write_prometheus, write_trace_json
+from scraper.writers import output_path, write_stream
+
+logger = logging.getLogger(__name__)
+
+# Per-process state of a pool worker: its recycled browser and HTTP session.
+_worker: Dict[str, Any] = {}
+
+
+def scrape_category(
+    config: dict[str, Any],
+    category: str,
+    output_dir: str,
+    output_format: str,
+    driver=None,
+    fetcher: Optional[HttpFetcher] = None,
+    trace: Optional[Span] = None
+) -> Dict[str, Any]:
+    """
+    Extract one category, run the optional detail stage and write its output file.
+    Each stage is timed as a child span of `trace`; with `products.streaming` extraction happens while
+    writing, so its spans are children of `extract` but their time is also inside `write`.
+
+    With `store.enabled` the listing is synced with the ProductStore instead: see `sync_category`.
+
+    Returns:
+        dict: summary with `category`, `status`, `products`, `output` and `seconds`
+    """
+    start = time.time()
+    trace = trace if trace is not None else Span("scrape", category=category)
+    if config.get("store", {}).get("enabled", False):
+        summary = sync_category(config, category, output_dir, output_format, driver, fetcher, trace)
+        summary["seconds"] = round(time.time() - start, 2)
+        return summary
+    with trace.span("extract") as span:
+        extractor = ProductListExtractor(driver, config, category, fetcher=fetcher, trace=span)
+        products = extractor.extract()
+    detail_enabled = config.get("detail", {}).get("enabled", False)
+    if detail_enabled:
+        with trace.span("detail") as span:
+            products = ProductDetailExtractor(driver, config, category, fetcher=fetcher, trace=span).extract(products)
+
+    global_config = config["global"]
+    compression = global_config.get("output_compression")
+    kind = "structured" if global_config["structured_products_data"] or detail_enabled else "raw"
+    out_path = output_path(output_dir, f"{category}_{kind}", output_format, compression)
+    with trace.span("write", format=output_format) as span:
+        count = write_stream(products, out_path, output_format, compression, global_config.get("flush_every", 500))
+        span.set(records=count, bytes=os.path.getsize(out_path) if os.path.exists(out_path) else 0)
+    logger.info(f"Saved {count} products to {out_path}")
+    return _with_wait_stats({
+        "category": category,
+        "status": "ok",
+        "products": count,
+        "output": out_path,
+        "seconds": round(time.time() - start, 2),
+    }, extractor)
+
+
+def sync_category(
+    config: dict[str, Any],
+    category: str,
+    output_dir: str,
+    output_format: str,
+    driver=None,
+    fetcher: Optional[HttpFetcher] = None,
+    trace: Optional[Span] = None
+) -> Dict[str, Any]:
+    """
+    Extract one category as RawProduct, sync it with the ProductStore at `store.path` so only new and
+    changed cards are converted (and sent through the detail stage), then write the
+    `{category}_new/_changed/_removed` delta files and, with `store.write_snapshot`, the full snapshot.
+
+    Returns:
+        dict: summary with `category`, `status`, `products`, `output`, `deltas` and `delta` counts
+    """
+    trace = trace if trace is not None else Span("scrape", category=category)
+    store_config = config.get("store", {})
+    products_config = config["products"]
+    converter = ProductConverter(
+        products_config.get("currency_rates") or {"USD": 1.0}, products_config.get("target_currency") or "USD"
+    )
+
+    def convert(raw_products):
+        with trace.span("convert", products=len(raw_products)):
+            structured = converter.to_structured_batch(raw_products)
+        if not config.get("detail", {}).get("enabled", False):
+            return structured
+        with trace.span("detail") as span:
+            return ProductDetailExtractor(driver, config, category, fetcher=fetcher, trace=span).extract(structured)
+
+    detail_config = config.get("detail", {})
+    settings = conversion_settings(
+        currency_rates=converter.rates, target_currency=converter.target_currency,
+        detail=detail_config if detail_config.get("enabled", False) else None
+    )
+
+    with trace.span("extract") as span:
+        extractor = ProductListExtractor(driver, config, category, fetcher=fetcher, trace=span)
+        raw = list(extractor.extract(structured=False))
+    with trace.span("sync") as span, ProductStore(store_config.get("path", "output/products.sqlite")) as store:
+        delta = store.sync(category, raw, convert, settings, complete=not extractor.pagination_failed)
+        span.set(new=len(delta.new), changed=len(delta.changed), removed=len(delta.removed), unchanged=delta.unchanged)
+
+    global_config = config["global"]
+    compression = global_config.get("output_compression")
+    flush_every = global_config.get("flush_every", 500)
+    outputs = {"new": delta.new, "changed": delta.changed, "removed": delta.removed}
+    if store_config.get("write_snapshot", True):
+        outputs["structured"] = delta.snapshot
+    paths = {}
+    with trace.span("write", format=output_format) as span:
+        for kind, products in outputs.items():
+            path = output_path(output_dir, f"{category}_{kind}", output_format, compression)
+            if write_stream(products, path, output_format, compression, flush_every):
+                paths[kind] = path
+                span.add(calls=0, records=len(products), bytes=os.path.getsize(path))
+            elif os.path.exists(path):
+                os.remove(path)  # an empty delta must not leave the previous run's file behind
+    logger.info(f"Saved {len(delta.snapshot)} products and deltas of '{category}' to {', '.join(paths.values())}")
+    return _with_wait_stats({
+        "category": category,
+        "status": "ok",
+        "products": len(delta.snapshot),
+        "output": paths.get("structured"),
+        "deltas": {kind: path for kind, path in paths.items() if kind != "structured"},
+        "delta": {
+            "new": len(delta.new), "changed": len(delta.changed),
+            "removed": len(delta.removed), "unchanged": delta.unchanged,
+        },
+    }, extractor)
+
+
+def _with_wait_stats(summary: Dict[str, Any], extractor: ProductListExtractor) -> Dict[str, Any]:
+    """Add the extractor's learned 'Load More' wait statistics to a category summary as `waits`."""
+    waits = extractor.wait_stats()
+    if waits:
+        summary["waits"] = waits
+        logger.info(
+            f"{summary['category']}: content wait p50 {waits['content']['p50']}s, p95 {waits['content']['p95']}s, "
+            f"timeout {waits['content']['timeout']}s, poll {waits['content']['poll_interval']}s",
+            extra={"event": "wait_stats", "category": summary["category"]}
+        )
+    return summary
+
+
+def uses_browser(config: dict[str, Any]) -> bool:
+    """Return True unless the config fetches listings over plain HTTP."""
+    return config["products"].get("fetch_mode", FetchMode.BROWSER.value) != FetchMode.HTTP.value
+
+
+def run_job(config: dict[str, Any], category: str, output_dir: str, output_format: str,
+            browser: RecyclingDriver, fetcher: HttpFetcher) -> Dict[str, Any]:
+    """
+    Run one category on the given recycled browser, turning failures into a 'failed' summary.
+    With `checkpoint.enabled` a failed attempt is retried up to `checkpoint.max_resumes` times on a
+    restarted browser, resuming from the category's pagination checkpoint.
+    The summary carries the job's span tree under `trace`, its HTTP cache counters under `http_cache` and its
+    rate governor counters (requests, waits, throttled responses, slowdowns) under `governor`.
+    """
+    start = time.time()
+    trace = Span("scrape", category=category)
+    cache_before = fetcher.cache_stats()
+    governor_before = fetcher.governor_stats()
+    checkpoint_config = config.get("checkpoint", {})
+    max_resumes = checkpoint_config.get("max_resumes", 2) if checkpoint_config.get("enabled", False) else 0
+    for attempt in range(max_resumes + 1):
+        failed = False
+        try:
+            driver = None
+            if uses_browser(config):
+                with trace.span("create_driver") as span:
+                    restarts = browser.restarts
+                    driver = browser.acquire()
+                    span.set(
+                        started=browser.restarts - restarts,
+                        resource_blocking=bool(config.get("browser", {}).get("block_resources", {}).get("enabled"))
+                    )
+            summary = scrape_category(
+                config, category, output_dir, output_format, driver=driver, fetcher=fetcher, trace=trace
+            )
+        except Exception as e:
+            failed = True
+            summary = {"category": category, "status": "failed", "error": str(e), "seconds": round(time.time() - start, 2)}
+            if attempt < max_resumes:
+                logger.warning(
+                    f"Category '{category}' failed ({e}); resuming from its checkpoint ({attempt + 1}/{max_resumes}).",
+                    extra={"event": "category_resumed", "category": category}
+                )
+            else:
+                logger.exception(f"Category '{category}' failed: {e}")
+        finally:
+            browser.release(failed=failed)
+        if not failed:
+            break
+    if attempt:
+        summary["resumes"] = attempt
+        trace.set(resumes=attempt)
+    trace.add(time.time() - start)
+    if cache_before:
+        cache_stats = {key: value - cache_before[key] for key, value in fetcher.cache_stats().items()}
+        trace.set(**{f"cache_{key}": value for key, value in cache_stats.items()})
+        summary["http_cache"] = cache_stats
+        logger.info(
+            f"{category}: HTTP cache " + ", ".join(f"{value} {key}" for key, value in cache_stats.items()),
+            extra={"event": "http_cache_stats", "category": category}
+        )
+    if governor_before:
+        governor_stats = {
+            key: round(value - governor_before[key], 3) for key, value in fetcher.governor_stats().items()
+        }
+        trace.set(**{f"governor_{key}": value for key, value in governor_stats.items()})
+        summary["governor"] = governor_stats
+    summary["pid"] = os.getpid()
+    summary["trace"] = trace.to_dict()
+    return summary
+
+
+def _init_worker(config: dict[str, Any]):
+    """Create the per-process browser holder and HTTP session, closed when the worker exits."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    _worker["config"] = config
+    _worker["browser"] = RecyclingDriver(config, config["global"].get("driver_max_jobs", 20))
+    _worker["fetcher"] = HttpFetcher.from_config(config)
+    util.Finalize(None, _shutdown_worker, exitpriority=10)
+
+
+def _shutdown_worker():
+    _worker["browser"].quit()
+    _worker["fetcher"].close()
+
+
+def _worker_job(category: str, output_dir: str, output_format: str) -> Dict[str, Any]:
+    return run_job(_worker["config"], category, output_dir, output_format, _worker["browser"], _worker["fetcher"])
+
+
+def run_categories(
+    config: dict[str, Any],
+    categories: List[str],
+    output_dir: str,
+    output_format: str,
+    workers: int = 1
+) -> Dict[str, Any]:
+    """
+    Scrape several categories, spread over `workers` processes that each reuse one browser.
+    In `replay.mode: replay` every process talks to a local stand-in serving the snapshot store.
+    The span trees of all jobs are written to `metrics.trace_file` (JSON) and `metrics.prometheus_textfile`.
+
+    Returns:
+        dict: combined summary with per-category results and total wall time
+    """
+    start = time.time()
+    workers = max(1, min(workers, len(categories)))
+    logger.info(f"Scraping {len(categories)} categories with {workers} worker(s): {', '.join(categories)}")
+
+    with replay_session(config) as config:
+        if workers == 1:
+            browser = RecyclingDriver(config, config["global"].get("driver_max_jobs", 20))
+            try:
+                with HttpFetcher.from_config(config) as fetcher:
+                    results = [run_job(config, c, output_dir, output_format, browser, fetcher) for c in categories]
+            finally:
+                browser.quit()
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config,)) as pool:
+                futures = [pool.submit(_worker_job, c, output_dir, output_format) for c in categories]
+                results = [future.result() for future in futures]
+
+    traces = [result.pop("trace") for result in results if "trace" in result]
+    summary = {
+        "workers": workers,
+        "seconds": round(time.time() - start, 2),
+        "products": sum(result.get("products", 0) for result in results),
+        "failed": [result["category"] for result in results if result["status"] != "ok"],
+        "categories": results,
+    }
+    for result in results:
+        logger.info(
+            f"{result['category']}: {result['status']}, {result.get('products', 0)} products "
+            f"in {result['seconds']}s (pid {result['pid']})"
+        )
+    summary.update(export_traces(config, traces, output_dir))
+    logger.info(f"Scraped {summary['products']} products from {len(categories)} categories in {summary['seconds']}s")
+    return summary
+
+
+def export_traces(config: dict[str, Any], traces: List[Dict[str, Any]], output_dir: str) -> Dict[str, str]:
+    """
+    Write the run's span trees as JSON and as a Prometheus textfile; relative paths are resolved
+    against the output directory and an empty path disables that export.
+
+    Returns:
+        dict: `trace_file` and/or `metrics_file` paths that were written
+    """
+    metrics_config = config.get("metrics", {})
+    written = {}
+    trace_file = metrics_config.get("trace_file", "trace.json")
+    if trace_file:
+        path = os.path.join(output_dir, trace_file)
+        write_trace_json(traces, path)
+        written["trace_file"] = path
+    textfile = metrics_config.get("prometheus_textfile", "metrics.prom")
+    if textfile:
+        path = os.path.join(output_dir, textfile)
+        write_prometheus(traces, path, metrics_config.get("prefix", "scraper"))
+        written["metrics_file"] = path
+    return written
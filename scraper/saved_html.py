@@ -0,0 +1,117 @@
+import glob
+import gzip
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from scraper.parallel_parser import ParallelParser
+from scraper.product_list_extractor import ProductListExtractor
+from scraper.writers import output_path, write_stream
+
+logger = logging.getLogger(__name__)
+
+# Extensions picked up when a directory is given to `--from-html`.
+HTML_SUFFIXES = (".html", ".htm", ".html.gz", ".htm.gz")
+
+
+def html_inputs(specs: Iterable[str]) -> List[Path]:
+    """
+    Expand `--from-html` arguments into saved page files: a file is taken as is, a directory contributes
+    its `*.html`/`*.htm` files (optionally gzipped) and anything else is treated as a glob pattern.
+
+    Returns:
+        List[Path]: unique input files in argument order, each directory and glob sorted by name
+    """
+    paths = []
+    for spec in specs:
+        path = Path(spec)
+        if path.is_file():
+            paths.append(path)
+        elif path.is_dir():
+            paths.extend(sorted(p for p in path.iterdir() if p.is_file() and p.name.lower().endswith(HTML_SUFFIXES)))
+        else:
+            matches = sorted(Path(p) for p in glob.glob(spec, recursive=True) if os.path.isfile(p))
+            if not matches:
+                logger.warning(f"No saved HTML matches '{spec}'")
+            paths.extend(matches)
+    return list(dict.fromkeys(paths))
+
+
+def read_html(path: Path) -> str:
+    """Read one saved page source, transparently decompressing `.gz` files."""
+    if path.name.lower().endswith(".gz"):
+        with gzip.open(path, "rt", encoding="utf-8", errors="replace") as f:
+            return f.read()
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
+def parse_saved_html(
+    config: dict[str, Any],
+    paths: List[Path],
+    category: str,
+    output_dir: str,
+    output_format: str
+) -> Dict[str, Any]:
+    """
+    Re-run `_parse_products` on saved page sources and write one `{file stem}_{kind}` output per input,
+    without a browser or network access (selenium is never imported). With `products.parse_workers` > 1
+    several files are parsed and written by a ParallelParser pool, while a single file is split into card shards.
+
+    Args:
+        config (dict): Configuration dictionary; `category` picks the selectors.
+        paths (List[Path]): page sources from `html_inputs`.
+
+    Returns:
+        dict: summary with per-file results and total products and wall time
+    """
+    start = time.time()
+    os.makedirs(output_dir, exist_ok=True)
+
+    names, stems = [], set()
+    for path in paths:
+        stem = path.name.split(".")[0] or path.name
+        name, n = stem, 1
+        while name in stems:
+            n += 1
+            name = f"{stem}_{n}"
+        stems.add(name)
+        names.append(name)
+
+    args = (paths, names, [output_dir] * len(paths), [output_format] * len(paths))
+    workers = min(config["products"].get("parse_workers", 1), len(paths))
+    if workers > 1:
+        logger.info(f"Parsing {len(paths)} saved pages with {workers} processes")
+        with ParallelParser(config, category, workers) as parser:
+            results = list(parser.map(_parse_file, *args))
+    else:
+        extractor = ProductListExtractor(None, config, category)
+        results = [_parse_file(extractor, *job) for job in zip(*args)]
+
+    summary = {
+        "seconds": round(time.time() - start, 2),
+        "products": sum(result.get("products", 0) for result in results),
+        "failed": [result["input"] for result in results if result["status"] != "ok"],
+        "files": results,
+    }
+    logger.info(f"Parsed {summary['products']} products from {len(paths)} saved pages in {summary['seconds']}s")
+    return summary
+
+
+def _parse_file(extractor: ProductListExtractor, path: Path, name: str, output_dir: str, output_format: str) -> dict:
+    """Parse one saved page with `extractor` and write `{name}_{kind}`, turning failures into a 'failed' result."""
+    start = time.time()
+    global_config = extractor.config["global"]
+    structured = global_config["structured_products_data"]
+    compression = global_config.get("output_compression")
+    try:
+        products = extractor._parse_products(read_html(path), structured)
+        out_path = output_path(output_dir, f"{name}_{'structured' if structured else 'raw'}", output_format, compression)
+        count = write_stream(products, out_path, output_format, compression, global_config.get("flush_every", 500))
+        result = {"input": str(path), "status": "ok", "products": count, "output": out_path}
+    except Exception as e:
+        logger.exception(f"Failed to parse saved HTML '{path}': {e}")
+        result = {"input": str(path), "status": "failed", "error": str(e)}
+    result["seconds"] = round(time.time() - start, 2)
+    return result
@@ -0,0 +1,102 @@
+import json
+from typing import Callable, List, Optional
+
+from scraper.card_harvester import PRUNE_FUNCTION
+from scraper.enums import DomPruning
+
+# Field order of every row returned by the script; CardParser.parse_fields expects the same order.
+ROW_FIELDS = ("name", "price", "rating", "reviews", "description", "product_link")
+
+_EXTRACT_SCRIPT = PRUNE_FUNCTION + """
+var sel = arguments[0], start = arguments[1], pruning = arguments[2];
+function strippedText(el) {
+    var walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT), out = "", node;
+    while ((node = walker.nextNode())) { out += node.nodeValue.trim(); }
+    return out;
+}
+function text(card, selector) {
+    var el = card.querySelector(selector);
+    return el ? strippedText(el) : null;
+}
+var all = Array.prototype.slice.call(document.querySelectorAll(sel.product_card));
+var rows = JSON.stringify(all.slice(start).map(function (card) {
+    var link = card.querySelector(sel.product_link);
+    return [
+        text(card, sel.name),
+        text(card, sel.price),
+        card.querySelectorAll(sel.rating).length,
+        text(card, sel.reviews),
+        text(card, sel.description),
+        link ? link.getAttribute("href") : null
+    ];
+}));
+prune(all, pruning);
+return rows;
+"""
+
+
+class ScriptCardExtractor:
+    """
+    Extracts the configured card fields for every product card inside the browser with a single
+    execute_script call, skipping the page_source transfer and the BeautifulSoup re-parse.
+    """
+
+    def __init__(
+        self,
+        driver,
+        logger,
+        get_selector: Callable[[str], Optional[str]],
+        item_selector: str = "product_card",
+        pruning: DomPruning = DomPruning.OFF
+    ):
+        """
+        Initialize ScriptCardExtractor with WebDriver, logger, selector resolver, the card selector key and
+        the DomPruning mode applied by `harvest`.
+        """
+        self.driver = driver
+        self.logger = logger
+        self.get_selector = get_selector
+        self.item_selector = item_selector
+        self.pruning = pruning
+        self.harvested = 0
+        self.pruned = 0
+
+    @property
+    def start(self) -> int:
+        """Index of the first unharvested card among the cards still in the DOM."""
+        return self.harvested - self.pruned
+
+    def extract(self, start: int = 0, pruning: DomPruning = DomPruning.OFF) -> List[list]:
+        """
+        Return one row per card from index `start` onwards, with values ordered as in ROW_FIELDS.
+
+        Args:
+            start (int): index of the first card to extract
+            pruning (DomPruning): drop every matched card from the DOM after reading it
+
+        Returns:
+            List[list]: [name, price, rating, reviews, description, href] for every card
+        """
+        selectors = {"product_card": self.get_selector(self.item_selector)}
+        selectors.update({key: self.get_selector(key) for key in ROW_FIELDS})
+        missing = [key for key, selector in selectors.items() if not selector]
+        if missing:
+            self.logger.error(f"Missing selectors for {missing}", extra={"event": "missing_selector"})
+            return []
+
+        payload = self.driver.execute_script(_EXTRACT_SCRIPT, selectors, start, pruning.value)
+        rows = json.loads(payload) if payload else []
+        self.logger.debug(
+            f"Extracted {len(rows)} cards in the browser ({len(payload or '')} bytes).",
+            extra={"event": "script_extract", "count": len(rows), "bytes": len(payload or "")}
+        )
+        return rows
+
+    def harvest(self) -> List[list]:
+        """Return rows for every card not harvested yet, in DOM order."""
+        start = self.start
+        rows = self.extract(start, self.pruning)
+        self.harvested += len(rows)
+        if self.pruning != DomPruning.OFF:
+            self.pruned += start + len(rows)
+        return rows
@@ -0,0 +1,186 @@
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from scraper.tracing import Span
+
+# WebDriver's default async script timeout, restored when the driver cannot report its current one.
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+# Runs the whole click/wait/count loop inside the page. A MutationObserver on the card container
+# (or <body> while waiting for the button) re-checks the condition on every DOM change instead of
+# the client polling it over WebDriver. Resolves once with the final count and click stats.
+_PAGINATE_SCRIPT = """
+var opts = arguments[0], done = arguments[arguments.length - 1];
+var clicks = 0, idle = 0, started = Date.now(), finished = false;
+
+function count() { return document.querySelectorAll(opts.item).length; }
+function findButton() { return document.getElementsByClassName(opts.button)[0] || null; }
+function visible(el) {
+    return !!el && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+        && window.getComputedStyle(el).visibility !== "hidden";
+}
+function finish(reason, error) {
+    if (finished) { return; }
+    finished = true;
+    done({count: count(), clicks: clicks, idle_clicks: idle, reason: reason, error: error || null,
+          elapsed_ms: Date.now() - started});
+}
+function waitFor(predicate, timeoutMs, target, callback) {
+    if (predicate()) { callback(true); return; }
+    var timer, observer = new MutationObserver(function () { if (predicate()) { settle(true); } });
+    function settle(ok) { clearTimeout(timer); observer.disconnect(); callback(ok); }
+    observer.observe(target, {childList: true, subtree: true, attributes: true});
+    timer = setTimeout(function () { settle(predicate()); }, timeoutMs);
+}
+function guarded(fn) {
+    return function (arg) {
+        try { fn(arg); } catch (e) { finish("failure", String(e)); }
+    };
+}
+var step = guarded(function () {
+    if (idle >= opts.max_idle) { finish("max_idle"); return; }
+    var prev = count();
+    waitFor(function () { return !!findButton(); }, opts.button_wait_ms, document.body, guarded(function () {
+        var button = findButton();
+        if (!visible(button)) { finish("button_gone"); return; }
+        if (opts.scroll_into_view) { button.scrollIntoView({block: "center"}); }
+        button.click();
+        var first = document.querySelector(opts.item);
+        var container = first && first.parentNode ? first.parentNode : document.body;
+        waitFor(function () { return count() > prev; }, opts.content_wait_ms, container, guarded(function (loaded) {
+            if (loaded) {
+                clicks += 1;
+                idle = 0;
+            } else {
+                if (!visible(findButton())) { finish("button_gone"); return; }
+                idle += 1;
+            }
+            setTimeout(step, opts.wait_after_click_ms);
+        }));
+    }));
+});
+step();
+"""
+
+
+class ScriptPaginator:
+    """
+    Clicks 'Load More' until no new cards appear, running the entire loop inside the browser
+    in a single execute_async_script call instead of several WebDriver round-trips per click.
+    """
+
+    def __init__(
+        self,
+        driver,
+        logger,
+        get_selector: Callable[[str], Optional[str]],
+        max_idle_clicks: int = 3,
+        button_wait_time: float = 10,
+        content_wait_time: float = 10,
+        wait_after_click_ms: int = 0,
+        scroll_into_view: bool = True,
+        script_timeout: float = 600,
+        item_selector: str = "product_card",
+        button_name: str = "load_more",
+        trace: Optional[Span] = None
+    ):
+        """Initialize ScriptPaginator with WebDriver, logger, selector resolver, idle limit, timeouts and trace span."""
+        self.driver = driver
+        self.logger = logger
+        self.get_selector = get_selector
+        self.max_idle_clicks = max_idle_clicks
+        self.button_wait_time = button_wait_time
+        self.content_wait_time = content_wait_time
+        self.wait_after_click_ms = wait_after_click_ms
+        self.scroll_into_view = scroll_into_view
+        self.script_timeout = script_timeout
+        self.item_selector = item_selector
+        self.button_name = button_name
+        self.trace = trace if trace is not None else Span("paginate")
+        # True when the in-browser loop timed out or failed rather than running out of 'Load More' clicks.
+        self.failed = False
+
+    def scroll_until_done(self) -> Dict[str, Any]:
+        """
+        Run the click/wait/count loop in the page.
+
+        Returns:
+            dict: final card `count`, `clicks`, `idle_clicks`, stop `reason` and `elapsed_ms`; empty on failure
+        """
+        item = self.get_selector(self.item_selector)
+        button = self.get_selector(self.button_name)
+        if not item or not button:
+            self.logger.error(
+                f"Missing selector for '{self.item_selector}' or '{self.button_name}'",
+                extra={"event": "missing_selector"}
+            )
+            return {}
+
+        options = {
+            "item": item,
+            "button": button,
+            "max_idle": self.max_idle_clicks,
+            "button_wait_ms": int(self.button_wait_time * 1000),
+            "content_wait_ms": int(self.content_wait_time * 1000),
+            "wait_after_click_ms": self.wait_after_click_ms,
+            "scroll_into_view": self.scroll_into_view,
+        }
+        previous_timeout = self._current_script_timeout()
+        try:
+            self.driver.set_script_timeout(self.script_timeout)
+            stats = self.driver.execute_async_script(_PAGINATE_SCRIPT, options) or {}
+        except TimeoutException:
+            self.logger.error(
+                f"In-browser pagination did not finish within {self.script_timeout}s.",
+                extra={"event": "pagination_timeout"}
+            )
+            self.failed = True
+            return {}
+        except WebDriverException as e:
+            self.logger.error(
+                "In-browser pagination failed.",
+                extra={"event": "pagination_failed", "error": str(e)}
+            )
+            self.failed = True
+            return {}
+        finally:
+            self._restore_script_timeout(previous_timeout)
+
+        if stats.get("error"):
+            self.logger.error(
+                f"In-browser pagination stopped on a script error: {stats['error']}",
+                extra={"event": "pagination_failed", "error": stats["error"]}
+            )
+            self.failed = True
+        self.trace.set(
+            clicks=stats.get("clicks", 0),
+            idle_clicks=stats.get("idle_clicks", 0),
+            items=stats.get("count", 0),
+            browser_seconds=stats.get("elapsed_ms", 0) / 1000
+        )
+        self.logger.info(
+            f"Pagination done. {stats.get('clicks', 0)} clicks, {stats.get('idle_clicks', 0)} idle attempts, "
+            f"{stats.get('count', 0)} items ({stats.get('reason')}, {stats.get('elapsed_ms', 0)} ms in browser).",
+            extra={"event": "pagination_done", "stats": stats}
+        )
+        return stats
+
+    def _current_script_timeout(self) -> float:
+        """The driver's async script timeout in seconds, so later scripts on a recycled driver keep it."""
+        try:
+            return self.driver.timeouts.script
+        except (WebDriverException, AttributeError):
+            return DEFAULT_SCRIPT_TIMEOUT
+
+    def _restore_script_timeout(self, timeout: float):
+        try:
+            self.driver.set_script_timeout(timeout)
+        except WebDriverException as e:
+            self.logger.debug(f"Could not restore the script timeout: {e}")
+
+    def iter_clicks(self) -> Iterator[int]:
+        """Run the whole loop, then yield the total number of successful clicks once (Paginator-compatible)."""
+        stats = self.scroll_until_done()
+        if stats.get("clicks"):
+            yield stats["clicks"]
@@ -0,0 +1,128 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+
+class Span:
+    """
+    A timed phase of a scrape run. Spans nest explicitly (`parent.span(...)`), so work done lazily by
+    streaming generators is still attributed to the phase that created it. Numeric attributes
+    (counts, byte sizes) are summed when a span is aggregated with `child(...).add(...)`.
+    """
+
+    def __init__(self, name: str, **attrs):
+        self.name = name
+        self.attrs: Dict[str, Any] = dict(attrs)
+        self.children: List["Span"] = []
+        self.seconds = 0.0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attrs) -> Iterator["Span"]:
+        """Time the block as a new child span; set counts on the yielded span while it runs."""
+        child = Span(name, **attrs)
+        with self._lock:
+            self.children.append(child)
+        start = time.perf_counter()
+        try:
+            yield child
+        finally:
+            child.add(time.perf_counter() - start)
+
+    def child(self, name: str) -> "Span":
+        """Return the aggregated child span `name`, creating it on first use (for per-card or per-page phases)."""
+        with self._lock:
+            for child in self.children:
+                if child.name == name:
+                    return child
+            child = Span(name)
+            self.children.append(child)
+            return child
+
+    def add(self, seconds: float = 0.0, calls: int = 1, **counts):
+        """Add one (or `calls`) timed executions and sum the given numeric counts into the attributes."""
+        with self._lock:
+            self.seconds += seconds
+            self.calls += calls
+            for key, value in counts.items():
+                self.attrs[key] = self.attrs.get(key, 0) + value
+
+    def set(self, **attrs):
+        """Set attributes, replacing earlier values."""
+        with self._lock:
+            self.attrs.update(attrs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        span = {"name": self.name, "seconds": round(self.seconds, 6), "calls": self.calls}
+        span.update(self.attrs)
+        if self.children:
+            span["children"] = [child.to_dict() for child in self.children]
+        return span
+
+
+def _flatten(span: Dict[str, Any], path: str = "") -> Iterator[tuple]:
+    """Yield (span path, span dict) for a span dict and all of its descendants."""
+    path = f"{path}/{span['name']}" if path else span["name"]
+    yield path, span
+    for child in span.get("children", []):
+        yield from _flatten(child, path)
+
+
+def _atomic_write(path: Union[str, Path], text: str):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def write_trace_json(traces: Iterable[Dict[str, Any]], path: Union[str, Path]):
+    """Write the span trees of a run (one per category) as JSON."""
+    _atomic_write(path, json.dumps({"created": time.time(), "traces": list(traces)}, indent=2))
+
+
+def prometheus_text(traces: Iterable[Dict[str, Any]], prefix: str = "scraper") -> str:
+    """
+    Render span trees in the Prometheus text exposition format, one series per category and span path.
+    Same-path spans (e.g. every pagination click) are summed; numeric attributes become their own series.
+    Every series is a gauge: the textfile is rewritten with the values of the latest run only, so they are
+    not monotonic counters.
+    """
+    series: Dict[str, Dict[tuple, float]] = {}
+    for trace in traces:
+        category = str(trace.get("category", ""))
+        for path, span in _flatten(trace):
+            labels = (category, path)
+            values = {"span_seconds": span["seconds"], "span_calls": span["calls"]}
+            for key, value in span.items():
+                if key not in ("name", "seconds", "calls", "children") and isinstance(value, (int, float)) \
+                        and not isinstance(value, bool):
+                    values[f"span_{key}"] = value
+            for metric, value in values.items():
+                metric_series = series.setdefault(metric, {})
+                metric_series[labels] = metric_series.get(labels, 0) + value
+
+    lines = []
+    for metric in sorted(series):
+        name = f"{prefix}_{metric}"
+        lines.append(f"# TYPE {name} gauge")
+        for (category, path), value in sorted(series[metric].items()):
+            lines.append(f'{name}{{category="{_label(category)}",span="{_label(path)}"}} {value:g}')
+    lines.append(f"# TYPE {prefix}_last_run_timestamp_seconds gauge")
+    lines.append(f"{prefix}_last_run_timestamp_seconds {time.time():.0f}")
+    return "\n".join(lines) + "\n"
+
+
+def _label(value: str) -> str:
+    """Escape a label value for the text exposition format (backslash, double quote and line feed)."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def write_prometheus(traces: Iterable[Dict[str, Any]], path: Union[str, Path], prefix: str = "scraper"):
+    """Write span metrics as a Prometheus textfile (atomically, for the node_exporter textfile collector)."""
+    _atomic_write(path, prometheus_text(traces, prefix))
@@ -1,12 +1,32 @@
 import argparse
 import logging
+from typing import TYPE_CHECKING
+
 import yaml
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 logger = logging.getLogger(__name__)
 
+# File extensions blocked for each `browser.block_resources.types` entry.
+RESOURCE_TYPE_EXTENSIONS = {
+    "image": ["png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "avif"],
+    "font": ["woff", "woff2", "ttf", "otf", "eot"],
+    "stylesheet": ["css"],
+    "media": ["mp4", "webm", "mp3", "ogg", "wav"],
+    "script": ["js"],
+}
+# Network.setBlockedURLs wildcards per type: the bare extension and the extension followed by a query string
+# (`a.png?v=3`). A trailing `*` alone would also block e.g. `.json` responses for the `script` type.
+RESOURCE_TYPE_PATTERNS = {
+    resource_type: [pattern for ext in extensions for pattern in (f"*.{ext}", f"*.{ext}?*")]
+    for resource_type, extensions in RESOURCE_TYPE_EXTENSIONS.items()
+}
+# Runs before any page script, so the Resource Timing buffer (250 entries by default) cannot fill up before
+# the `navigate` and `paginate` spans read it.
+RESOURCE_TIMING_BUFFER_SCRIPT = "performance.setResourceTimingBufferSize(100000);"
+
 
 def load_config(path: str) -> dict:
     """Load YAML config from the given path."""
@@ -18,8 +38,12 @@ def load_config(path: str) -> dict:
         raise
 
 
-def create_driver(config: dict) -> webdriver.Chrome:
+def create_driver(config: dict) -> "webdriver.Chrome":
     """Create and return a Selenium Chrome WebDriver using config options."""
+    # Imported here so parse-only runs (`--from-html`) never load selenium.
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
     args = config.get("args", {})
     options = Options()
 
@@ -32,6 +56,11 @@ def create_driver(config: dict) -> webdriver.Chrome:
         window_size = [1280, 720]
     options.add_argument(f"--window-size={window_size[0]},{window_size[1]}")
 
+    block_config = config.get("browser", {}).get("block_resources") or {}
+    if block_config.get("enabled", False) and "image" in block_config.get("types", []):
+        # Also stops image decoding for images the URL patterns miss (data: URIs, extensionless URLs).
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
     implicitly_wait = config.get("browser", {}).get("implicitly_wait", 5)
     if not isinstance(implicitly_wait, (int, float)):
         logger.warning("Invalid 'implicitly_wait'. Falling back to 5s.")
@@ -40,6 +69,8 @@ def create_driver(config: dict) -> webdriver.Chrome:
     try:
         driver = webdriver.Chrome(options=options)
         driver.implicitly_wait(implicitly_wait)
+        if block_config.get("enabled", False):
+            block_resources(driver, block_config)
         return driver
     except Exception as e:
         logger.error(f"Failed to create WebDriver: {e}")
@@ -47,6 +78,41 @@ def create_driver(config: dict) -> webdriver.Chrome:
 
 
 
+def blocked_url_patterns(block_config: dict) -> list:
+    """Expand `browser.block_resources` (resource `types` plus raw `url_patterns`) into URL wildcards."""
+    patterns = []
+    for resource_type in block_config.get("types", []):
+        if resource_type not in RESOURCE_TYPE_PATTERNS:
+            logger.warning(f"Unknown resource type '{resource_type}' in browser.block_resources.types, ignored.")
+            continue
+        patterns.extend(RESOURCE_TYPE_PATTERNS[resource_type])
+    patterns.extend(block_config.get("url_patterns", []))
+    return list(dict.fromkeys(patterns))
+
+
+def block_resources(driver, block_config: dict) -> int:
+    """
+    Block matching requests through the Chrome DevTools Protocol (Network.setBlockedURLs): they fail
+    before leaving the browser, for the category page and every 'Load More' response alike. Also enlarges
+    the Resource Timing buffer of every new document, so the trace can count the resources that still load.
+
+    Returns:
+        int: number of URL patterns installed (0 when the driver has no CDP support)
+    """
+    patterns = blocked_url_patterns(block_config)
+    if not patterns:
+        return 0
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": RESOURCE_TIMING_BUFFER_SCRIPT})
+    except Exception as e:
+        logger.warning(f"Resource blocking unavailable: {e}")
+        return 0
+    logger.info(f"Blocking {len(patterns)} resource URL patterns via CDP")
+    return len(patterns)
+
+
 def get_args_with_defaults():
     """Parse CLI args and override config with CLI values if provided."""
     parser = argparse.ArgumentParser()
@@ -63,21 +129,38 @@ def get_args_with_defaults():
     browser_cfg = config.get("browser", {})
 
     # CLI args — no defaults here yet
-    parser.add_argument("--category")
+    parser.add_argument("--category", nargs="+", help="One or more categories, or 'all' for global.categories")
+    parser.add_argument("--workers", type=int, help="Worker processes, each reusing one browser")
     parser.add_argument("--output")
-    parser.add_argument("--format", choices=["json", "csv"])
+    parser.add_argument("--format", choices=["json", "jsonl", "csv", "parquet", "arrow"])
+    parser.add_argument("--compress", choices=["gzip", "zstd"], help="Compress output files")
     parser.add_argument("--headed", action="store_true", help="Run in headed (non-headless) mode")
+    parser.add_argument("--replay", choices=["off", "record", "replay"], help="Record to / replay from replay.snapshot_dir")
+    parser.add_argument(
+        "--from-html", nargs="+", metavar="PATH",
+        help="Parse saved page sources (files, directories or glob patterns) instead of scraping"
+    )
 
     args = parser.parse_args()
 
     # Final merged config: CLI > config > fallback
+    categories = args.category or [global_cfg.get("category", "laptops")]
+    if "all" in categories:
+        categories = global_cfg.get("categories") or [global_cfg.get("category", "laptops")]
     merged = {
-        "category": args.category or global_cfg.get("category", "laptops"),
+        "category": categories[0],
+        "categories": categories,
+        "workers": args.workers or global_cfg.get("workers", 1),
         "output": args.output or global_cfg.get("output_dir", "output"),
         "format": args.format or global_cfg.get("output_format", "json"),
         "headless": not args.headed if "headed" in args else not browser_cfg.get("headed", False),
+        "from_html": args.from_html,
     }
 
+    if args.compress:
+        global_cfg["output_compression"] = args.compress
+    if args.replay:
+        config.setdefault("replay", {})["mode"] = args.replay
     config["args"] = merged
     return argparse.Namespace(**merged), config
 
@@ -0,0 +1,246 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from scraper.enums import JobKind, JobStatus
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    category TEXT NOT NULL,
+    part INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    result TEXT,
+    error TEXT,
+    UNIQUE (kind, category, part)
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, kind, id);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+class Job(NamedTuple):
+    """A leased unit of work: one category listing, or one chunk of a category's detail pages."""
+    id: int
+    kind: JobKind
+    category: str
+    part: int
+    payload: Any
+    attempts: int
+
+
+class JobRecord(NamedTuple):
+    """Stored state of a job, as read by the coordinator."""
+    kind: JobKind
+    part: int
+    status: JobStatus
+    attempts: int
+    payload: Any
+    result: Any
+    error: Optional[str]
+
+
+class WorkQueue:
+    """
+    Durable job queue in one SQLite file, shared by the coordinator and every worker process. WAL mode (the
+    default) serves any number of processes on one host; workers on other hosts need the file on a shared
+    filesystem with working locks and `journal_mode` "delete", since WAL relies on shared memory.
+    Workers lease the oldest queued job for `lease_seconds` and renew the lease while working; a job whose
+    lease expires (crashed worker or host) is queued again until it has been tried `max_attempts` times.
+    Results, and the follow-up jobs a result creates, are committed in the same transaction, so a job is
+    either finished with all its follow-ups or will be retried.
+    """
+
+    def __init__(self, path: Union[str, Path], max_attempts: int = 3, journal_mode: str = "wal", timeout: float = 30):
+        """
+        Args:
+            path: SQLite database file, created on first use.
+            max_attempts (int): leases of a job before it is marked failed.
+            journal_mode (str): SQLite journal mode, "wal" or "delete".
+            timeout (float): seconds to wait for another process's write transaction.
+        """
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None, check_same_thread=False)
+        self.conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block as one write transaction, taking the database write lock up front."""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def enqueue(self, kind: JobKind, category: str, part: int = 0, payload: Any = None) -> bool:
+        """Queue a job unless one with the same kind, category and part exists; returns True when added."""
+        with self._transaction() as conn:
+            return self._insert(conn, kind, category, part, payload)
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, kind: JobKind, category: str, part: int, payload: Any) -> bool:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO jobs (kind, category, part, payload, status) VALUES (?, ?, ?, ?, ?)",
+            (kind.value, category, part, json.dumps(payload), JobStatus.QUEUED.value)
+        )
+        return cursor.rowcount == 1
+
+    def lease(self, worker: str, lease_seconds: float) -> Optional[Job]:
+        """
+        Lease the next job to `worker`: detail chunks before listings, so started categories finish first.
+        Expired leases are requeued (or failed after `max_attempts`) on the way.
+
+        Returns:
+            Job, or None when nothing is queued right now
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            self._expire(conn, now)
+            row = conn.execute(
+                "SELECT id, kind, category, part, payload, attempts FROM jobs WHERE status = ? "
+                "ORDER BY kind = ?, id LIMIT 1",
+                (JobStatus.QUEUED.value, JobKind.LISTING.value)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker = ?, lease_until = ?, attempts = attempts + 1 WHERE id = ?",
+                (JobStatus.LEASED.value, worker, now + lease_seconds, row[0])
+            )
+        return Job(row[0], JobKind(row[1]), row[2], row[3], json.loads(row[4]), row[5] + 1)
+
+    def _expire(self, conn: sqlite3.Connection, now: float):
+        count = self._give_back(conn, "lease expired", "lease_until < ?", now)
+        if count:
+            logger.warning(f"Requeued {count} jobs whose lease expired.", extra={"event": "lease_expired"})
+
+    def _give_back(self, conn: sqlite3.Connection, error: str, condition: str, *params) -> int:
+        """Queue the leased jobs matching `condition` again, or fail those that used up `max_attempts`."""
+        cursor = conn.execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, worker = NULL, lease_until = NULL, "
+            f"error = ? WHERE status = ? AND {condition}",
+            (self.max_attempts, JobStatus.FAILED.value, JobStatus.QUEUED.value, error, JobStatus.LEASED.value, *params)
+        )
+        return cursor.rowcount
+
+    def release_worker(self, worker: str, error: str = "worker exited") -> int:
+        """
+        Give back every job leased to `worker`, known to be dead, without waiting for its leases to expire.
+
+        Returns:
+            int: number of jobs queued again or failed
+        """
+        with self._transaction() as conn:
+            return self._give_back(conn, error, "worker = ?", worker)
+
+    def renew(self, job: Job, worker: str, lease_seconds: float) -> bool:
+        """Extend a lease; False when the job is no longer leased to `worker` (it expired and moved on)."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND worker = ? AND status = ?",
+                (time.time() + lease_seconds, job.id, worker, JobStatus.LEASED.value)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job: Job, worker: str, result: Any, follow_ups: Iterable[tuple] = ()) -> bool:
+        """
+        Store a job's result and queue its follow-up `(kind, category, part, payload)` jobs atomically.
+
+        Returns:
+            bool: False (and nothing stored) when the lease was lost to another worker
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = NULL, lease_until = NULL "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (JobStatus.DONE.value, json.dumps(result), job.id, worker, JobStatus.LEASED.value)
+            )
+            if cursor.rowcount != 1:
+                return False
+            for follow_up in follow_ups:
+                self._insert(conn, *follow_up)
+        return True
+
+    def fail(self, job: Job, worker: str, error: str) -> JobStatus:
+        """Give a job back after an error: queued again, or failed once it has used up `max_attempts`."""
+        status = JobStatus.FAILED if job.attempts >= self.max_attempts else JobStatus.QUEUED
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker = NULL, lease_until = NULL, error = ? "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (status.value, error, job.id, worker, JobStatus.LEASED.value)
+            )
+        return status
+
+    def jobs(self, category: str) -> List[JobRecord]:
+        """All jobs of a category, listing first and detail chunks in part order."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT kind, part, status, attempts, payload, result, error FROM jobs WHERE category = ? "
+                "ORDER BY kind != ?, part",
+                (category, JobKind.LISTING.value)
+            ).fetchall()
+        return [
+            JobRecord(JobKind(kind), part, JobStatus(status), attempts, json.loads(payload),
+                      json.loads(result) if result is not None else None, error)
+            for kind, part, status, attempts, payload, result, error in rows
+        ]
+
+    def unfinished(self) -> Dict[str, int]:
+        """Number of queued or leased jobs per category; a category missing here has nothing left to run."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT category, COUNT(*) FROM jobs WHERE status IN (?, ?) GROUP BY category",
+                (JobStatus.QUEUED.value, JobStatus.LEASED.value)
+            ).fetchall()
+        return dict(rows)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        with self._lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status.value: 0 for status in JobStatus} | dict(rows)
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self._transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def reset(self):
+        """Drop every job and run marker, for a fresh run."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM jobs")
+            conn.execute("DELETE FROM meta")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,149 @@
+import csv
+import gzip
+import importlib.util
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import IO, Iterable, Optional, Union
+
+from pydantic import BaseModel
+
+from scraper.columnar_writer import COLUMNAR_FORMATS, ColumnarWriter
+
+# Output compression -> file suffix appended to the output path.
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def open_output(path: Union[str, Path], compression: Optional[str] = None, newline: Optional[str] = None) -> IO[str]:
+    """Open a text file for writing, transparently gzip- or zstd-compressed."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not compression:
+        return path.open("w", encoding="utf-8", newline=newline)
+    if compression == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8", newline=newline)
+    if compression == "zstd":
+        if importlib.util.find_spec("zstandard") is None:
+            raise RuntimeError("zstd output requires the 'zstandard' package (pip install zstandard)")
+        import zstandard
+        return zstandard.open(path, "wt", encoding="utf-8", newline=newline)
+    raise ValueError(f"Unsupported output compression: {compression}")
+
+
+class StreamWriter(ABC):
+    """
+    Writes Pydantic models one at a time as they arrive. The file is opened on the first record,
+    so an empty stream creates no file, and it is flushed every `flush_every` records.
+    """
+
+    newline: Optional[str] = None
+
+    def __init__(self, path: Union[str, Path], compression: Optional[str] = None, flush_every: int = 500):
+        self.path = Path(path)
+        self.compression = compression
+        self.flush_every = flush_every
+        self.count = 0
+        self.file: Optional[IO[str]] = None
+
+    def write(self, model: BaseModel):
+        record = model.model_dump(mode="json")
+        if self.file is None:
+            self.file = open_output(self.path, self.compression, newline=self.newline)
+            self._start(record)
+        self._write_record(record)
+        self.count += 1
+        if self.flush_every and self.count % self.flush_every == 0:
+            self.file.flush()
+
+    def write_all(self, models: Iterable[BaseModel]) -> int:
+        """Write every model of the iterable, close the file and return the number of records written."""
+        try:
+            for model in models:
+                self.write(model)
+        finally:
+            self.close()
+        return self.count
+
+    def close(self):
+        if self.file is None:
+            return
+        self._finish()
+        self.file.close()
+        self.file = None
+
+    def _start(self, record: dict):
+        pass
+
+    @abstractmethod
+    def _write_record(self, record: dict):
+        """Write one record to the open file; implemented by every output format."""
+        pass
+
+    def _finish(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JsonLinesWriter(StreamWriter):
+    """One compact JSON object per line."""
+
+    def _write_record(self, record: dict):
+        self.file.write(json.dumps(record, ensure_ascii=False))
+        self.file.write("\n")
+
+
+class JsonArrayWriter(StreamWriter):
+    """An indented JSON array, byte-identical to `json.dump(records, indent=2)`, written record by record."""
+
+    def _start(self, record: dict):
+        self.file.write("[")
+
+    def _write_record(self, record: dict):
+        item = json.dumps(record, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+        self.file.write(("\n  " if self.count == 0 else ",\n  ") + item)
+
+    def _finish(self):
+        self.file.write("\n]")
+
+
+class CsvWriter(StreamWriter):
+    """CSV with the header taken from the first record's fields."""
+
+    newline = ""
+
+    def _start(self, record: dict):
+        self.writer = csv.DictWriter(self.file, fieldnames=record.keys())
+        self.writer.writeheader()
+
+    def _write_record(self, record: dict):
+        self.writer.writerow(record)
+
+
+WRITERS = {"json": JsonArrayWriter, "jsonl": JsonLinesWriter, "csv": CsvWriter}
+
+
+def output_path(output_dir: str, name: str, output_format: str, compression: Optional[str] = None) -> str:
+    """Build `{output_dir}/{name}.{format}` plus the compression suffix (columnar formats compress internally)."""
+    suffix = "" if output_format in COLUMNAR_FORMATS else COMPRESSION_SUFFIXES.get(compression or "", "")
+    return f"{output_dir}/{name}.{output_format}{suffix}"
+
+
+def write_stream(
+    models: Iterable[BaseModel],
+    path: Union[str, Path],
+    output_format: str,
+    compression: Optional[str] = None,
+    flush_every: int = 500
+) -> int:
+    """Stream models into `path` in the given format and return how many were written."""
+    if output_format in COLUMNAR_FORMATS:
+        return ColumnarWriter(path, output_format, compression).write_all(models)
+    writer_class = WRITERS.get(output_format)
+    if writer_class is None:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    return writer_class(path, compression, flush_every).write_all(models)
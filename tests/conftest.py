@@ -1,3 +1,7 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
 import pytest
 import yaml
 from selenium import webdriver
@@ -15,7 +19,7 @@ def pytest_addoption(parser):
 
 @pytest.fixture(scope="session")
 def config():
-    with open("test_config.yaml", encoding="utf-8") as f:
+    with open(Path(__file__).parent / "test_config.yaml", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
 
@@ -47,3 +51,71 @@ def driver(request, config):
     drv.implicitly_wait(implicit_wait)
     yield drv
     drv.quit()
+
+
+def card_html(index: int, price: float = 100.0) -> str:
+    """Render one listing card in the shape of the webscraper.io test site."""
+    return (
+        '<div class="thumbnail"><div class="caption">'
+        f'<h4 class="price">${price + index:.2f}</h4>'
+        f'<h4><a href="/test-sites/e-commerce/more/product/{index}" class="title">Lenovo V{index}</a></h4>'
+        f'<p class="description">Lenovo V{index}, 15.6" HD, Core i3-6006U, 4GB, 128GB SSD, Windows 10 Home</p>'
+        '</div><div class="ratings"><p class="pull-right">7 reviews</p>'
+        '<p data-rating="4"><span class="ws-icon ws-icon-star"></span><span class="ws-icon ws-icon-star"></span></p>'
+        '</div></div>'
+    )
+
+
+def listing_html(indexes) -> str:
+    """Render a listing page (or 'Load More' response) containing the given cards."""
+    return "<html><body>" + "".join(card_html(i) for i in indexes) + "</body></html>"
+
+
+def detail_html(index: int, rating: int) -> str:
+    """Render a product detail page with the given star rating and two storage swatches."""
+    return (
+        '<html><body><div class="card thumbnail"><div class="caption">'
+        f'<h4 class="price">${100 + index:.2f}</h4><h4 class="title">Lenovo V{index}</h4>'
+        f'<p class="description">Lenovo V{index}, 15.6" HD, Core i3-6006U, 4GB, 128GB SSD, Windows 10 Home</p>'
+        '<div class="swatches"><button class="btn swatch" value="128">128</button>'
+        '<button class="btn swatch" value="256">256</button></div></div>'
+        f'<div class="ratings"><p class="review-count">7 reviews</p><p data-rating="{rating}"></p></div>'
+        '</div></body></html>'
+    )
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves `server.routes` ({path: (status, body, headers)}) over keep-alive HTTP/1.1."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append(self.path)
+            self.server.clients.add(self.client_address)
+        status, body, headers = self.server.routes.get(self.path, (404, "not found", {}))
+        payload = body.encode("utf-8") if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in_server():
+    """Local HTTP stand-in for the target site; set `routes` and read `url`, `requests` and `clients`."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.routes, server.requests, server.clients = {}, [], set()
+    server.lock = threading.Lock()
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,89 @@
+import logging
+import time
+
+import pytest
+
+from scraper.adaptive_wait import DEFAULT_POLL_INTERVAL, AdaptiveWait
+from scraper.click_executor import ClickExecutor
+from scraper.enums import ClickStatus
+
+
+class FakeButton:
+    def is_displayed(self):
+        return True
+
+    def click(self):
+        pass
+
+
+class FakeDriver:
+    def find_element(self, by, value):
+        return FakeButton()
+
+
+def executor(**adaptive_waits):
+    logger = logging.LoggerAdapter(logging.getLogger("test"), {"event": "test"})
+    return ClickExecutor(FakeDriver(), logger, lambda name: "load-more", 5, 5, adaptive_waits=adaptive_waits)
+
+
+@pytest.mark.unit
+def test_timeout_follows_the_rolling_percentile_within_bounds():
+    wait = AdaptiveWait(5, enabled=True, percentile=0.9, multiplier=3, min_samples=3, min_wait_time=0.5)
+    for seconds in (0.2, 0.3):
+        wait.observe(seconds)
+    assert wait.timeout == 5  # too few samples yet
+
+    for seconds in (0.2, 0.4, 0.2, 0.3, 0.2, 0.2, 0.3, 0.2):
+        wait.observe(seconds)
+    assert wait.timeout == pytest.approx(0.9)  # 3 x the 9th of 10 sorted waits
+    assert wait.poll_interval == pytest.approx(0.04)
+
+    wait.observe(30)
+    wait.observe(30)
+    assert wait.timeout == 20  # 4 x the configured wait by default
+
+
+@pytest.mark.unit
+def test_timeouts_back_off_exponentially_until_a_wait_succeeds():
+    wait = AdaptiveWait(5, enabled=True, min_samples=1, max_wait_time=10)
+    wait.observe(0.5)
+    wait.timed_out()
+    wait.timed_out()
+    assert wait.timeout == 6
+    wait.timed_out()
+    assert wait.timeout == 10
+
+    wait.observe(0.5)
+    assert wait.timeout == 1.5
+
+
+@pytest.mark.unit
+def test_disabled_wait_keeps_configured_values_but_reports_stats():
+    wait = AdaptiveWait(5)
+    for seconds in (0.1, 0.2, 0.3, 0.4, 0.5, 0.6):
+        wait.observe(seconds)
+    wait.timed_out()
+
+    assert wait.timeout == 5 and wait.poll_interval == DEFAULT_POLL_INTERVAL
+    assert wait.stats() == {
+        "samples": 6, "timeouts": 1, "p50": 0.3, "p95": 0.6, "timeout": 5, "poll_interval": DEFAULT_POLL_INTERVAL
+    }
+
+
+@pytest.mark.unit
+def test_click_executor_stops_waiting_after_the_learned_timeout():
+    click = executor(enabled=True, percentile=0.5, min_samples=3, min_wait_time=0.05, multiplier=2)
+    for _ in range(3):
+        ready = time.time() + 0.02
+        assert click.try_click_and_wait("load_more", lambda: time.time() >= ready) == ClickStatus.SUCCESS
+
+    start = time.time()
+    status = click.try_click_and_wait("load_more", lambda: False)
+    elapsed = time.time() - start
+
+    stats = click.wait_stats()
+    assert status == ClickStatus.NO_NEW_ITEMS
+    assert elapsed < 1  # instead of the configured 5 s
+    assert stats["content"]["samples"] == 3 and stats["content"]["timeouts"] == 1
+    assert stats["content"]["poll_interval"] < DEFAULT_POLL_INTERVAL
+    assert stats["button"]["samples"] == 4
@@ -0,0 +1,59 @@
+import logging
+from urllib.parse import urljoin
+
+import pytest
+
+from scraper.card_parser import CardParser
+from scraper.models import StructuredProduct
+
+
+def row(index, price="$100.00"):
+    return [f"Lenovo V{index}", price, 4, f"{index} reviews",
+            f'Lenovo V{index}, 15.6", Core i3-6006U, 4GB, 128GB SSD, Windows 10 Home', f"/product/{index}"]
+
+
+@pytest.fixture
+def parser(config):
+    return CardParser(
+        lambda key: key, config, logging.LoggerAdapter(logging.getLogger("test"), {"category": "laptops"}),
+        {"USD": 1.0, "EUR": 0.5}, "EUR"
+    )
+
+
+@pytest.mark.unit
+def test_parse_batch_skips_invalid_rows_and_keeps_order(parser, caplog):
+    rows = [row(0), row(1, price="free"), row(2, price=None), row(3)]
+
+    with caplog.at_level(logging.WARNING):
+        products = parser.parse_batch(rows)
+
+    assert [p.name for p in products] == ["Lenovo V0", "Lenovo V3"]
+    assert products[1].num_reviews == 3 and products[1].price_usd == 100.0
+    assert products[0].last_scraped is products[1].last_scraped
+    assert [r.getMessage() for r in caplog.records] == [
+        "Failed to parse product card: Missing product price",
+        "Failed to parse product card: Exception during parsing",
+    ]
+
+
+@pytest.mark.unit
+def test_to_structured_batch_matches_single_conversion(parser):
+    rows = [row(i, price=f"${100 + i}.50") for i in range(5)]
+
+    batch = parser.to_structured_batch(rows)
+    single = [parser.fields_to_structured(r) for r in rows]
+
+    assert all(isinstance(p, StructuredProduct) for p in batch)
+    assert len({p.last_scraped for p in batch}) == 1
+    exclude = {"last_scraped"}
+    assert [p.model_dump(exclude=exclude) for p in batch] == [p.model_dump(exclude=exclude) for p in single]
+    assert [p.price for p in batch] == [50.25, 50.75, 51.25, 51.75, 52.25]
+    assert batch[0].currency == "EUR" and batch[0].ram_gb == 4 and batch[0].specs is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("href", ["/p/1?x=2#f", "p/1", "//cdn.example/p/1", "/a/../p/1", "https://other.example/p/1"])
+def test_parse_batch_resolves_urls_like_urljoin(parser, config, href):
+    (product,) = parser.parse_batch([row(0)[:5] + [href]])
+
+    assert product.url == urljoin(config["base_url"], href)
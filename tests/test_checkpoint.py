@@ -0,0 +1,121 @@
+import copy
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from conftest import card_html, listing_html
+from scraper.checkpoint import PaginationCheckpoint
+from scraper.models import RawProduct
+from scraper.product_list_extractor import ProductListExtractor
+
+CATEGORY_PATH = "/test-sites/e-commerce/more/computers/laptops"
+
+
+def raw(index):
+    return RawProduct(
+        name=f"Lenovo V{index}", price_usd=100.0, rating=4.0, num_reviews=7, description_raw="",
+        url=f"https://webscraper.io/product/{index}", last_scraped=datetime(2025, 5, 20)
+    )
+
+
+class FakeDom:
+    """Driver stand-in whose 'Load More' appends `per_click` cards; serves CardHarvester's slice script."""
+
+    def __init__(self, cards: int, per_click: int):
+        self.cards = [card_html(i) for i in range(cards)]
+        self.per_click = per_click
+        self.loaded = per_click
+
+    def get(self, url):
+        pass
+
+    def execute_script(self, script, *args):
+        if args:
+            return self.cards[args[1]:self.loaded]
+        return [0, 0]
+
+
+class FakePaginator:
+    def __init__(self, dom: FakeDom, fail_at=None):
+        self.dom, self.fail_at, self.failed = dom, fail_at, False
+
+    def iter_clicks(self):
+        click = 0
+        while self.dom.loaded < len(self.dom.cards):
+            if click + 1 == self.fail_at:
+                self.failed = True
+                return
+            click += 1
+            self.dom.loaded += self.dom.per_click
+            yield click
+
+
+@pytest.fixture
+def checkpoint_config(config, tmp_path):
+    cfg = copy.deepcopy(config)
+    cfg["products"]["streaming"] = True
+    cfg["checkpoint"] = {"enabled": True, "dir": str(tmp_path / "checkpoints")}
+    return cfg
+
+
+@pytest.mark.unit
+def test_resume_drops_journal_lines_after_the_last_state(tmp_path):
+    checkpoint = PaginationCheckpoint(tmp_path, "laptops", {"structured": False})
+    checkpoint.record([raw(0), raw(1)], clicks=1, harvested=2)
+    checkpoint.close()
+    with open(checkpoint.journal_path, "a", encoding="utf-8") as f:
+        f.write(raw(2).model_dump_json() + "\n" + '{"name": "torn')
+
+    state, products = PaginationCheckpoint(tmp_path, "laptops", {"structured": False}).resume()
+
+    assert state["clicks"] == 1 and state["harvested"] == 2
+    assert [p.name for p in products] == ["Lenovo V0", "Lenovo V1"]
+    assert checkpoint.journal_path.read_bytes().count(b"\n") == 2
+    assert PaginationCheckpoint(tmp_path, "laptops", {"structured": True}).resume() == ({}, [])
+    assert not checkpoint.state_path.exists()
+
+
+@pytest.mark.unit
+def test_streaming_run_resumes_after_a_failed_click(checkpoint_config):
+    first = ProductListExtractor(FakeDom(18, 3), checkpoint_config, "laptops")
+    first._paginator = lambda trace=None: FakePaginator(first.driver, fail_at=3)
+    emitted = []
+    with pytest.raises(RuntimeError, match="after 2 clicks"):
+        for product in first.extract():
+            emitted.append(product.name)
+
+    second = ProductListExtractor(FakeDom(18, 3), checkpoint_config, "laptops")
+    second._paginator = lambda trace=None: FakePaginator(second.driver)
+    starts = []
+    original = second.driver.execute_script
+    second.driver.execute_script = lambda script, *args: starts.extend(args[1:]) or original(script, *args)
+    resumed = [product.name for product in second.extract()]
+
+    assert emitted == [f"Lenovo V{i}" for i in range(9)]
+    assert resumed == [f"Lenovo V{i}" for i in range(18)]
+    # The resumed run harvests from the saved card index instead of the first card.
+    assert starts[0] == 9
+    assert not any(Path(checkpoint_config["checkpoint"]["dir"]).iterdir())
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("crash_after, resume_page", [(2, 2), (10, 4)])  # on the category page / on page 3
+def test_http_run_resumes_at_the_next_load_more_page(checkpoint_config, stand_in_server, crash_after, resume_page):
+    cfg = copy.deepcopy(checkpoint_config)
+    cfg["base_url"] = stand_in_server.url
+    cfg["products"]["fetch_mode"] = "http"
+    cfg["http"] = {"concurrency": 1, "max_retries": 0}
+    stand_in_server.routes[CATEGORY_PATH] = (200, listing_html(range(4)), {})
+    for page in range(2, 6):
+        stand_in_server.routes[f"{CATEGORY_PATH}?page={page}"] = (200, listing_html(range(page * 4 - 4, page * 4)), {})
+
+    products = ProductListExtractor(None, cfg, "laptops").extract()
+    crashed = [next(products).name for _ in range(crash_after)]
+    products.close()  # the process dies while a page is being written
+    stand_in_server.requests.clear()
+    resumed = [p.name for p in ProductListExtractor(None, cfg, "laptops").extract()]
+
+    assert crashed == [f"Lenovo V{i}" for i in range(crash_after)]
+    assert resumed == [f"Lenovo V{i}" for i in range(20)]
+    assert stand_in_server.requests[0] == f"{CATEGORY_PATH}?page={resume_page}"
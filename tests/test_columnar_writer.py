@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from scraper.models import StructuredProduct
+from scraper.writers import output_path, write_stream
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def products(count):
+    for i in range(count):
+        yield StructuredProduct(
+            name=f"Lenovo V{i}", price=100.5 + i, currency="RON", rating=4.0, num_reviews=i,
+            description="Lenovo", url=f"https://webscraper.io/product/{i}",
+            last_scraped=datetime(2025, 5, 20, tzinfo=timezone.utc), brand="Lenovo", screen_inches=15.6,
+            ram_gb=8 if i % 2 else None, storage_gb=256, cpu="Core i5", os="Windows 10 Home",
+            specs={"storage_options": "128, 256"} if i == 0 else None
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("output_format", ["parquet", "arrow"])
+def test_columnar_output_is_typed(tmp_path, output_format):
+    path = output_path(str(tmp_path), "laptops_structured", output_format, "zstd")
+
+    assert path.endswith(f".{output_format}")
+    from scraper import columnar_writer
+    assert columnar_writer.ColumnarWriter(path, output_format, "zstd", row_group_size=40).write_all(products(100)) == 100
+
+    if output_format == "parquet":
+        table = pq.read_table(path)
+        assert pq.ParquetFile(path).metadata.num_row_groups == 3
+    else:
+        table = pa.ipc.open_file(path).read_all()
+    assert table.num_rows == 100
+    assert table.schema.field("price").type == pa.float64()
+    assert table.schema.field("ram_gb").type == pa.int32()
+    assert pa.types.is_dictionary(table.schema.field("cpu").type)
+    assert table.column("ram_gb").null_count == 50
+    assert table.column("specs")[0].as_py() == [("storage_options", "128, 256")]
+
+
+@pytest.mark.unit
+def test_write_stream_dispatches_parquet(tmp_path):
+    assert write_stream(products(5), tmp_path / "out.parquet", "parquet") == 5
+    assert pq.read_table(tmp_path / "out.parquet").column("name")[4].as_py() == "Lenovo V4"
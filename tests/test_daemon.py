@@ -0,0 +1,92 @@
+import copy
+import threading
+
+import pytest
+import requests
+
+from conftest import listing_html
+from scraper import daemon as daemon_module
+from scraper import driver_pool
+from scraper.daemon import ScrapeDaemon, serve
+
+
+class FakeDriver:
+    def quit(self):
+        self.closed = True
+
+
+@pytest.fixture
+def job_api(config, stand_in_server, tmp_path, monkeypatch):
+    created = []
+    monkeypatch.setattr(driver_pool, "create_driver", lambda config: created.append(FakeDriver()) or created[-1])
+    cfg = copy.deepcopy(config)
+    cfg["base_url"] = stand_in_server.url
+    cfg["products"]["fetch_mode"] = "http"
+    cfg["global"]["output_dir"] = str(tmp_path)
+    stand_in_server.routes["/test-sites/e-commerce/more/computers/laptops"] = (200, listing_html(range(5)), {})
+
+    daemon = ScrapeDaemon(cfg, workers=2)
+    server = serve(daemon, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", daemon, created
+    server.shutdown()
+    server.server_close()
+    daemon.close()
+
+
+@pytest.mark.unit
+def test_jobs_run_on_the_warm_pool_and_return_outputs(job_api, tmp_path):
+    url, daemon, created = job_api
+
+    done = requests.post(f"{url}/jobs", json={"category": "laptops", "format": "csv", "wait": True}).json()
+    queued = requests.post(f"{url}/jobs", json={"category": "laptops", "structured": False, "format": "jsonl"})
+    assert queued.status_code == 202
+    daemon.wait(queued.json()["id"])
+    raw = requests.get(f"{url}/jobs/{queued.json()['id']}").json()
+
+    assert done["status"] == "ok"
+    assert done["result"]["products"] == 5
+    assert done["result"]["output"] == f"{tmp_path}/laptops_structured.csv"
+    assert done["result"]["trace_file"].endswith("trace.json")
+    assert raw["result"]["output"] == f"{tmp_path}/laptops_raw.jsonl"
+    assert requests.get(f"{url}/health").json()["ok"] == 2
+    # fetch_mode http needs no browser, so none was launched.
+    assert created == []
+
+
+@pytest.mark.unit
+def test_a_job_failing_outside_run_job_is_reported_as_failed(job_api, monkeypatch):
+    url, daemon, _ = job_api
+
+    def broken_export(config, traces, output_dir):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(daemon_module, "export_traces", broken_export)
+    job = requests.post(f"{url}/jobs", json={"category": "laptops", "wait": True}).json()
+
+    assert job["status"] == "failed"
+    assert job["error"] == "disk full"
+    assert job["finished"] >= job["submitted"]
+    assert requests.get(f"{url}/jobs/{job['id']}").json()["status"] == "failed"
+    assert daemon.browsers.qsize() == 2  # the browser went back to the pool
+
+
+@pytest.mark.unit
+def test_invalid_jobs_are_rejected(job_api):
+    url, _, _ = job_api
+
+    assert requests.post(f"{url}/jobs", json={"format": "csv"}).status_code == 400
+    assert requests.post(f"{url}/jobs", json={"category": "laptops", "format": "xml"}).status_code == 400
+    assert requests.get(f"{url}/jobs/unknown").status_code == 404
+
+
+@pytest.mark.unit
+def test_browsers_are_started_once_and_reused(config, monkeypatch):
+    created = []
+    monkeypatch.setattr(driver_pool, "create_driver", lambda config: created.append(FakeDriver()) or created[-1])
+
+    daemon = ScrapeDaemon(copy.deepcopy(config), workers=2)
+    assert len(created) == 2
+    daemon.close()
+    assert all(driver.closed for driver in created)
@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from scraper.description_parser import DescriptionParser
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("description, expected", [
+    (
+        'Lenovo V510 Black, 15.6" HD, Core i3-6006U, 4GB, 128GB SSD, Windows 10 Home',
+        {"screen_inches": 15.6, "ram_gb": 4, "storage_gb": 132, "cpu": "Core i3-6006U", "os": "Windows 10 Home"},
+    ),
+    (
+        'Asus VivoBook, 14″, Celeron N3350, 2GB, 1TB + 32GB eMMC, Win7 Pro 64bit',
+        {"screen_inches": 14.0, "ram_gb": 2, "storage_gb": 1058, "cpu": "Celeron N3350", "os": "Win7 Pro 64bit"},
+    ),
+    (
+        'Apple MacBook Air 13.3", Intel Core i5 1.8GHz, 8GB, 128GB SSD, macOS',
+        {"screen_inches": 13.3, "ram_gb": 8, "storage_gb": 136, "cpu": "Apple MacBook Air 13.3\"", "os": "macOS"},
+    ),
+    (
+        'Packard 255 G2, 15.6", AMD E2-3800 1.3GHz, 4GB, 500GB, Linux, Windows 10 Pro + Office',
+        {"screen_inches": 15.6, "ram_gb": 4, "storage_gb": 504, "cpu": "AMD E2-3800 1.3GHz", "os": "Windows 10 Pro + Office"},
+    ),
+    ("Prestigio SmartBook, 14.1\", Atom, 2GB, 32GB, FreeDOS", {"os": "FreeDOS", "cpu": None}),
+    ("", {"screen_inches": None, "ram_gb": None, "storage_gb": None, "cpu": None, "os": None}),
+])
+def test_parse_extracts_specs(description, expected):
+    parsed = DescriptionParser.parse(description, "Lenovo V510")
+
+    assert parsed["brand"] == "Lenovo"
+    assert {key: parsed[key] for key in expected} == expected
+
+
+@pytest.mark.unit
+def test_parse_results_are_memoized_and_safe_to_mutate():
+    description = 'Dell Inspiron, 15.6", Core i7-7500U, 16GB, 512GB SSD, Windows 10 Pro'
+    first = DescriptionParser.parse(description, "Dell Inspiron")
+    first["ram_gb"] = 0
+    hits = DescriptionParser.cache_info().hits
+
+    assert DescriptionParser.parse(description, "Dell Inspiron")["ram_gb"] == 16
+    assert DescriptionParser.cache_info().hits == hits + 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("description", [
+    "1" * 50_000 + "x",
+    "windows 10 " + "a " * 50_000 + "+",
+    "win pro " * 10_000,
+    "i1" * 25_000,
+])
+def test_parse_is_linear_on_adversarial_input(description):
+    start = time.perf_counter()
+    DescriptionParser.parse(description, "x")
+    assert time.perf_counter() - start < 1.0
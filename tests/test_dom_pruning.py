@@ -0,0 +1,105 @@
+import copy
+import logging
+
+import pytest
+
+from conftest import card_html
+from scraper.card_harvester import CardHarvester
+from scraper.click_executor import ClickExecutor, _COUNT_SCRIPT
+from scraper.enums import DomPruning
+from scraper.product_list_extractor import ProductListExtractor
+
+
+class PruningDom:
+    """Driver stand-in that keeps the live cards in a list and applies the harvest script's pruning mode."""
+
+    def __init__(self, cards: int, per_click: int):
+        self.pending = [card_html(i) for i in range(cards)]
+        self.per_click = per_click
+        self.live = []
+        self.pruned = 0
+        self.peak = 0
+        self.slice_starts = []
+        self.load_more()
+
+    def load_more(self):
+        self.live += self.pending[:self.per_click]
+        del self.pending[:self.per_click]
+        self.peak = max(self.peak, len(self.live))
+
+    def get(self, url):
+        pass
+
+    def execute_script(self, script, *args):
+        if script == _COUNT_SCRIPT:
+            return len(self.live) + self.pruned
+        if not args:
+            return [0, 0]
+        _, start, pruning = args
+        self.slice_starts.append(start)
+        fragments = self.live[start:]
+        if pruning != DomPruning.OFF.value:
+            self.pruned += len(self.live)
+            self.live = []
+        return fragments
+
+
+class FakePaginator:
+    def __init__(self, dom: PruningDom):
+        self.dom, self.failed = dom, False
+
+    def iter_clicks(self):
+        click = 0
+        while self.dom.pending:
+            click += 1
+            self.dom.load_more()
+            yield click
+
+
+def adapter():
+    return logging.LoggerAdapter(logging.getLogger("test"), {"event": "test"})
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pruning", [DomPruning.OFF, DomPruning.REMOVE])
+def test_harvester_slices_from_the_cards_still_in_the_dom(pruning):
+    dom = PruningDom(9, 3)
+    harvester = CardHarvester(dom, adapter(), lambda name: ".thumbnail", pruning=pruning)
+
+    batches = []
+    batches.append(len(harvester.harvest()))
+    dom.load_more()
+    batches.append(len(harvester.harvest()))
+    dom.load_more()
+    batches.append(len(harvester.harvest()))
+
+    assert batches == [3, 3, 3]
+    assert harvester.harvested == 9
+    if pruning == DomPruning.OFF:
+        assert dom.slice_starts == [0, 3, 6] and harvester.pruned == 0
+    else:
+        assert dom.slice_starts == [0, 0, 0] and harvester.pruned == 9 and dom.live == []
+
+
+@pytest.mark.unit
+def test_card_count_includes_pruned_cards():
+    dom = PruningDom(6, 3)
+    CardHarvester(dom, adapter(), lambda name: ".thumbnail", pruning=DomPruning.REMOVE).harvest()
+    dom.load_more()
+    executor = ClickExecutor(dom, adapter(), lambda name: ".thumbnail")
+
+    assert executor.get_count("product_card") == 6
+
+
+@pytest.mark.unit
+def test_streaming_extract_with_pruning_keeps_the_dom_small(config):
+    cfg = copy.deepcopy(config)
+    cfg["products"]["streaming"] = True
+    cfg["products"]["dom_pruning"] = "remove"
+    extractor = ProductListExtractor(PruningDom(30, 3), cfg, "laptops")
+    extractor._paginator = lambda trace=None: FakePaginator(extractor.driver)
+
+    names = [product.name for product in extractor.extract()]
+
+    assert names == [f"Lenovo V{i}" for i in range(30)]
+    assert extractor.driver.peak == 3
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import threading
+import time
+from multiprocessing import Process
+
+import pytest
+import requests
+
+from scraper.click_executor import ClickExecutor
+from scraper.enums import ClickStatus
+from scraper.governor import RateGovernor
+from scraper.http_fetcher import HttpFetcher
+
+
+def hold_slots(path: str, count: int):
+    governor = RateGovernor(path, rate=10, burst=1)
+    for _ in range(count):
+        with governor.slot("http://shop.test/page"):
+            pass
+
+
+@pytest.mark.unit
+def test_token_bucket_allows_a_burst_then_paces_requests():
+    governor = RateGovernor(rate=20, burst=2)
+
+    start = time.perf_counter()
+    for _ in range(10):
+        with governor.slot("http://shop.test/page"):
+            pass
+    elapsed = time.perf_counter() - start
+
+    assert 0.35 < elapsed < 0.8  # 8 requests beyond the burst at 20/s
+    assert governor.stats()["requests"] == 10 and governor.stats()["waits"] == 8
+    with governor.slot("http://other.test/"):  # other hosts have their own bucket
+        pass
+    assert governor.stats()["waits"] == 8
+
+
+@pytest.mark.unit
+def test_concurrency_cap_holds_across_threads_and_asyncio_tasks():
+    governor = RateGovernor(rate=1000, burst=1000, max_concurrency=2)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def enter():
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+
+    def leave():
+        with lock:
+            active[0] -= 1
+
+    def request():
+        with governor.slot("http://shop.test/page"):
+            enter()
+            time.sleep(0.05)
+            leave()
+
+    threads = [threading.Thread(target=request) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] == 2
+
+    async def task():
+        async with governor.slot_async("http://shop.test/page"):
+            enter()
+            await asyncio.sleep(0.05)
+            leave()
+
+    async def main():
+        await asyncio.gather(*(task() for _ in range(6)))
+
+    peak[0] = 0
+    asyncio.run(main())
+    assert peak[0] == 2
+    assert governor.host_state("shop.test")["in_flight"] == 0
+
+
+@pytest.mark.unit
+def test_worker_processes_share_one_bucket(tmp_path):
+    path = str(tmp_path / "governor.sqlite")
+    start = time.perf_counter()
+    processes = [Process(target=hold_slots, args=(path, 5)) for _ in range(2)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert time.perf_counter() - start >= 0.85  # 10 requests at 10/s with a burst of 1
+
+
+@pytest.mark.unit
+def test_throttled_response_slows_down_and_pauses_the_host(stand_in_server):
+    stand_in_server.routes["/busy"] = (429, "slow down", {"Retry-After": "0.3"})
+    governor = RateGovernor(rate=10, burst=10, slowdown=0.5)
+    fetcher = HttpFetcher(max_retries=0, governor=governor)
+    host = RateGovernor.host(stand_in_server.url)
+
+    with pytest.raises(requests.HTTPError):
+        fetcher.get(f"{stand_in_server.url}/busy")
+
+    assert governor.host_state(host)["rate"] == 5
+    start = time.perf_counter()
+    with governor.slot(stand_in_server.url):
+        pass
+    assert time.perf_counter() - start >= 0.25
+    assert fetcher.governor_stats()["throttled"] == 1 and fetcher.governor_stats()["slowdowns"] == 1
+    fetcher.close()
+
+
+@pytest.mark.unit
+def test_rising_latency_slows_down_and_quiet_intervals_recover():
+    governor = RateGovernor(rate=10, burst=100, latency_factor=2, adjust_interval=0, min_rate=1)
+    host = "http://shop.test/"
+
+    def request(latency: float, timed: bool = True):
+        permit = governor.acquire(RateGovernor.host(host))
+        permit.start -= latency
+        permit.timed = timed
+        governor.release(permit)
+
+    for _ in range(3):
+        request(0.1)
+    request(10.0, timed=False)  # e.g. a 'Load More' wait that timed out: not a latency sample
+    assert governor.host_state("shop.test")["rate"] == 10
+    request(1.0)
+    assert governor.host_state("shop.test")["rate"] == 5
+    for _ in range(20):
+        request(0.1)
+    assert governor.host_state("shop.test")["rate"] == 10
+
+
+class FakeButton:
+    def is_displayed(self):
+        return True
+
+    def click(self):
+        pass
+
+
+class FakeDriver:
+    def find_element(self, by, value):
+        return FakeButton()
+
+
+@pytest.mark.unit
+def test_slow_clicks_do_not_count_as_rising_http_latency():
+    governor = RateGovernor(rate=100, burst=100, latency_factor=2, adjust_interval=0)
+    url = "http://shop.test/laptops"
+    for _ in range(3):
+        with governor.slot(url):
+            pass  # fast HTTP requests set the baseline
+    logger = logging.LoggerAdapter(logging.getLogger("test"), {"event": "test"})
+    click = ClickExecutor(FakeDriver(), logger, lambda name: "load-more", 5, 5, governor=governor, page_url=url)
+
+    for _ in range(3):
+        ready = time.time() + 0.05
+        assert click.try_click_and_wait("load_more", lambda: time.time() >= ready) == ClickStatus.SUCCESS
+
+    assert governor.stats()["requests"] == 6 and governor.stats()["slowdowns"] == 0
+    assert governor.host_state("shop.test")["rate"] == 100
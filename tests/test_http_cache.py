@@ -0,0 +1,133 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from scraper.http_cache import HttpCache
+from scraper.http_fetcher import HttpFetcher
+from scraper.replay import SnapshotStore
+
+
+@pytest.fixture
+def cached_fetcher(tmp_path):
+    def create(ttl=3600, max_bytes=1024 * 1024):
+        return HttpFetcher(max_retries=0, cache=HttpCache(tmp_path / "http.sqlite", ttl=ttl, max_bytes=max_bytes))
+    return create
+
+
+@pytest.mark.unit
+def test_fresh_responses_are_served_from_disk_across_fetchers(stand_in_server, cached_fetcher):
+    stand_in_server.routes["/page"] = (200, "<p>one</p>", {"ETag": '"v1"'})
+
+    with cached_fetcher() as first:
+        assert first.get_text(f"{stand_in_server.url}/page") == "<p>one</p>"
+    with cached_fetcher() as second:
+        assert second.get_text(f"{stand_in_server.url}/page") == "<p>one</p>"
+        assert second.cache_stats()["hits"] == 1
+
+    assert stand_in_server.requests == ["/page"]
+
+
+@pytest.mark.unit
+def test_stale_entries_are_revalidated_with_validators(stand_in_server, cached_fetcher, monkeypatch):
+    stand_in_server.routes["/page"] = (200, "<p>one</p>", {"ETag": '"v1"', "Last-Modified": "Tue, 20 May 2025 10:00:00 GMT"})
+    seen_headers = []
+    original = stand_in_server.RequestHandlerClass.do_GET
+
+    def do_get(handler):
+        seen_headers.append(dict(handler.headers))
+        if handler.headers.get("If-None-Match") == '"v1"':
+            handler.send_response(304)
+            handler.send_header("Content-Length", "0")
+            handler.end_headers()
+            return
+        original(handler)
+
+    monkeypatch.setattr(stand_in_server.RequestHandlerClass, "do_GET", do_get)
+
+    with cached_fetcher(ttl=0) as fetcher:
+        fetcher.get_text(f"{stand_in_server.url}/page")
+        assert fetcher.get_text(f"{stand_in_server.url}/page") == "<p>one</p>"
+        stats = fetcher.cache_stats()
+
+    assert seen_headers[1]["If-None-Match"] == '"v1"'
+    assert seen_headers[1]["If-Modified-Since"] == "Tue, 20 May 2025 10:00:00 GMT"
+    assert stats["misses"] == 1 and stats["revalidated"] == 1
+
+
+@pytest.mark.unit
+def test_concurrent_misses_fetch_the_page_once(stand_in_server, cached_fetcher, monkeypatch):
+    stand_in_server.routes["/page"] = (200, "<p>one</p>", {})
+    original = stand_in_server.RequestHandlerClass.do_GET
+
+    def slow_get(handler):
+        time.sleep(0.3)
+        original(handler)
+
+    monkeypatch.setattr(stand_in_server.RequestHandlerClass, "do_GET", slow_get)
+    # Separate fetchers and cache connections, like worker processes sharing the cache file.
+    fetchers = [cached_fetcher() for _ in range(3)]
+    start = threading.Barrier(len(fetchers))
+
+    def fetch(fetcher):
+        start.wait()
+        return fetcher.get_text(f"{stand_in_server.url}/page")
+
+    with ThreadPoolExecutor(len(fetchers)) as pool:
+        bodies = list(pool.map(fetch, fetchers))
+    stats = [fetcher.cache_stats() for fetcher in fetchers]
+    for fetcher in fetchers:
+        fetcher.close()
+
+    assert bodies == ["<p>one</p>"] * 3
+    assert stand_in_server.requests == ["/page"]
+    assert sum(stat["misses"] for stat in stats) == 1
+    assert sum(stat["waits"] for stat in stats) == 2 and sum(stat["hits"] for stat in stats) == 2
+
+
+@pytest.mark.unit
+def test_fetch_claims_of_a_crashed_process_expire(tmp_path):
+    crashed = HttpCache(tmp_path / "http.sqlite", claim_ttl=0.1)
+    assert crashed.claim("https://site/a") is not None
+    cache = HttpCache(tmp_path / "http.sqlite")
+
+    assert cache.claim("https://site/a") is None
+    time.sleep(0.15)
+    claim = cache.claim("https://site/a")
+    assert claim is not None
+    cache.release(claim)
+    assert cache.claim("https://site/a") is not None
+    crashed.close()
+    cache.close()
+
+
+@pytest.mark.unit
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = HttpCache(tmp_path / "http.sqlite", max_bytes=250)
+    for name in ("a", "b", "c"):
+        if name == "c":
+            cache.get("https://site/a")
+        cache.put(f"https://site/{name}", 200, b"x" * 100, "text/html", None, None)
+        time.sleep(0.01)
+
+    assert cache.get("https://site/b") is None
+    assert cache.get("https://site/a") is not None and cache.get("https://site/c") is not None
+    assert cache.stats()["evictions"] == 1
+    cache.close()
+
+
+@pytest.mark.unit
+def test_recording_includes_pages_served_from_the_cache(stand_in_server, tmp_path):
+    stand_in_server.routes["/page"] = (200, "<p>one</p>", {})
+    cache = HttpCache(tmp_path / "http.sqlite", ttl=3600)
+    with HttpFetcher(max_retries=0, cache=cache) as warm:
+        warm.get_text(f"{stand_in_server.url}/page")
+
+    recorder = SnapshotStore(tmp_path / "snapshots")
+    cache = HttpCache(tmp_path / "http.sqlite", ttl=3600)
+    with HttpFetcher(max_retries=0, cache=cache, recorder=recorder) as recording:
+        recording.get_text(f"{stand_in_server.url}/page")
+
+    assert stand_in_server.requests == ["/page"]
+    assert recorder.get(f"{stand_in_server.url}/page").body == b"<p>one</p>"
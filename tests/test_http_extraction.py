@@ -0,0 +1,82 @@
+import copy
+
+import pytest
+
+from conftest import listing_html
+from scraper.html_backends import available_parsers
+from scraper.http_fetcher import HttpFetcher
+from scraper.models import RawProduct, StructuredProduct
+from scraper.product_list_extractor import ProductListExtractor
+
+CATEGORY_PATH = "/test-sites/e-commerce/more/computers/laptops"
+
+
+@pytest.fixture
+def http_config(config, stand_in_server):
+    cfg = copy.deepcopy(config)
+    cfg["base_url"] = stand_in_server.url
+    cfg["products"]["fetch_mode"] = "http"
+    cfg["http"] = {"pool_size": 3, "concurrency": 3, "max_retries": 0}
+    return cfg
+
+
+def serve_listing(server, pages: int, per_page: int = 6):
+    server.routes[CATEGORY_PATH] = (200, listing_html(range(per_page)), {})
+    for page in range(2, pages + 1):
+        indexes = range((page - 1) * per_page, page * per_page)
+        server.routes[f"{CATEGORY_PATH}?page={page}"] = (200, listing_html(indexes), {})
+
+
+@pytest.mark.unit
+def test_http_mode_pages_through_load_more_endpoint_in_order(http_config, stand_in_server):
+    serve_listing(stand_in_server, pages=8)
+
+    with HttpFetcher.from_config(http_config) as fetcher:
+        products = ProductListExtractor(None, http_config, "laptops", fetcher=fetcher).extract()
+
+    assert isinstance(products, list)
+    assert len(products) == 48
+    assert all(isinstance(p, StructuredProduct) for p in products)
+    assert [p.url.rsplit("/", 1)[1] for p in products] == [str(i) for i in range(48)]
+    assert products[0].rating == 2.0 and products[0].num_reviews == 7
+    # Keep-alive: every request reused one of at most `concurrency` pooled connections.
+    assert len(stand_in_server.clients) <= 3
+    assert len(stand_in_server.requests) > len(stand_in_server.clients)
+
+
+@pytest.mark.unit
+def test_http_mode_stops_on_repeated_page_and_streams(http_config, stand_in_server):
+    serve_listing(stand_in_server, pages=2)
+    stand_in_server.routes[f"{CATEGORY_PATH}?page=3"] = stand_in_server.routes[f"{CATEGORY_PATH}?page=2"]
+    http_config["global"]["structured_products_data"] = False
+    http_config["products"]["streaming"] = True
+
+    products = ProductListExtractor(None, http_config, "laptops").extract()
+
+    assert not isinstance(products, list)
+    products = list(products)
+    assert len(products) == 12
+    assert all(isinstance(p, RawProduct) for p in products)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("html_parser", available_parsers())
+def test_http_mode_dedupes_cards_with_every_html_parser(http_config, stand_in_server, html_parser):
+    serve_listing(stand_in_server, pages=3)
+    stand_in_server.routes[f"{CATEGORY_PATH}?page=3"] = (200, listing_html(range(4, 18)), {})  # overlaps page 2
+    http_config["products"]["html_parser"] = html_parser
+
+    products = ProductListExtractor(None, http_config, "laptops").extract()
+
+    assert [p.url.rsplit("/", 1)[1] for p in products] == [str(i) for i in range(18)]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("status, failed", [(404, False), (500, True)])
+def test_http_mode_flags_pagination_that_ended_on_an_error(http_config, stand_in_server, status, failed):
+    serve_listing(stand_in_server, pages=2)
+    stand_in_server.routes[f"{CATEGORY_PATH}?page=3"] = (status, "error", {})
+    extractor = ProductListExtractor(None, http_config, "laptops")
+
+    assert len(extractor.extract()) == 12
+    assert extractor.pagination_failed is failed
@@ -0,0 +1,59 @@
+import copy
+from pathlib import Path
+
+import pytest
+
+from conftest import listing_html
+from scraper.parallel_parser import card_shards, card_start_pattern
+from scraper.product_list_extractor import ProductListExtractor
+from scraper.saved_html import parse_saved_html
+
+
+@pytest.fixture
+def parallel_config(config):
+    config = copy.deepcopy(config)
+    config["products"]["parse_workers"] = 2
+    config["products"]["parse_shard_cards"] = 3
+    return config
+
+
+@pytest.mark.unit
+def test_card_shards_cut_in_front_of_cards():
+    html = listing_html(range(7)).replace("<body>", '<body><div class="thumbnail-strip"></div>')
+
+    shards = card_shards(html, ".thumbnail", 3)
+
+    assert "".join(shards) == html
+    assert [shard.count('class="thumbnail"') for shard in shards] == [3, 3, 1]
+    assert shards[1].startswith('<div class="thumbnail">')
+    assert card_shards(html, ".thumbnail", 7) is None
+    assert card_start_pattern("div.ratings p") is None
+
+
+@pytest.mark.unit
+def test_parallel_parse_matches_serial_order(config, parallel_config):
+    html = listing_html(range(10))
+
+    serial = ProductListExtractor(None, config, "laptops")._parse_products(html)
+    parallel = list(ProductListExtractor(None, parallel_config, "laptops")._parse_products(html))
+
+    assert [p.name for p in parallel] == [f"Lenovo V{i}" for i in range(10)]
+    exclude = {"last_scraped"}
+    assert [p.model_dump(exclude=exclude) for p in parallel] == [p.model_dump(exclude=exclude) for p in serial]
+
+
+@pytest.mark.unit
+def test_saved_pages_are_parsed_by_the_pool_in_input_order(parallel_config, tmp_path):
+    paths = []
+    for page in range(4):
+        path = tmp_path / f"page{page}.html"
+        path.write_text(listing_html(range(page * 10, page * 10 + 2)), encoding="utf-8")
+        paths.append(path)
+
+    summary = parse_saved_html(parallel_config, paths, "laptops", str(tmp_path / "out"), "csv")
+
+    assert summary["products"] == 8
+    assert [Path(result["output"]).name for result in summary["files"]] == [
+        f"page{page}_structured.csv" for page in range(4)
+    ]
+    assert "Lenovo V30" in (tmp_path / "out" / "page3_structured.csv").read_text(encoding="utf-8")
@@ -0,0 +1,29 @@
+import copy
+
+import pytest
+
+from conftest import detail_html, listing_html
+from scraper.models import StructuredProduct
+from scraper.product_detail_extractor import ProductDetailExtractor
+from scraper.product_list_extractor import ProductListExtractor
+
+
+@pytest.mark.unit
+def test_detail_stage_merges_real_rating_and_specs_in_order(config, stand_in_server):
+    cfg = copy.deepcopy(config)
+    cfg["base_url"] = stand_in_server.url
+    cfg["global"]["structured_products_data"] = False
+    cfg["detail"] = {"concurrency": 4, "specs": {"storage_options": ".swatches button"}}
+    for i in range(12):
+        if i != 5:
+            stand_in_server.routes[f"/test-sites/e-commerce/more/product/{i}"] = (200, detail_html(i, i % 5 + 1), {})
+    raws = ProductListExtractor(None, cfg, "laptops")._parse_products(listing_html(range(12)), structured=False)
+
+    products = ProductDetailExtractor(None, cfg, "laptops").extract(raws)
+
+    assert all(isinstance(p, StructuredProduct) for p in products)
+    assert [p.url for p in products] == [r.url for r in raws]
+    assert [p.rating for p in products] == [2.0 if i == 5 else float(i % 5 + 1) for i in range(12)]
+    assert products[0].specs == {"storage_options": "128, 256"}
+    assert products[5].specs is None
+    assert sorted(stand_in_server.requests) == sorted(f"/test-sites/e-commerce/more/product/{i}" for i in range(12))
@@ -0,0 +1,88 @@
+import copy
+import json
+from datetime import datetime
+
+import pytest
+
+from conftest import listing_html
+from scraper.models import RawProduct
+from scraper.product_converter import ProductConverter
+from scraper.product_store import ProductStore, conversion_settings
+from scraper.runner import run_categories
+
+CATEGORY_PATH = "/test-sites/e-commerce/more/computers/laptops"
+
+
+def raw(index, price=100.0):
+    return RawProduct(
+        name=f"Lenovo V{index}", price_usd=price, rating=4.0, num_reviews=7,
+        description_raw=f'Lenovo V{index}, 15.6", Core i3-6006U, 4GB, 128GB SSD, Windows 10 Home',
+        url=f"https://webscraper.io/product/{index}", last_scraped=datetime(2025, 5, 20)
+    )
+
+
+@pytest.mark.unit
+def test_sync_converts_only_new_and_changed_cards(tmp_path):
+    converter = ProductConverter({"USD": 1.0}, "USD")
+    converted = []
+
+    def convert(products):
+        converted.append([p.url.rsplit("/", 1)[1] for p in products])
+        return [converter.to_structured(p) for p in products]
+
+    with ProductStore(tmp_path / "products.sqlite") as store:
+        first = store.sync("laptops", [raw(0), raw(1), raw(2)], convert)
+        second = store.sync("laptops", [raw(3), raw(0), raw(1, price=90.0), raw(0)], convert)
+
+    assert len(first.new) == 3 and first.unchanged == 0
+    assert converted == [["0", "1", "2"], ["3", "1"]]
+    assert [p.name for p in second.new] == ["Lenovo V3"]
+    assert [(p.name, p.price) for p in second.changed] == [("Lenovo V1", 90.0)]
+    assert [p.name for p in second.removed] == ["Lenovo V2"]
+    assert second.unchanged == 1
+    assert [p.name for p in second.snapshot] == ["Lenovo V3", "Lenovo V0", "Lenovo V1"]
+    assert second.snapshot[1].ram_gb == 4 and second.snapshot[1].last_scraped > first.snapshot[0].last_scraped
+
+
+@pytest.mark.unit
+def test_run_writes_deltas_and_snapshot(config, stand_in_server, tmp_path):
+    cfg = copy.deepcopy(config)
+    cfg["base_url"] = stand_in_server.url
+    cfg["products"]["fetch_mode"] = "http"
+    cfg["store"] = {"enabled": True, "path": str(tmp_path / "products.sqlite")}
+    out = tmp_path / "out"
+
+    stand_in_server.routes[CATEGORY_PATH] = (200, listing_html(range(4)), {})
+    first = run_categories(cfg, ["laptops"], str(out), "json")
+    stand_in_server.routes[CATEGORY_PATH] = (200, listing_html(range(1, 5)), {})
+    second = run_categories(cfg, ["laptops"], str(out), "json")
+
+    def names(kind):
+        return [p["name"] for p in json.loads((out / f"laptops_{kind}.json").read_text(encoding="utf-8"))]
+
+    assert first["categories"][0]["delta"] == {"new": 4, "changed": 0, "removed": 0, "unchanged": 0}
+    assert second["categories"][0]["delta"] == {"new": 1, "changed": 0, "removed": 1, "unchanged": 3}
+    assert names("new") == ["Lenovo V4"]
+    assert names("removed") == ["Lenovo V0"]
+    assert names("structured") == ["Lenovo V1", "Lenovo V2", "Lenovo V3", "Lenovo V4"]
+    assert not (out / "laptops_changed.json").exists()
+
+
+@pytest.mark.unit
+def test_settings_change_reconverts_and_partial_listing_keeps_missing_products(tmp_path):
+    def convert_to(currency):
+        converter = ProductConverter({"USD": 1.0, "EUR": 0.5}, currency)
+        return lambda products: converter.to_structured_batch(products)
+
+    with ProductStore(tmp_path / "products.sqlite") as store:
+        store.sync("laptops", [raw(0), raw(1)], convert_to("USD"), conversion_settings(target_currency="USD"))
+        euros = store.sync("laptops", [raw(0), raw(1)], convert_to("EUR"), conversion_settings(target_currency="EUR"))
+        partial = store.sync(
+            "laptops", [raw(1)], convert_to("EUR"), conversion_settings(target_currency="EUR"), complete=False
+        )
+        complete = store.sync("laptops", [raw(1)], convert_to("EUR"), conversion_settings(target_currency="EUR"))
+
+    assert [(p.price, p.currency) for p in euros.changed] == [(50.0, "EUR"), (50.0, "EUR")]
+    assert euros.unchanged == 0
+    assert (partial.removed, partial.unchanged) == ([], 1)
+    assert [p.name for p in complete.removed] == ["Lenovo V0"]
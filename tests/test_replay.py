@@ -0,0 +1,65 @@
+import copy
+import json
+import time
+
+import pytest
+
+from conftest import listing_html
+from scraper.http_fetcher import HttpFetcher
+from scraper.product_list_extractor import ProductListExtractor
+from scraper.replay import ReplayServer, SnapshotStore
+from scraper.runner import run_categories
+
+CATEGORY_PATH = "/test-sites/e-commerce/more/computers/laptops"
+
+
+@pytest.fixture
+def replay_config(config, stand_in_server, tmp_path):
+    cfg = copy.deepcopy(config)
+    cfg["base_url"] = stand_in_server.url
+    cfg["products"]["fetch_mode"] = "http"
+    cfg["http"] = {"concurrency": 2, "max_retries": 0}
+    cfg["replay"] = {"mode": "record", "snapshot_dir": str(tmp_path / "snapshots")}
+    stand_in_server.routes[CATEGORY_PATH] = (200, listing_html(range(5)), {})
+    stand_in_server.routes[f"{CATEGORY_PATH}?page=2"] = (200, listing_html(range(5, 10)), {})
+    return cfg
+
+
+@pytest.mark.unit
+def test_recorded_run_replays_without_the_site(replay_config, stand_in_server, tmp_path):
+    with HttpFetcher.from_config(replay_config) as fetcher:
+        recorded = ProductListExtractor(None, replay_config, "laptops", fetcher=fetcher).extract()
+
+    store = SnapshotStore(replay_config["replay"]["snapshot_dir"])
+    assert store.get(f"{CATEGORY_PATH}?page=3").status == 404
+    stand_in_server.routes.clear()
+
+    replay_config["replay"].update(mode="replay", latency_ms=20, jitter_ms=5, seed=1)
+    summary = run_categories(replay_config, ["laptops"], str(tmp_path / "out"), "json")
+
+    replayed = json.loads((tmp_path / "out" / "laptops_structured.json").read_text(encoding="utf-8"))
+    assert summary["products"] == len(recorded) == 10
+    assert [p["name"] for p in replayed] == [p.name for p in recorded]
+    assert [p["url"].rsplit("/", 1)[1] for p in replayed] == [p.url.rsplit("/", 1)[1] for p in recorded]
+
+
+@pytest.mark.unit
+def test_replay_server_applies_latency_and_reports_misses(tmp_path):
+    store = SnapshotStore(tmp_path)
+    store.save("https://webscraper.io/page?x=1", 200, "Ünïcode".encode("utf-8"))
+
+    with ReplayServer(store, latency_ms=50) as server, HttpFetcher(max_retries=0) as fetcher:
+        start = time.perf_counter()
+        assert fetcher.get_text(f"{server.url}/page?x=1") == "Ünïcode"
+        assert time.perf_counter() - start >= 0.05
+        assert fetcher.session.get(f"{server.url}/missing").status_code == 404
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("mode", ["record", "replay"])
+def test_browser_fetch_mode_cannot_be_recorded_or_replayed(replay_config, tmp_path, mode):
+    replay_config["products"]["fetch_mode"] = "browser"
+    replay_config["replay"]["mode"] = mode
+
+    with pytest.raises(ValueError, match="fetch_mode 'http'"):
+        run_categories(replay_config, ["laptops"], str(tmp_path / "out"), "json")
@@ -0,0 +1,59 @@
+import copy
+
+import pytest
+
+from scraper.product_list_extractor import ProductListExtractor
+from scraper.utils import block_resources, blocked_url_patterns
+
+
+class FakeCdpDriver:
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params))
+        return {}
+
+
+@pytest.mark.unit
+def test_resource_types_expand_to_cdp_blocked_urls():
+    driver = FakeCdpDriver()
+    block_config = {"types": ["image", "font", "bogus"], "url_patterns": ["*google-analytics.com*", "*.png"]}
+
+    installed = block_resources(driver, block_config)
+
+    patterns = blocked_url_patterns(block_config)
+    assert installed == len(patterns)
+    assert "*.woff2" in patterns and "*google-analytics.com*" in patterns
+    assert patterns.count("*.png") == 1 and "*.png?*" in patterns  # a.png?v=3
+    assert "*.js*" not in blocked_url_patterns({"types": ["script"]})  # would block .json responses
+    assert driver.commands[:2] == [("Network.enable", {}), ("Network.setBlockedURLs", {"urls": patterns})]
+    assert driver.commands[2][0] == "Page.addScriptToEvaluateOnNewDocument"
+    assert "setResourceTimingBufferSize" in driver.commands[2][1]["source"]
+
+
+@pytest.mark.unit
+def test_drivers_without_cdp_are_left_unblocked():
+    class FirefoxLike:
+        def execute_cdp_cmd(self, cmd, params):
+            raise AttributeError("no CDP")
+
+    assert block_resources(FirefoxLike(), {"types": ["image"]}) == 0
+
+
+@pytest.mark.unit
+def test_page_weight_round_trip_only_runs_with_blocking_enabled(config):
+    class TimingDriver:
+        calls = 0
+
+        def execute_script(self, script):
+            self.calls += 1
+            return [12, 3400]
+
+    cfg = copy.deepcopy(config)
+    driver = TimingDriver()
+    assert ProductListExtractor(driver, cfg, "laptops")._page_weight() == {}
+    assert driver.calls == 0
+
+    cfg["browser"]["block_resources"] = {"enabled": True, "types": ["image"]}
+    assert ProductListExtractor(driver, cfg, "laptops")._page_weight() == {"resources": 12, "transfer_bytes": 3400}
@@ -0,0 +1,49 @@
+import copy
+import json
+
+import pytest
+
+from conftest import listing_html
+from scraper import driver_pool
+from scraper.driver_pool import RecyclingDriver
+from scraper.runner import run_categories
+
+
+@pytest.mark.unit
+def test_run_categories_spreads_categories_over_worker_processes(config, stand_in_server, tmp_path):
+    cfg = copy.deepcopy(config)
+    cfg["base_url"] = stand_in_server.url
+    cfg["products"]["fetch_mode"] = "http"
+    for category in ("laptops", "tablets", "phones"):
+        stand_in_server.routes[f"/test-sites/e-commerce/more/computers/{category}"] = (200, listing_html(range(4)), {})
+
+    summary = run_categories(cfg, ["laptops", "tablets", "phones", "missing"], str(tmp_path), "json", workers=2)
+
+    assert summary["workers"] == 2
+    assert summary["products"] == 12
+    assert summary["failed"] == ["missing"]
+    assert [r["category"] for r in summary["categories"]] == ["laptops", "tablets", "phones", "missing"]
+    assert len(json.loads((tmp_path / "tablets_structured.json").read_text(encoding="utf-8"))) == 4
+
+
+@pytest.mark.unit
+def test_recycling_driver_restarts_after_max_jobs_and_failures(monkeypatch):
+    created = []
+
+    class FakeDriver:
+        def quit(self):
+            self.closed = True
+
+    monkeypatch.setattr(driver_pool, "create_driver", lambda config: created.append(FakeDriver()) or created[-1])
+    browser = RecyclingDriver({}, max_jobs=2)
+
+    first = browser.acquire()
+    browser.release()
+    assert browser.acquire() is first
+    browser.release()
+    second = browser.acquire()
+    browser.release(failed=True)
+    third = browser.acquire()
+
+    assert len({id(first), id(second), id(third)}) == 3
+    assert first.closed and second.closed
@@ -0,0 +1,58 @@
+import gzip
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from conftest import listing_html
+from scraper.saved_html import html_inputs, parse_saved_html
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def pages(tmp_path):
+    archive = tmp_path / "pages"
+    (archive / "old").mkdir(parents=True)
+    (archive / "laptops.html").write_text(listing_html(range(3)), encoding="utf-8")
+    with gzip.open(archive / "tablets.html.gz", "wt", encoding="utf-8") as f:
+        f.write(listing_html(range(3, 5)))
+    (archive / "old" / "laptops.htm").write_text(listing_html(range(5, 6)), encoding="utf-8")
+    (archive / "notes.txt").write_text("not a page", encoding="utf-8")
+    return archive
+
+
+@pytest.mark.unit
+def test_html_inputs_expands_files_directories_and_globs(pages):
+    paths = html_inputs([str(pages / "old" / "laptops.htm"), str(pages), str(pages / "**" / "*.htm*")])
+
+    assert [p.relative_to(pages).as_posix() for p in paths] == ["old/laptops.htm", "laptops.html", "tablets.html.gz"]
+
+
+@pytest.mark.unit
+def test_parse_saved_html_writes_one_output_per_page(config, pages, tmp_path):
+    paths = html_inputs([str(pages), str(pages / "old")])
+
+    summary = parse_saved_html(config, paths, "laptops", str(tmp_path / "out"), "jsonl")
+
+    assert summary["products"] == 6 and summary["failed"] == []
+    outputs = [Path(result["output"]).name for result in summary["files"]]
+    assert outputs == ["laptops_structured.jsonl", "tablets_structured.jsonl", "laptops_2_structured.jsonl"]
+    lines = (tmp_path / "out" / "tablets_structured.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["Lenovo V3", "Lenovo V4"]
+
+
+@pytest.mark.unit
+def test_from_html_run_never_imports_selenium(pages, tmp_path):
+    script = (
+        "import runpy, sys\n"
+        f"sys.argv = ['run.py', '--from-html', {str(pages)!r}, '--output', {str(tmp_path / 'out')!r}]\n"
+        "runpy.run_path('run.py', run_name='__main__')\n"
+        "print(sorted(m for m in ('selenium', 'requests', 'scraper.runner') if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+    assert json.loads((tmp_path / "out" / "summary.json").read_text(encoding="utf-8"))["products"] == 5
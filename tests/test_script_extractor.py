@@ -0,0 +1,72 @@
+import copy
+import json
+
+import pytest
+from bs4 import BeautifulSoup
+
+from conftest import card_html, listing_html
+from scraper.enums import DomPruning
+from scraper.product_list_extractor import ProductListExtractor
+from scraper.script_extractor import ROW_FIELDS
+
+
+class ScriptDom:
+    """
+    Driver stand-in that answers the extraction script the way the browser does: every text node stripped
+    and concatenated, the number of rating matches and the raw href, as a JSON string of rows.
+    """
+
+    def __init__(self, html: str):
+        self.html = html
+        self.calls = []
+
+    def execute_script(self, script, selectors, start, pruning):
+        self.calls.append((sorted(selectors), start, pruning))
+        soup = BeautifulSoup(self.html, "html.parser")
+
+        def text(card, key):
+            element = card.select_one(selectors[key])
+            return "".join(part.strip() for part in element.find_all(string=True)) if element else None
+
+        rows = []
+        for card in soup.select(selectors["product_card"])[start:]:
+            link = card.select_one(selectors["product_link"])
+            rows.append([
+                text(card, "name"), text(card, "price"), len(card.select(selectors["rating"])),
+                text(card, "reviews"), text(card, "description"), link.get("href") if link else None,
+            ])
+        return json.dumps(rows)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("structured", [True, False])
+def test_script_rows_parse_to_the_same_products_as_page_source(config, structured):
+    cfg = copy.deepcopy(config)
+    cards = [card_html(i) for i in range(5)]
+    cards[2] = cards[2].replace('class="title">Lenovo V2<', 'class="title">\n  Lenovo <b>V2</b> \n<')
+    cards[3] = cards[3].replace('<h4 class="price">', '<h4 class="missing">')  # fails to parse on both paths
+    html = "<html><body>" + "".join(cards) + "</body></html>"
+    dom = ScriptDom(html)
+    extractor = ProductListExtractor(dom, cfg, "laptops")
+
+    rows = extractor._script_extractor().extract()
+    from_script = extractor._parse_rows(rows, structured)
+    from_page_source = extractor._parse_products(html, structured)
+
+    assert dom.calls == [(sorted(("product_card",) + ROW_FIELDS), 0, DomPruning.OFF.value)]
+    assert len(from_script) == 4
+    def dumped(products):
+        return [p.model_dump(exclude={"last_scraped"}) for p in products]
+
+    assert dumped(from_script) == dumped(from_page_source)
+
+
+@pytest.mark.unit
+def test_script_harvest_continues_after_the_harvested_cards(config):
+    dom = ScriptDom(listing_html(range(3)))
+    harvester = ProductListExtractor(dom, copy.deepcopy(config), "laptops")._script_extractor()
+
+    assert [row[0] for row in harvester.harvest()] == ["Lenovo V0", "Lenovo V1", "Lenovo V2"]
+    dom.html = listing_html(range(5))
+    assert [row[0] for row in harvester.harvest()] == ["Lenovo V3", "Lenovo V4"]
+    assert [call[1] for call in dom.calls] == [0, 3]
@@ -0,0 +1,65 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from scraper.script_paginator import ScriptPaginator
+
+
+class FakeDriver:
+    """Records script timeouts and answers the in-browser loop with `result` (or raises it)."""
+
+    def __init__(self, result):
+        self.result = result
+        self.timeouts = SimpleNamespace(script=30)
+        self.timeout_during_script = None
+
+    def set_script_timeout(self, seconds):
+        self.timeouts.script = seconds
+
+    def execute_async_script(self, script, options):
+        self.timeout_during_script = self.timeouts.script
+        self.options = options
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def paginator(driver, **kwargs):
+    logger = logging.LoggerAdapter(logging.getLogger("test"), {"event": "test"})
+    selectors = {"product_card": ".thumbnail", "load_more": "ecomerce-items-scroll-more"}
+    return ScriptPaginator(driver, logger, selectors.get, script_timeout=600, **kwargs)
+
+
+@pytest.mark.unit
+def test_clicks_are_reported_and_the_script_timeout_restored():
+    driver = FakeDriver({"count": 30, "clicks": 2, "idle_clicks": 1, "reason": "button_gone", "elapsed_ms": 120})
+    pages = paginator(driver, max_idle_clicks=4, button_wait_time=2)
+
+    assert list(pages.iter_clicks()) == [2]
+    assert not pages.failed
+    assert (driver.timeout_during_script, driver.timeouts.script) == (600, 30)
+    assert driver.options["max_idle"] == 4 and driver.options["button_wait_ms"] == 2000
+    assert pages.trace.to_dict()["items"] == 30
+
+
+@pytest.mark.unit
+def test_timeout_fails_pagination_and_restores_the_script_timeout():
+    driver = FakeDriver(TimeoutException("script timeout"))
+    pages = paginator(driver)
+
+    assert pages.scroll_until_done() == {}
+    assert pages.failed
+    assert list(pages.iter_clicks()) == []
+    assert driver.timeouts.script == 30
+
+
+@pytest.mark.unit
+def test_script_error_fails_pagination_but_keeps_its_clicks():
+    driver = FakeDriver({"count": 12, "clicks": 1, "idle_clicks": 0, "reason": "failure", "error": "TypeError: x"})
+    pages = paginator(driver)
+
+    assert list(pages.iter_clicks()) == [1]
+    assert pages.failed
+    assert driver.timeouts.script == 30
@@ -0,0 +1,86 @@
+import copy
+
+import pytest
+
+from conftest import card_html
+from scraper.models import StructuredProduct
+from scraper.product_list_extractor import ProductListExtractor
+
+
+class LoadMoreDom:
+    """Driver stand-in whose 'Load More' appends `per_click` cards; serves CardHarvester's slice script."""
+
+    def __init__(self, cards: int, per_click: int, late: int = 0):
+        self.cards = [card_html(i) for i in range(cards)]
+        self.per_click = per_click
+        self.loaded = per_click
+        self.late = late  # cards that render only after the last click
+        self.clicks = 0
+
+    def get(self, url):
+        pass
+
+    def execute_script(self, script, *args):
+        if not args:
+            return [0, 0]
+        return self.cards[args[1]:self.loaded]
+
+    @property
+    def page_source(self) -> str:
+        return f"<html><body>{''.join(self.cards[:self.loaded])}</body></html>"
+
+
+class LoadMorePaginator:
+    def __init__(self, dom: LoadMoreDom):
+        self.dom, self.failed = dom, False
+
+    def iter_clicks(self):
+        dom = self.dom
+        while dom.loaded < len(dom.cards) - dom.late:
+            dom.clicks += 1
+            dom.loaded = min(dom.loaded + dom.per_click, len(dom.cards) - dom.late)
+            yield dom.clicks
+        dom.loaded = len(dom.cards)
+
+    def scroll_until_done(self):
+        for _ in self.iter_clicks():
+            pass
+
+
+@pytest.mark.unit
+def test_streaming_yields_the_new_cards_of_every_click_once(config):
+    cfg = copy.deepcopy(config)
+    cfg["products"]["streaming"] = True
+    dom = LoadMoreDom(cards=20, per_click=6, late=2)
+    extractor = ProductListExtractor(dom, cfg, "laptops")
+    extractor._paginator = lambda trace=None: LoadMorePaginator(dom)
+
+    products, clicks_at = [], []
+    for product in extractor.extract():
+        clicks_at.append(dom.clicks)
+        products.append(product)
+
+    names = [p.name for p in products]
+    assert all(isinstance(p, StructuredProduct) for p in products)
+    assert names == [f"Lenovo V{i}" for i in range(20)]  # no duplicates, no missed or late-rendered card
+    # The first page is parsed before any click, and every click's cards before the next click.
+    assert clicks_at == [0] * 6 + [1] * 6 + [2] * 6 + [2] * 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("streaming", [False, True])
+def test_only_streaming_extraction_keeps_the_product_list_out_of_memory(config, streaming):
+    # Without products.streaming, browser mode parses one final page_source into a list, so the stream writers
+    # start only after the whole listing is in memory; flat peak memory needs streaming (or fetch_mode http).
+    cfg = copy.deepcopy(config)
+    cfg["products"]["streaming"] = streaming
+    dom = LoadMoreDom(cards=12, per_click=4)
+    extractor = ProductListExtractor(dom, cfg, "laptops")
+    extractor._paginator = lambda trace=None: LoadMorePaginator(dom)
+
+    products = extractor.extract()
+
+    assert isinstance(products, list) is not streaming
+    first = next(iter(products))
+    assert first.name == "Lenovo V0"
+    assert dom.clicks == (0 if streaming else 2)  # clicks made before the first product was available
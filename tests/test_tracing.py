@@ -0,0 +1,90 @@
+import copy
+import json
+import logging
+
+import pytest
+
+from conftest import listing_html
+from scraper.enums import ClickStatus
+from scraper.paginator import Paginator
+from scraper.runner import run_categories
+from scraper.tracing import Span, prometheus_text
+
+
+class FakeExecutor:
+    """ClickExecutor stand-in that loads two more pages, then reports the button gone."""
+
+    def __init__(self):
+        self.count = 6
+        self.last_wait = 0.0
+
+    def get_count(self, selector_name):
+        return self.count
+
+    def try_click_and_wait(self, button_name, wait_condition):
+        if self.count >= 18:
+            return ClickStatus.BUTTON_HIDDEN
+        self.count += 6
+        self.last_wait = 0.25
+        return ClickStatus.SUCCESS
+
+    def is_button_present_and_visible(self, button_name):
+        return False
+
+
+@pytest.mark.unit
+def test_paginator_records_one_span_per_click_with_wait():
+    trace = Span("paginate")
+    clicks = list(Paginator(logger=logging.getLogger("test"), executor=FakeExecutor(), trace=trace).iter_clicks())
+
+    spans = trace.to_dict()
+    assert clicks == [1, 2]
+    assert [c["status"] for c in spans["children"]] == ["clicked_and_loaded", "clicked_and_loaded", "button_hidden"]
+    assert [c["items_before"] for c in spans["children"]] == [6, 12, 18]
+    assert spans["children"][0]["wait_seconds"] == 0.25
+    assert spans["clicks"] == 2
+
+
+@pytest.mark.unit
+def test_prometheus_text_sums_spans_per_path():
+    trace = Span("scrape", category="laptops")
+    with trace.span("paginate") as paginate:
+        for _ in range(3):
+            with paginate.span("click", wait_seconds=0.5):
+                pass
+    trace.child("parse").add(1.5, items=10, products=9)
+
+    text = prometheus_text([trace.to_dict()])
+
+    assert 'scraper_span_calls{category="laptops",span="scrape/paginate/click"} 3' in text
+    assert 'scraper_span_wait_seconds{category="laptops",span="scrape/paginate/click"} 1.5' in text
+    assert 'scraper_span_products{category="laptops",span="scrape/parse"} 9' in text
+    assert "# TYPE scraper_span_seconds gauge" in text and "_total" not in text
+
+
+@pytest.mark.unit
+def test_prometheus_text_escapes_label_values():
+    text = prometheus_text([Span("scrape", category='say "hi"\\n\nnow').to_dict()])
+
+    assert 'scraper_span_calls{category="say \\"hi\\"\\\\n\\nnow",span="scrape"} 0' in text
+
+
+@pytest.mark.unit
+def test_run_exports_trace_json_and_prometheus_textfile(config, stand_in_server, tmp_path):
+    cfg = copy.deepcopy(config)
+    cfg["base_url"] = stand_in_server.url
+    cfg["products"]["fetch_mode"] = "http"
+    stand_in_server.routes["/test-sites/e-commerce/more/computers/laptops"] = (200, listing_html(range(4)), {})
+
+    summary = run_categories(cfg, ["laptops"], str(tmp_path), "csv")
+
+    assert "trace" not in summary["categories"][0]
+    trace = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))["traces"][0]
+    extract = next(c for c in trace["children"] if c["name"] == "extract")
+    phases = {c["name"]: c for c in extract["children"]}
+    assert phases["fetch"]["pages"] >= 1 and phases["fetch"]["bytes"] > 0
+    assert phases["parse"]["products"] == 4 and phases["convert"]["products"] == 4
+    write = next(c for c in trace["children"] if c["name"] == "write")
+    assert write["records"] == 4 and write["bytes"] > 0
+    assert 'span="scrape/write"' in (tmp_path / "metrics.prom").read_text(encoding="utf-8")
+    assert summary["metrics_file"].endswith("metrics.prom")
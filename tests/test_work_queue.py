@@ -0,0 +1,90 @@
+import copy
+import json
+import os
+import socket
+
+import pytest
+
+from conftest import detail_html, listing_html
+from scraper.distributed import open_queue, run_coordinator
+from scraper.enums import JobKind, JobStatus
+from scraper.work_queue import WorkQueue
+
+
+@pytest.mark.unit
+def test_expired_lease_is_retried_and_the_stale_worker_cannot_complete(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite", max_attempts=2)
+    queue.enqueue(JobKind.LISTING, "laptops")
+    assert not queue.enqueue(JobKind.LISTING, "laptops")
+
+    first = queue.lease("a", lease_seconds=-1)  # the worker dies right away
+    second = queue.lease("b", lease_seconds=60)
+
+    assert (first.id, first.attempts) == (second.id, 1) and second.attempts == 2
+    assert not queue.complete(first, "a", {"count": 1})
+    assert queue.fail(second, "b", "browser crashed") == JobStatus.FAILED
+    assert queue.lease("c", lease_seconds=60) is None
+    [record] = queue.jobs("laptops")
+    assert (record.status, record.attempts, record.error) == (JobStatus.FAILED, 2, "browser crashed")
+
+
+@pytest.mark.unit
+def test_follow_ups_are_queued_with_the_result_and_leased_first(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite")
+    queue.enqueue(JobKind.LISTING, "laptops")
+    queue.enqueue(JobKind.LISTING, "tablets")
+
+    listing = queue.lease("a", lease_seconds=60)
+    follow_ups = [(JobKind.DETAIL, "laptops", part, {"part": part}) for part in range(2)]
+    assert queue.complete(listing, "a", {"count": 2}, follow_ups)
+
+    leased = [queue.lease("a", lease_seconds=60) for _ in range(3)]
+    assert [(job.kind, job.category, job.part) for job in leased] == [
+        (JobKind.DETAIL, "laptops", 0), (JobKind.DETAIL, "laptops", 1), (JobKind.LISTING, "tablets", 0)
+    ]
+    assert queue.unfinished() == {"laptops": 2, "tablets": 1}
+    assert queue.counts() == {"queued": 0, "leased": 3, "done": 1, "failed": 0}
+
+
+@pytest.mark.unit
+def test_coordinator_merges_listing_and_detail_jobs_of_local_workers(config, stand_in_server, tmp_path):
+    cfg = copy.deepcopy(config)
+    cfg["base_url"] = stand_in_server.url
+    cfg["products"]["fetch_mode"] = "http"
+    cfg["detail"] = {"enabled": True, "concurrency": 2}
+    cfg["queue"] = {"path": str(tmp_path / "queue.sqlite"), "max_attempts": 2, "detail_chunk": 3, "poll_seconds": 0.05}
+    for category in ("laptops", "tablets"):
+        stand_in_server.routes[f"/test-sites/e-commerce/more/computers/{category}"] = (200, listing_html(range(8)), {})
+    for i in range(8):
+        stand_in_server.routes[f"/test-sites/e-commerce/more/product/{i}"] = (200, detail_html(i, i % 5 + 1), {})
+
+    summary = run_coordinator(cfg, ["laptops", "tablets", "missing"], str(tmp_path), "json", workers=2)
+
+    assert summary["products"] == 16
+    assert summary["failed"] == ["missing"]
+    assert summary["jobs"] == {"queued": 0, "leased": 0, "done": 8, "failed": 1}
+    laptops = summary["categories"][0]
+    assert (laptops["status"], laptops["jobs"], laptops["products"]) == ("ok", 4, 8)
+    products = json.loads((tmp_path / "tablets_structured.json").read_text(encoding="utf-8"))
+    assert [p["name"] for p in products] == [f"Lenovo V{i}" for i in range(8)]
+    assert [p["rating"] for p in products] == [float(i % 5 + 1) for i in range(8)]
+
+
+def die_holding_a_lease(config, worker=None):
+    with open_queue(config) as queue:
+        queue.lease(f"{socket.gethostname()}:{os.getpid()}", lease_seconds=300)
+    os._exit(1)  # e.g. the browser failed to start
+
+
+@pytest.mark.unit
+def test_coordinator_ends_the_run_when_every_local_worker_died(config, tmp_path, monkeypatch):
+    monkeypatch.setattr("scraper.distributed.run_worker", die_holding_a_lease)
+    cfg = copy.deepcopy(config)
+    cfg["queue"] = {"path": str(tmp_path / "queue.sqlite"), "max_attempts": 1, "poll_seconds": 0.05}
+
+    summary = run_coordinator(cfg, ["laptops", "tablets"], str(tmp_path), "json", workers=1)
+
+    assert summary["failed"] == ["laptops", "tablets"]
+    assert summary["jobs"] == {"queued": 1, "leased": 0, "done": 0, "failed": 1}
+    with WorkQueue(tmp_path / "queue.sqlite") as queue:
+        assert queue.jobs("laptops")[0].error == "worker exited with code 1"
@@ -0,0 +1,48 @@
+import csv
+import gzip
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from scraper.models import RawProduct
+from scraper.writers import output_path, write_stream
+
+
+def products(count):
+    for i in range(count):
+        yield RawProduct(
+            name=f"Lenovo V{i}", price_usd=f"${100 + i}.99", rating=5, num_reviews="3 reviews",
+            description_raw="Lenovo, 15.6\"", url=f"https://webscraper.io/product/{i}",
+            last_scraped=datetime(2025, 5, 20, tzinfo=timezone.utc)
+        )
+
+
+@pytest.mark.unit
+def test_json_stream_matches_json_dump(tmp_path):
+    path = tmp_path / "out.json"
+
+    assert write_stream(products(3), path, "json") == 3
+    expected = json.dumps([p.model_dump(mode="json") for p in products(3)], indent=2, ensure_ascii=False)
+    assert path.read_text(encoding="utf-8") == expected
+
+
+@pytest.mark.unit
+def test_gzip_jsonl_and_csv_streams(tmp_path):
+    jsonl = output_path(str(tmp_path), "laptops_raw", "jsonl", "gzip")
+    table = output_path(str(tmp_path), "laptops_raw", "csv")
+
+    assert jsonl.endswith("laptops_raw.jsonl.gz")
+    assert write_stream(products(1200), jsonl, "jsonl", "gzip", flush_every=100) == 1200
+    assert write_stream(products(4), table, "csv") == 4
+    with gzip.open(jsonl, "rt", encoding="utf-8") as f:
+        assert [json.loads(line)["name"] for line in f][-1] == "Lenovo V1199"
+    with open(table, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["price_usd"] for row in rows] == ["100.99", "101.99", "102.99", "103.99"]
+
+
+@pytest.mark.unit
+def test_empty_stream_creates_no_file(tmp_path):
+    assert write_stream(iter([]), tmp_path / "empty.json", "json") == 0
+    assert not (tmp_path / "empty.json").exists()